@@ -0,0 +1,135 @@
+"""스케일까지 끝난 이미지 픽셀을 디스크에 저장해 두는 캐시.
+
+목표 크기는 config.py 의 SCREEN_WIDTH 에 따라 고정이라, 한 번 smoothscale 한 결과를
+해상도별 폴더에 저장해 두면 다음 실행부터는 PNG 디코딩과 스케일 없이
+zlib 해제 + frombuffer 만으로 바로 Surface 를 만들 수 있음.
+헤더에 원본 파일의 (크기, 수정시각) 과 내용 해시를 같이 적어 둠. 평소에는 os.stat 만 비교하고,
+(크기, 수정시각) 이 다를 때만(체크아웃/복사로 시각만 바뀐 경우 등) 원본을 읽어 해시를 비교함.
+해시까지 다르면 원본이 바뀐 것이라 다시 만들고 덮어씀.
+
+    <프로젝트>/.cache/scaled_assets/1450x815/background_1450x815_a0s0_v2.bin
+"""
+import hashlib
+import os
+import struct
+import zlib
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+_HEADER = struct.Struct('<4sIIBQq16s')
+    # 매직, 가로, 세로, 알파 여부, 원본 크기, 원본 수정시각(ns), 원본 해시
+_MAGIC = b'BPS2'
+
+
+class ScaledAssetDiskCache:
+    def __init__(self, directory: str, resolution: Tuple[int, int],
+                 compress_level: int = 1) -> None:
+        """
+        Args:
+            directory: 캐시 최상위 폴더
+            resolution: 화면 해상도 (폴더를 나누는 기준)
+            compress_level: zlib 압축 레벨 (SD 카드 읽기 vs 해제 속도 균형, 1이 보통 제일 빠름)
+        """
+        self.directory = os.path.join(directory, f'{int(resolution[0])}x{int(resolution[1])}')
+        self.compress_level = compress_level
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def source_stamp(path: str) -> Tuple[int, int]:
+        """원본 파일 (크기, 수정시각 ns)."""
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    def source_hash(self, path: str) -> str:
+        """원본 파일 내용 해시. 같은 실행 안에서는 (경로, 크기, 수정시각) 로 다시 계산하지 않음."""
+        stamp = (path,) + self.source_stamp(path)
+        digest = self._hashes.get(stamp)
+        if digest is None:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()[:16]
+            self._hashes[stamp] = digest
+        return digest
+
+    def _prefix(self, key: str, size: Tuple[int, int], alpha: bool, smooth: bool) -> str:
+        return f'{key}_{size[0]}x{size[1]}_a{int(alpha)}s{int(smooth)}_'
+
+    def _file(self, key: str, size: Tuple[int, int], alpha: bool, smooth: bool) -> str:
+        return os.path.join(self.directory, self._prefix(key, size, alpha, smooth) + 'v2.bin')
+
+    def read(self, key: str, path: str, size: Tuple[int, int], alpha: bool,
+             smooth: bool) -> Optional[bytes]:
+        """저장된 픽셀 바이트 (압축 해제까지). 없거나 깨졌으면 None. display 없이 동작해서 워커 스레드에서 써도 됨."""
+        try:
+            with open(self._file(key, size, alpha, smooth), 'rb') as f:
+                data = f.read()
+            magic, w, h, has_alpha, src_size, src_mtime, digest = _HEADER.unpack_from(data)
+            if magic != _MAGIC or (w, h) != tuple(size) or bool(has_alpha) != alpha:
+                raise ValueError('header mismatch')
+            stamp = self.source_stamp(path)
+            if (src_size, src_mtime) != stamp:
+                # 시각/크기만 보고는 모르니 이때만 원본을 읽어 해시 비교
+                if digest.decode('ascii') != self.source_hash(path):
+                    return None
+                # 내용은 같으면 헤더의 (크기, 수정시각) 만 고쳐서 다음 실행부터 다시 해시하지 않게 함
+                with open(self._file(key, size, alpha, smooth), 'r+b') as f:
+                    f.write(_HEADER.pack(magic, w, h, has_alpha, stamp[0], stamp[1], digest))
+            return zlib.decompress(data[_HEADER.size:])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            print(f"스케일 캐시 읽기 실패: {key} - {e}")
+            return None
+
+    def to_surface(self, pixels: bytes, size: Tuple[int, int],
+                   alpha: bool) -> Optional[pygame.Surface]:
+        """read() 결과를 화면 포맷 Surface 로 변환 (display 가 있는 메인 스레드에서)."""
+        try:
+            surface = pygame.image.frombuffer(pixels, tuple(size), 'RGBA' if alpha else 'RGB')
+            return surface.convert_alpha() if alpha else surface.convert()
+        except (ValueError, pygame.error) as e:
+            print(f"스케일 캐시 변환 실패: {e}")
+            return None
+
+    def load(self, key: str, path: str, size: Tuple[int, int], alpha: bool,
+             smooth: bool, pixels: Optional[bytes] = None) -> Optional[pygame.Surface]:
+        """저장된 픽셀이 있으면 변환(convert/convert_alpha)까지 해서 반환, 없으면 None.
+
+        Args:
+            pixels: 미리 read() 해 둔 바이트가 있으면 파일을 다시 읽지 않음
+        """
+        if pixels is None:
+            pixels = self.read(key, path, size, alpha, smooth)
+        surface = self.to_surface(pixels, size, alpha) if pixels is not None else None
+        if surface is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return surface
+
+    def store(self, key: str, path: str, surface: pygame.Surface, alpha: bool,
+              smooth: bool) -> None:
+        size = surface.get_size()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            target = self._file(key, size, alpha, smooth)
+            pixels = pygame.image.tostring(surface, 'RGBA' if alpha else 'RGB')
+            src_size, src_mtime = self.source_stamp(path)
+            data = _HEADER.pack(_MAGIC, size[0], size[1], int(alpha), src_size, src_mtime,
+                                self.source_hash(path).encode('ascii'))
+            data += zlib.compress(pixels, self.compress_level)
+            # 쓰다 끊겨도 깨진 파일이 남지 않게 임시 파일에 쓰고 교체
+            tmp = target + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, target)
+
+            # 예전 형식(파일 이름에 해시)으로 만든 같은 키/크기 파일 정리
+            prefix = self._prefix(key, size, alpha, smooth)
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and os.path.join(self.directory, name) != target:
+                    os.remove(os.path.join(self.directory, name))
+        except (OSError, pygame.error) as e:
+            print(f"스케일 캐시 저장 실패: {key} - {e}")
@@ -0,0 +1,260 @@
+"""이미지 에셋을 한 곳에서 로드/공유하는 매니저.
+
+씬이 새로 만들어질 때마다 같은 PNG 를 다시 디코딩하고 다시 smoothscale 하지 않도록
+ASSET_PATHS 키 + 목표 크기 기준으로 변환(convert/convert_alpha)까지 끝난 Surface 를
+프로세스가 끝날 때까지 들고 있음. 실제 로드는 처음 요청될 때 함 (display 생성 이후).
+크기를 지정해 요청한 이미지는 (원본이 이미 그 크기여도) disk_cache 에 저장해 두고 다음 실행부터 원본 디코딩 없이 읽음.
+
+    from asset_manager import assets
+    bg = assets.image('background', (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    print(assets.stats())
+"""
+import io
+import os
+import struct
+import threading
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from asset_disk_cache import ScaledAssetDiskCache
+from asset_paths import ASSET_PATHS
+from sprite_atlas import SpriteAtlas
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+from game_settings import ASSET_DISK_CACHE_DIR, ASSET_DISK_CACHE_ENABLED
+from sprite_cache import surface_bytes
+
+Size = Tuple[int, int]
+# 아틀라스 항목: 영역 이름 -> (ASSET_PATHS 키, 크기, alpha, smooth)
+AtlasEntries = Dict[str, Tuple[str, Optional[Size], bool, bool]]
+
+
+def _owned(surfaces) -> list:
+    """실제로 픽셀을 가진 Surface 만 (아틀라스 subsurface 는 부모와 공유하므로 제외)."""
+    return [s for s in surfaces if s is not None and s.get_parent() is None]
+
+
+class AssetManager:
+    def __init__(self, paths: Optional[Dict[str, object]] = None,
+                 disk_cache: Optional[ScaledAssetDiskCache] = None) -> None:
+        self.paths = paths if paths is not None else ASSET_PATHS
+        self.disk_cache = disk_cache
+        self._sources: Dict[str, Optional[pygame.Surface]] = {}
+            # 디코딩한 원본 (크기 변형을 또 만들 때 재사용)
+        self._images: Dict[tuple, Optional[pygame.Surface]] = {}
+            # (키, 크기, alpha, smooth) -> 변환/스케일 끝난 Surface. 실패도 None 으로 기억
+        self._atlases: Dict[str, SpriteAtlas] = {}
+        self._prefetched: Dict[tuple, bytes] = {}
+            # 워커 스레드가 미리 읽어 둔 디스크 캐시 픽셀 (image() 에서 변환만 하면 됨)
+        self._sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+        self._sound_bytes: Dict[str, bytes] = {}
+            # 워커 스레드가 미리 읽어 둔 효과음 파일 (Sound 는 sound() 가 메인 스레드에서 만듦)
+        self._lock = threading.RLock()
+            # 프리페치 워커와 메인 스레드가 같은 파일을 동시에 디코딩하지 않게
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> Optional[str]:
+        path = self.paths.get(key)
+        return path if isinstance(path, str) else None
+
+    def source_size(self, key: str) -> Optional[Size]:
+        """원본 이미지 크기. PNG 는 헤더만 읽고, 아니면 디코딩해서 확인."""
+        source = self._sources.get(key)
+        if source is not None:
+            return source.get_size()
+        path = self.path(key)
+        if path is not None and path.lower().endswith('.png'):
+            try:
+                with open(path, 'rb') as f:
+                    header = f.read(24)
+                if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+                    return struct.unpack('>II', header[16:24])
+            except OSError:
+                pass
+        source = self._source(key)
+        return source.get_size() if source is not None else None
+
+    def _source(self, key: str) -> Optional[pygame.Surface]:
+        with self._lock:
+            return self._load_source(key)
+
+    def _load_source(self, key: str) -> Optional[pygame.Surface]:
+        if key in self._sources:
+            return self._sources[key]
+        path = self.path(key)
+        source = None
+        if path is None or not os.path.exists(path):
+            print(f"이미지 파일 없음: {key} ({path})")
+        else:
+            try:
+                source = pygame.image.load(path)
+            except pygame.error as e:
+                print(f"이미지 로드 실패: {path} - {e}")
+        self._sources[key] = source
+        return source
+
+    @staticmethod
+    def _cache_key(key: str, size: Optional[Size], alpha: bool, smooth: bool) -> tuple:
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return key, size, alpha, smooth
+
+    def image(self, key: str, size: Optional[Size] = None, alpha: bool = True,
+              smooth: bool = True) -> Optional[pygame.Surface]:
+        """ASSET_PATHS[key] 이미지를 size 로 맞춰 반환. 로드 실패 시 None.
+
+        Args:
+            key: ASSET_PATHS 키
+            size: 목표 크기 (None 이면 원본 크기)
+            alpha: True 면 convert_alpha, False 면 convert
+            smooth: True 면 smoothscale, False 면 scale
+        """
+        cache_key = self._cache_key(key, size, alpha, smooth)
+        size = cache_key[1]
+        if cache_key in self._images:
+            self.hits += 1
+            return self._images[cache_key]
+
+        self.misses += 1
+        path = self.path(key)
+        use_disk = (self.disk_cache is not None and size is not None
+                    and path is not None and os.path.exists(path))
+        image = None
+        with self._lock:
+            # 쓰든 안 쓰든 여기서 버려서 워커 결과가 남아 쌓이지 않게 함
+            pixels = self._prefetched.pop(cache_key, None)
+        if use_disk:
+            image = self.disk_cache.load(key, path, size, alpha, smooth, pixels)
+        if image is None:
+            image = self._source(key)
+            if image is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+                if size is not None and image.get_size() != size:
+                    scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+                    image = scale(image, size)
+                # 이미 목표 크기인 원본도 저장 (다음 실행에서 PNG 디코딩을 건너뛰고 디스크 히트로 잡힘)
+                if use_disk:
+                    self.disk_cache.store(key, path, image, alpha, smooth)
+        self._images[cache_key] = image
+        return image
+
+    def prefetch(self, key: str, size: Optional[Size] = None, alpha: bool = True,
+                 smooth: bool = True) -> None:
+        """image() 에서 할 일 중 display 가 필요 없는 부분(파일 읽기, 디코딩)만 미리 해 둠.
+
+        디스크 캐시가 있으면 픽셀 바이트를, 없으면 원본 PNG 디코딩 결과를 들고 있다가
+        나중에 메인 스레드의 image() 가 변환/스케일만 함. 워커 스레드에서 호출해도 됨.
+        """
+        cache_key = self._cache_key(key, size, alpha, smooth)
+        if cache_key in self._images or cache_key in self._prefetched:
+            return
+        path = self.path(key)
+        if path is None or not os.path.exists(path):
+            return
+        if self.disk_cache is not None and cache_key[1] is not None:
+            pixels = self.disk_cache.read(key, path, cache_key[1], alpha, smooth)
+            if pixels is not None:
+                with self._lock:
+                    # 읽는 사이에 메인 스레드가 image() 로 이미 만들었으면 버림
+                    if cache_key not in self._images:
+                        self._prefetched[cache_key] = pixels
+                return
+        self._source(key)
+
+    def sound(self, path: str) -> Optional[pygame.mixer.Sound]:
+        """효과음 (경로별로 한 번만 로드). 로드 실패 시 None. 메인 스레드에서만 부름 (SDL_mixer)."""
+        with self._lock:
+            if path in self._sounds:
+                return self._sounds[path]
+            data = self._sound_bytes.pop(path, None)
+        try:
+            sound = pygame.mixer.Sound(file=io.BytesIO(data)) if data is not None else pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"효과음 로드 실패: {path} - {e}")
+            sound = None
+        with self._lock:
+            self._sounds[path] = sound
+        return sound
+
+    def prefetch_sound(self, path: str) -> None:
+        """효과음 파일 바이트만 미리 읽어 둠. 워커 스레드에서 호출해도 됨."""
+        with self._lock:
+            if path in self._sounds or path in self._sound_bytes:
+                return
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        with self._lock:
+            if path not in self._sounds:
+                self._sound_bytes[path] = data
+
+    def atlas(self, name: str, entries: AtlasEntries) -> SpriteAtlas:
+        """entries 이미지를 한 장으로 묶은 아틀라스 (이름별로 한 번만 만듦).
+
+        묶은 뒤에는 같은 키로 image() 를 요청해도 아틀라스 영역의 subsurface 를 돌려주므로
+        개별 Surface 를 따로 들고 있지 않음.
+        """
+        atlas = self._atlases.get(name)
+        if atlas is not None:
+            return atlas
+
+        atlas = SpriteAtlas()
+        for region, (key, size, alpha, smooth) in entries.items():
+            image = self.image(key, size, alpha, smooth)
+            if image is not None:
+                atlas.add(region, image)
+        atlas.build()
+        for region, (key, size, alpha, smooth) in entries.items():
+            if region in atlas:
+                self._images[self._cache_key(key, size, alpha, smooth)] = atlas.subsurface(region)
+        self._atlases[name] = atlas
+        return atlas
+
+    def memory_bytes(self) -> int:
+        surfaces = _owned(self._sources.values()) + _owned(self._images.values())
+        surfaces += [a.surface for a in self._atlases.values() if a.surface is not None]
+        return sum(surface_bytes(s) for s in surfaces)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 상태 (개수, 메모리 사용량, 적중 수)."""
+        atlases = [a.surface for a in self._atlases.values() if a.surface is not None]
+        return {
+            'sources': len(_owned(self._sources.values())),
+            'images': len(_owned(self._images.values())),
+            'atlases': len(atlases),
+            'atlas_regions': sum(len(a.regions) for a in self._atlases.values()),
+            'source_bytes': sum(surface_bytes(s) for s in _owned(self._sources.values())),
+            'image_bytes': sum(surface_bytes(s) for s in _owned(self._images.values())),
+            'atlas_bytes': sum(surface_bytes(s) for s in atlases),
+            'bytes': self.memory_bytes(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_cache.hits if self.disk_cache else 0,
+            'disk_misses': self.disk_cache.misses if self.disk_cache else 0,
+        }
+
+    def release_sources(self) -> None:
+        """디코딩한 원본을 버림 (이미 만든 크기 변형은 유지). 새 크기를 요청하면 다시 디코딩함."""
+        self._sources.clear()
+
+    def clear(self) -> None:
+        self._sources.clear()
+        self._images.clear()
+        self._atlases.clear()
+        self._prefetched.clear()
+        self._sounds.clear()
+        self._sound_bytes.clear()
+
+
+# 캐시 폴더는 실행 위치와 상관없이 프로젝트 루트 기준
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모든 씬이 같이 쓰는 인스턴스
+assets = AssetManager(
+    disk_cache=ScaledAssetDiskCache(os.path.join(_PROJECT_ROOT, ASSET_DISK_CACHE_DIR),
+                                    (SCREEN_WIDTH, SCREEN_HEIGHT))
+    if ASSET_DISK_CACHE_ENABLED else None
+)
@@ -14,6 +14,10 @@ ASSET_PATHS = {
     'item_swap': 'assets/images/item_swap.png',
     'item_raise': 'assets/images/item_raise.png',
     'item_rainbow': 'assets/images/item_rainbow.png',
+    'menu_background': 'assets/images/menu_background.png',
+    'menu_start': 'assets/images/menu_start.png',
+    'menu_map_editor': 'assets/images/menu_map_editor.png',
+    'menu_exit': 'assets/images/menu_exit.png',
     'font': None,
     'bgm': 'assets/sounds/main_theme_01.wav',
     'pop_sounds': [
@@ -35,6 +39,7 @@ ASSET_PATHS = {
     # 'logo': 게임 로고 이미지
     # 'map_editor_logo': 맵 에디터 로고 이미지
     # 'cannon_arrow': 십자형 화살표 이미지
+    # 'menu_background', 'menu_start', 'menu_map_editor', 'menu_exit': 메뉴 배경/버튼 이미지
     # 'font': None으로 설정 시 기본 폰트 사용, 필요 시 'assets/pixel_font.ttf' 등으로 변경 가능
     # 'bgm': 배경 음악 파일
     # 'pop_sounds': 버블 터질 때 재생할 효과음 리스트
@@ -0,0 +1,145 @@
+"""비트보드 기반 HexGrid.
+
+색깔마다 정수 비트마스크 하나, 장애물('N')용 마스크 하나를 유지하고
+DFS/플러드필/매달린 버블 검사를 시프트+마스크 연산으로 처리함.
+map/bubble_list 는 그대로 같이 갱신하므로 기존 HexGrid API는 전부 그대로 동작함.
+
+비트 인덱스는 r*(cols+1)+c. 각 행 끝에 빈 가드 열을 하나 둬서
+좌우 시프트가 다음 행으로 넘어가지 않게 함.
+"""
+from typing import Dict,Iterator,List,Set,Tuple
+
+from color_settings import COLORS
+from board import Bubble,HexGrid
+from connectivity import FullScanTracker
+
+class BitboardHexGrid(HexGrid):
+    # 마스크 플러드 한 번이 증분 탐색보다 싸서 매번 전체 검사함. frontier 는 모으지 않음
+    connectivity_cls=FullScanTracker
+
+    def __init__(self,rows:int,cols:int,cell_size:int,wall_offset:int=0,
+                 x_offset:int=0,y_offset:int=0)->None:
+        super().__init__(rows,cols,cell_size,wall_offset,x_offset,y_offset)
+        self.stride:int=cols+1
+            # 가드 열 포함 한 행의 비트 수
+        row_bits=(1<<cols)-1
+        self.valid_mask:int=0
+        self.even_mask:int=0
+        self.odd_mask:int=0
+        for r in range(rows):
+            bits=row_bits<<(r*self.stride)
+            self.valid_mask|=bits
+            if r%2==0:
+                self.even_mask|=bits
+            else:
+                self.odd_mask|=bits
+        self.top_mask:int=row_bits
+            # 0번 행 (천장)
+        self.color_masks:Dict[str,int]={color:0 for color in COLORS}
+        self.obstacle_mask:int=0
+
+    # ======== 비트 <-> 셀 ========
+    def bit(self,r:int,c:int)->int:
+        return 1<<(r*self.stride+c)
+
+    def iter_cells(self,mask:int)->Iterator[Tuple[int,int]]:
+        while mask:
+            low=mask&-mask
+            yield divmod(low.bit_length()-1,self.stride)
+            mask^=low
+
+    def cells_to_mask(self,cells)->int:
+        mask=0
+        for r,c in cells:
+            if self.is_in_bounds(r,c):
+                mask|=self.bit(r,c)
+        return mask
+
+    @property
+    def bubble_mask(self)->int:
+        mask=0
+        for color_mask in self.color_masks.values():
+            mask|=color_mask
+        return mask
+
+    # ======== 마스크 동기화 ========
+    def _rebuild_masks(self)->None:
+        self.color_masks={color:0 for color in COLORS}
+        self.obstacle_mask=0
+        for r in range(min(self.rows,len(self.map))):
+            for c in range(min(self.cols,len(self.map[r]))):
+                self._set_mask_cell(r,c,self.map[r][c])
+
+    def _set_mask_cell(self,r:int,c:int,ch:str)->None:
+        b=self.bit(r,c)
+        for color in self.color_masks:
+            self.color_masks[color]&=~b
+        self.obstacle_mask&=~b
+        if ch in self.color_masks:
+            self.color_masks[ch]|=b
+        elif ch=='N':
+            self.obstacle_mask|=b
+
+    def load_from_stage(self,stage_map:List[List[str]])->None:
+        super().load_from_stage(stage_map)
+        self._rebuild_masks()
+
+    def place_bubble(self,bubble:Bubble,r:int,c:int)->None:
+        super().place_bubble(bubble,r,c)
+        # '/' 보정으로 열이 바뀔 수 있어서 실제 붙은 위치 기준으로 갱신
+        r,c=bubble.row_idx,bubble.col_idx
+        if bubble.is_attached and self.is_in_bounds(r,c):
+            self._set_mask_cell(r,c,self.map[r][c])
+
+    def remove_cells(self,cells:Set[Tuple[int,int]])->None:
+        super().remove_cells(cells)
+        clear=~self.cells_to_mask(cells)
+        for color in self.color_masks:
+            self.color_masks[color]&=clear
+        self.obstacle_mask&=clear
+
+    # ======== 시프트 연산 ========
+    def dilate(self,mask:int)->int:
+        """mask 의 모든 셀을 6방향 이웃으로 한 칸 확장 (자기 자신 제외)."""
+        w=self.stride
+        even=mask&self.even_mask
+        odd=mask&self.odd_mask
+        out=(mask<<1)|(mask>>1)
+        # 짝수 행: 위 (r-1,c-1),(r-1,c) / 아래 (r+1,c-1),(r+1,c)
+        out|=(even>>w)|(even>>(w+1))|(even<<w)|(even<<(w-1))
+        # 홀수 행: 위 (r-1,c),(r-1,c+1) / 아래 (r+1,c),(r+1,c+1)
+        out|=(odd>>w)|(odd>>(w-1))|(odd<<w)|(odd<<(w+1))
+        return out&self.valid_mask
+
+    def flood(self,seed:int,allowed:int)->int:
+        """seed 에서 allowed 셀만 타고 퍼질 수 있는 영역."""
+        reach=seed&allowed
+        frontier=reach
+        while frontier:
+            frontier=self.dilate(frontier)&allowed&~reach
+            reach|=frontier
+        return reach
+
+    # ======== HexGrid API ========
+    def dfs_same_color(self,row:int,col:int,color:str,visited:Set[Tuple[int,int]])->None:
+        if not self.is_in_bounds(row,col) or color not in self.color_masks:
+            super().dfs_same_color(row,col,color,visited)
+            return
+        allowed=self.color_masks[color]&~self.cells_to_mask(visited)
+        visited.update(self.iter_cells(self.flood(self.bit(row,col),allowed)))
+
+    def connected_mask(self)->int:
+        bubbles=self.bubble_mask
+        return self.flood(bubbles&self.top_mask,bubbles)
+
+    def flood_from_top(self)->Set[Tuple[int,int]]:
+        return set(self.iter_cells(self.connected_mask()))
+
+    def find_hanging(self)->Set[Tuple[int,int]]:
+        return set(self.iter_cells(self.bubble_mask&~self.connected_mask()))
+
+    def remove_hanging(self)->int:
+        not_connected=self.find_hanging()
+        if not_connected:
+            self.remove_cells(not_connected)
+        return len(not_connected)
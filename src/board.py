@@ -0,0 +1,399 @@
+"""pygame 없이 돌아가는 보드 로직 (버블, 장애물, 육각 그리드).
+
+렌더링이 필요한 쪽(game.py, obstacle.py)은 여기 클래스를 상속해서 draw()만 붙임.
+헤드리스 시뮬레이션(engine.py)은 이 모듈만 사용함.
+"""
+import math
+import csv
+import os
+from typing import Callable,Dict,List,Set,Tuple
+
+from config import (
+    SCREEN_WIDTH,CELL_SIZE,BUBBLE_RADIUS,BUBBLE_SPEED,
+    WALL_DROP_PIXELS,MAP_ROWS,MAP_COLS
+)
+from color_settings import COLORS
+from connectivity import ConnectivityTracker
+from hex_geometry import HexPicker,cell_center,hex_picker,neighbors
+
+# ======== 유틸리티 ========
+def clamp(v:float,lo:float,hi:float)->float:
+    return max(lo,min(hi,v))
+
+def wall_bounds()->Tuple[int,int]:
+    """발사된 버블이 튕기는 좌우 벽 x좌표."""
+    grid_x_start=(SCREEN_WIDTH-(MAP_COLS*CELL_SIZE))//2
+    grid_x_end=grid_x_start+(MAP_COLS*CELL_SIZE)
+    return grid_x_start,grid_x_end
+
+def stage_csv_path(stage_index:int)->str:
+    return f'assets/map_data/stage{stage_index+1}.csv'
+
+def load_stage_from_csv(stage_index:int,log:Callable[[str],None]=print)->List[List[str]]:
+    """stage_index 번 스테이지 CSV 를 MAP_ROWS x MAP_COLS 맵으로 읽음. 진행/오류 메시지는 log 로."""
+    csv_path=stage_csv_path(stage_index)
+
+    if not os.path.exists(csv_path):
+        log(f"경고: {csv_path} 파일을 찾을 수 없습니다. 기본 맵을 사용합니다.")
+        return [['.' for _ in range(MAP_COLS)] for _ in range(MAP_ROWS)]
+
+    stage_map=[]
+    try:
+        with open(csv_path,'r',encoding='utf-8') as f:
+            reader=csv.reader(f)
+            for row in reader:
+                map_row=[]
+                for cell in row:
+                    cell=cell.strip()
+                    if cell=='' or cell.upper()=='X':
+                        map_row.append('.')
+                    elif cell.upper()=='N':
+                        map_row.append('N')
+                    elif cell.upper() in COLORS:
+                        map_row.append(cell.upper())
+                    else:
+                        map_row.append('.')
+                while len(map_row)<MAP_COLS:
+                    map_row.append('.')
+                map_row=map_row[:MAP_COLS]
+                stage_map.append(map_row)
+
+        while len(stage_map)<MAP_ROWS:
+            stage_map.append(['.' for _ in range(MAP_COLS)])
+        stage_map=stage_map[:MAP_ROWS]
+
+        log(f"스테이지 {stage_index+1} 맵 데이터 로드 완료: {csv_path}")
+        return stage_map
+
+    except Exception as e:
+        log(f"오류: {csv_path} 파일을 읽는 중 오류가 발생했습니다: {e}")
+        return [['.' for _ in range(MAP_COLS)] for _ in range(MAP_ROWS)]
+
+# ======== Bubble ========
+class Bubble:
+    def __init__(self,x:float,y:float,color:str,radius:int=BUBBLE_RADIUS)->None:
+        self.x:float=x
+        self.y:float=y
+        self.color:str=color
+        self.radius:int=radius
+        self.in_air:bool=False
+        self.is_attached:bool=False
+        self.angle_degree:float=90
+        self.speed:int=BUBBLE_SPEED
+        self.row_idx:int=-1
+        self.col_idx:int=-1
+
+    def set_angle(self,angle_degree:float)->None:
+        self.angle_degree=angle_degree
+
+    def set_grid_index(self,r:int,c:int)->None:
+        self.row_idx=r
+        self.col_idx=c
+
+    def move(self)->None:
+        rad=math.radians(self.angle_degree)
+        dx=self.speed*math.cos(rad)
+        dy=-self.speed*math.sin(rad)
+        self.x+=dx
+        self.y+=dy
+
+        grid_x_start,grid_x_end=wall_bounds()
+
+        if self.x-self.radius<grid_x_start:
+            self.x=grid_x_start+self.radius
+            self.angle_degree=180-self.angle_degree
+        elif self.x+self.radius>grid_x_end:
+            self.x=grid_x_end-self.radius
+            self.angle_degree=180-self.angle_degree
+
+# ======== Obstacle ========
+class Obstacle:
+    """안 움직이고 DFS에도 안 들어감.
+    """
+    def __init__(self,x,y,radius,row_idx,col_idx):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.row_idx = row_idx
+        self.col_idx = col_idx
+        self.is_static = True
+            # 장애물 고정 여부
+
+# ======== Cannon ========
+class Cannon:
+    """발사대 각도 상태. 이미지/그리기는 game.Cannon에서 담당.
+    """
+    def __init__(self,x:int,y:int)->None:
+        self.x:int=x
+        self.y:int=y
+        self.angle:float=90
+        self.min_angle:float=10
+        self.max_angle:float=170
+        self.angle_speed:float=4.0
+
+    def rotate(self,delta:float)->None:
+        self.angle+=delta
+        self.angle=clamp(self.angle,self.min_angle,self.max_angle)
+
+    def set_angle(self,angle:float)->None:
+        self.angle=clamp(angle,self.min_angle,self.max_angle)
+
+# ======== HexGrid ========
+class HexGrid:
+    # 하위 클래스에서 그리기 가능한 버블/장애물 클래스로 교체함.
+    bubble_cls=Bubble
+    obstacle_cls=Obstacle
+    connectivity_cls=ConnectivityTracker
+
+    def __init__(self,rows:int,cols:int,cell_size:int,wall_offset:int=0,
+                 x_offset:int=0,y_offset:int=0)->None:
+        self.rows:int=rows
+        self.cols:int=cols
+        self.cell:int=cell_size
+        self.wall_offset:int=wall_offset
+        self.x_offset:int=x_offset
+        self.y_offset:int=y_offset
+        self.map:List[List[str]]=[['.' for _ in range(cols)] for _ in range(rows)]
+        self.bubble_list:List[Bubble]=[]
+        self.obs_list:List[Obstacle]=[]
+        self.connectivity:ConnectivityTracker=self.connectivity_cls(self)
+            # 천장 연결 증분 추적 (remove_hanging 에서 사용)
+        self.picker:HexPicker=hex_picker(cell_size)
+            # 픽셀 -> 셀 정확 변환 표 (셀 크기별로 공유)
+        self.log:Callable[[str],None]=print
+            # 경고 출력 (GameEngine 이 verbose 설정에 맞춰 교체)
+        self._reset_stats()
+
+    # ======== 보드 통계 ========
+    # bubble_list 기준으로 place_bubble/remove_cells 에서 증분 갱신해서
+    # 색깔/클리어/바닥 판정이 매 프레임 보드를 훑지 않게 함.
+    def _reset_stats(self)->None:
+        self.color_counts:Dict[str,int]={color:0 for color in COLORS}
+            # 색깔별 붙어 있는 버블 수
+        self.bubble_count:int=0
+        self.row_counts:List[int]=[0]*self.rows
+            # 행별 버블 수
+        self.lowest_row:int=-1
+            # 버블이 있는 가장 아래 행 (없으면 -1)
+
+    def _count_bubble(self,b:Bubble)->None:
+        self.color_counts[b.color]=self.color_counts.get(b.color,0)+1
+        self.bubble_count+=1
+        self.row_counts[b.row_idx]+=1
+        if b.row_idx>self.lowest_row:
+            self.lowest_row=b.row_idx
+
+    def _uncount_bubble(self,b:Bubble)->None:
+        self.color_counts[b.color]-=1
+        self.bubble_count-=1
+        self.row_counts[b.row_idx]-=1
+        while self.lowest_row>=0 and self.row_counts[self.lowest_row]==0:
+            self.lowest_row-=1
+
+    def present_colors(self)->List[str]:
+        """맵에 남아 있는 색 (COLORS 순서)."""
+        return [color for color in COLORS if self.color_counts[color]>0]
+
+    def load_from_stage(self,stage_map:List[List[str]])->None:
+        self.map=[row[:] for row in stage_map]
+        self.bubble_list=[]
+        self.obs_list=[]
+        self.connectivity.reset()
+        self._reset_stats()
+        for r in range(self.rows):
+            if r>=len(self.map):
+                break
+            for c in range(self.cols):
+                if c<len(self.map[r]):
+                    ch=self.map[r][c]
+                else:
+                    ch='.'
+
+                # 버블 파싱
+                if ch in COLORS:
+                    x,y=self.get_cell_center(r,c)
+                    b=self.bubble_cls(x,y,ch)
+                    b.is_attached=True
+                    b.set_grid_index(r,c)
+                    self.bubble_list.append(b)
+                    self._count_bubble(b)
+                    continue
+
+                # 장애물 파싱
+                if ch=='N':
+                    obsx,obsy=self.get_cell_center(r,c)
+                    ob=self.obstacle_cls(obsx,obsy,BUBBLE_RADIUS,r,c)
+                    self.obs_list.append(ob)
+                    self.map[r][c]='N'
+                    continue
+
+    def get_cell_center(self,r:int,c:int)->Tuple[int,int]:
+        x,y=cell_center(self.cell,r,c)
+        return x+self.x_offset,y+self.wall_offset+self.y_offset
+
+    def screen_to_grid(self,x:float,y:float)->Tuple[int,int]:
+        """중심이 가장 가까운 셀 (그리드 밖이면 가장자리로 clamp)."""
+        r,c=self.picker.pick(x-self.x_offset,y-self.wall_offset-self.y_offset)
+        c=clamp(c,0,self.cols-1)
+        r=clamp(r,0,self.rows-1)
+        return int(r),int(c)
+
+    def place_bubble(self,bubble:Bubble,r:int,c:int)->None:
+        if r<0 or r>=self.rows or c<0 or c>=self.cols:
+            self.log(f"Error: Out of bounds placement at ({r},{c})")
+            return
+
+        if self.map[r][c]=='/':
+            c=clamp(c+1,0,self.cols-1)
+
+        if r>=len(self.map) or c>=len(self.map[r]):
+            self.log(f"Warning: Placing bubble at ({r},{c}) which may be out of map data bounds.")
+
+        self.map[r][c]=bubble.color
+        cx,cy=self.get_cell_center(r,c)
+        bubble.x,bubble.y=cx,cy
+        bubble.is_attached=True
+        bubble.in_air=False
+        bubble.set_grid_index(r,c)
+        self.bubble_list.append(bubble)
+        self._count_bubble(bubble)
+        self.connectivity.on_place(r,c)
+
+    def nearest_grid_to_point(self,x:float,y:float)->Tuple[int,int]:
+        """(x,y) 에 붙일 빈 셀. 점이 들어 있는 셀이 비었으면 그 셀, 아니면 그 이웃 중 가장 가까운 빈 셀.
+
+        픽 테이블에 픽셀마다 후보가 가까운 순으로 들어 있어서 거리 계산 없이 최대 7칸만 봄.
+        """
+        lx=x-self.x_offset
+        ly=y-self.wall_offset-self.y_offset
+        found=self.picker.nearest_matching(
+            lx,ly,lambda r,c:self.is_in_bounds(r,c) and self.map[r][c]=='.')
+        if found is not None:
+            return found
+
+        r,c=self.picker.pick(lx,ly)
+        r,c=int(clamp(r,0,self.rows-1)),int(clamp(c,0,self.cols-1))
+        self.log(f"Warning: no empty cell found near. ({r},{c}). Forcing.")
+        return r,c
+
+    def is_in_bounds(self,r:int,c:int)->bool:
+        return 0<=r<self.rows and 0<=c<self.cols
+
+    def get_neighbors(self,r:int,c:int)->List[Tuple[int,int]]:
+        return neighbors(r,c)
+
+    def dfs_same_color(self,row:int,col:int,color:str,visited:Set[Tuple[int,int]])->None:
+        stack=[(row,col)]
+        while stack:
+            r,c=stack.pop()
+            if not self.is_in_bounds(r,c) or (r,c) in visited:
+                continue
+            if r>=len(self.map) or c>=len(self.map[r]):
+                continue
+            if self.map[r][c]!=color:
+                continue
+            visited.add((r,c))
+            for nr,nc in self.get_neighbors(r,c):
+                stack.append((nr,nc))
+
+    def remove_cells(self,cells:Set[Tuple[int,int]])->None:
+        cell_set=set(cells)
+        for (r,c) in cell_set:
+            if self.is_in_bounds(r,c):
+                self.map[r][c]='.'
+        kept=[]
+        for b in self.bubble_list:
+            if (b.row_idx,b.col_idx) in cell_set:
+                self._uncount_bubble(b)
+            else:
+                kept.append(b)
+        self.bubble_list=kept
+        self.connectivity.on_remove(cell_set)
+
+    def flood_from_top(self)->Set[Tuple[int,int]]:
+        visited:Set[Tuple[int,int]]=set()
+        for c in range(self.cols):
+            if 0<len(self.map) and c<len(self.map[0]):
+                if self.map[0][c] in COLORS:
+                    self._dfs_reachable(0,c,visited)
+        return visited
+
+    def _dfs_reachable(self,row:int,col:int,visited:Set[Tuple[int,int]])->None:
+        # 재귀로 돌리면 세로로 긴 맵에서 RecursionError 가 나서 스택으로 처리
+        stack=[(row,col)]
+        while stack:
+            r,c=stack.pop()
+            if not self.is_in_bounds(r,c) or (r,c) in visited:
+                continue
+            if r>=len(self.map) or c>=len(self.map[r]):
+                continue
+            if self.map[r][c] not in COLORS:
+                continue
+            visited.add((r,c))
+            for nr,nc in self.get_neighbors(r,c):
+                stack.append((nr,nc))
+
+    def remove_hanging(self)->int:
+        """천장에 연결되지 않은 버블 제거.
+
+        평소에는 지난번 이후 지워진 셀 주변만 검사하고(ConnectivityTracker),
+        스테이지를 새로 불러온 직후에만 전체를 다시 훑음.
+
+        Returns:
+            int: 떨어진 버블 개수
+        """
+        if self.connectivity.needs_full_scan:
+            not_connected=self.find_hanging()
+            self.connectivity.needs_full_scan=False
+        else:
+            not_connected=self.connectivity.collect_detached()
+        self.connectivity.frontier.clear()
+        if not_connected:
+            self.remove_cells(set(not_connected))
+            self.connectivity.frontier.clear()
+        return len(not_connected)
+
+    def find_hanging(self)->Set[Tuple[int,int]]:
+        """flood_from_top 으로 전체를 훑어 천장과 끊어진 셀을 모두 찾음."""
+        connected=self.flood_from_top()
+        not_connected:Set[Tuple[int,int]]=set()
+        for r in range(self.rows):
+            if r>=len(self.map):
+                break
+            for c in range(self.cols):
+                if c>=len(self.map[r]):
+                    break
+                if self.map[r][c] in COLORS and (r,c) not in connected:
+                    not_connected.add((r,c))
+        return not_connected
+
+    def is_stage_cleared(self)->bool:
+        return self.bubble_count==0
+
+    def lowest_bubble_bottom(self)->int:
+        """가장 아래 버블의 아래쪽 y. 벽이 움직여도 행은 그대로라 wall_offset 만 다시 더함."""
+        if self.lowest_row<0:
+            return 0
+        return int(self.get_cell_center(self.lowest_row,0)[1]+BUBBLE_RADIUS)
+
+    def _refresh_positions(self)->None:
+        for b in self.bubble_list:
+            cx,cy=self.get_cell_center(b.row_idx,b.col_idx)
+            b.x,b.y=cx,cy
+
+        for ob in self.obs_list:
+            cx,cy=self.get_cell_center(ob.row_idx,ob.col_idx)
+            ob.x,ob.y=cx,cy
+
+    def drop_wall(self)->None:
+        self.wall_offset+=WALL_DROP_PIXELS
+        self._refresh_positions()
+
+    def raise_wall(self)->None:
+        """벽을 한 칸 올려서(위로 이동) 여유 공간 늘림.
+        """
+        if self.wall_offset<=0:
+            # 더 이상 못 올리면
+            return
+        self.wall_offset=max(0,self.wall_offset-WALL_DROP_PIXELS)
+        self._refresh_positions()
@@ -0,0 +1,92 @@
+"""천장 연결 상태를 증분으로 추적.
+
+버블이 떨어질 수 있는 건 방금 지워진 셀 주변(과 새로 붙은 셀)뿐이므로, remove_cells 때
+지워진 셀의 이웃과 place_bubble 로 붙은 셀만 후보(frontier)로 모아 두고 remove_hanging 때 그 후보에서만 탐색함.
+탐색은 위쪽 이웃부터 보고 0번 행(천장)에 닿는 순간 끝내기 때문에
+대부분 몇 칸 안에 끝나고, 천장에 못 닿은 덩어리만 '새로 떨어진 셀'로 보고함.
+
+    grid.remove_cells(popped)      # on_remove 로 frontier 기록
+    grid.remove_hanging()          # collect_detached 로 떨어진 셀만 찾아 제거
+
+리스트 기반 HexGrid 의 기본 트래커. BitboardHexGrid 는 마스크 플러드로 매번 전체를 보므로
+frontier 를 모으지 않는 FullScanTracker 를 씀.
+"""
+from typing import Iterable,List,Set,Tuple
+
+from color_settings import COLORS
+
+Cell=Tuple[int,int]
+
+class ConnectivityTracker:
+    def __init__(self,grid)->None:
+        self.grid=grid
+        self.frontier:Set[Cell]=set()
+        self.needs_full_scan:bool=True
+            # 스테이지 로드 직후에는 원래부터 떠 있는 버블이 있을 수 있어서 한 번은 전체 검사
+
+    def reset(self)->None:
+        self.frontier.clear()
+        self.needs_full_scan=True
+
+    def on_place(self,r:int,c:int)->None:
+        # 붙이는 것 자체로 다른 셀이 떨어지진 않지만, 장애물에만 닿아 붙은 버블은
+        # 처음부터 떠 있을 수 있으므로 자기 자신을 후보로 둠.
+        self.frontier.add((r,c))
+
+    def on_remove(self,cells:Iterable[Cell])->None:
+        grid=self.grid
+        removed=set(cells)
+        for r,c in removed:
+            for nr,nc in grid.get_neighbors(r,c):
+                if (nr,nc) not in removed:
+                    self.frontier.add((nr,nc))
+        self.frontier-=removed
+
+    def _is_bubble(self,r:int,c:int)->bool:
+        grid=self.grid
+        return grid.is_in_bounds(r,c) and grid.map[r][c] in COLORS
+
+    def _search(self,start:Cell,anchored:Set[Cell])->Tuple[bool,Set[Cell]]:
+        """start 에서 같은 덩어리를 탐색. 천장(또는 이미 연결 확인된 셀)에 닿으면 바로 종료.
+
+        Returns:
+            (천장 연결 여부, 탐색한 셀)
+        """
+        grid=self.grid
+        seen:Set[Cell]={start}
+        stack:List[Cell]=[start]
+        while stack:
+            r,c=stack.pop()
+            if r==0 or (r,c) in anchored:
+                return True,seen
+            # get_neighbors 순서: 좌, 위2, 우, 아래2 → 위쪽을 마지막에 넣어 먼저 꺼냄
+            neighbors=grid.get_neighbors(r,c)
+            for nr,nc in (neighbors[4],neighbors[5],neighbors[0],neighbors[3],
+                          neighbors[1],neighbors[2]):
+                if (nr,nc) not in seen and self._is_bubble(nr,nc):
+                    seen.add((nr,nc))
+                    stack.append((nr,nc))
+        return False,seen
+
+    def collect_detached(self)->Set[Cell]:
+        """지난 호출 이후 천장과 끊어진 셀만 반환하고 frontier 를 비움."""
+        anchored:Set[Cell]=set()
+        detached:Set[Cell]=set()
+        for cell in self.frontier:
+            if cell in anchored or cell in detached or not self._is_bubble(*cell):
+                continue
+            is_anchored,seen=self._search(cell,anchored)
+            if is_anchored:
+                anchored|=seen
+            else:
+                detached|=seen
+        self.frontier.clear()
+        return detached
+
+class FullScanTracker(ConnectivityTracker):
+    """frontier 를 모으지 않는 트래커. 매번 전체를 검사하는 그리드(BitboardHexGrid)용."""
+    def on_place(self,r:int,c:int)->None:
+        pass
+
+    def on_remove(self,cells:Iterable[Cell])->None:
+        pass
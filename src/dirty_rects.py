@@ -0,0 +1,87 @@
+"""변경된 화면 영역만 갱신하는 더티 렉트 추적기.
+
+씬은 매 프레임 화면 Surface 에 평소처럼 전부 그리되, 바뀐 영역만 이 추적기에 알려 주고
+마지막에 present() 로 pygame.display.update(rects) 를 호출함.
+소프트웨어 렌더링 환경에서는 창 전체를 flip 하는 비용이 커서, 발사대나 버블 하나만
+움직이는 프레임이면 그 주변만 올리는 게 훨씬 쌈.
+바뀐 면적이 화면의 full_flip_ratio 를 넘거나 mark_full() 이 호출되면 그냥 flip 함.
+
+    tracker.track('cannon', cannon_rect)            # 이전 프레임 위치 + 현재 위치가 더티
+    tracker.track('score', score_rect, score)       # 값이나 위치가 바뀐 프레임에만 더티
+    tracker.present()
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+from game_settings import DIRTY_RECT_FULL_FLIP_RATIO
+
+_UNSET = object()
+
+
+class DirtyRectTracker:
+    def __init__(self, screen_size: Tuple[int, int],
+                 full_flip_ratio: float = DIRTY_RECT_FULL_FLIP_RATIO) -> None:
+        """
+        Args:
+            screen_size: 화면 크기 (면적 비교용)
+            full_flip_ratio: 더티 면적이 화면 대비 이 비율을 넘으면 전체 flip
+        """
+        self.screen_area = max(1, int(screen_size[0]) * int(screen_size[1]))
+        self.full_flip_ratio = full_flip_ratio
+        self._rects: List[pygame.Rect] = []
+        self._tracked: Dict[str, Tuple[Optional[pygame.Rect], Any]] = {}
+        self._full = True
+            # 첫 프레임은 화면 전체를 올려야 함
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def mark_full(self) -> None:
+        """다음 present() 에서 화면 전체를 갱신."""
+        self._full = True
+
+    def add(self, rect) -> None:
+        """이번 프레임에 바뀐 영역 추가."""
+        if rect is None:
+            return
+        rect = pygame.Rect(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._rects.append(rect)
+
+    def track(self, key: str, rect, state: Any = None) -> None:
+        """매 프레임 그리는 요소의 위치/상태를 보고. 지난 프레임과 다르면 두 위치 모두 더티.
+
+        Args:
+            key: 요소 이름
+            rect: 이번 프레임에 그린 영역 (안 그렸으면 None)
+            state: 그림 내용을 결정하는 값 (점수, 색, 호버 여부 등)
+        """
+        rect = pygame.Rect(rect) if rect is not None else None
+        prev_rect, prev_state = self._tracked.get(key, (None, _UNSET))
+        if prev_rect != rect or prev_state != state:
+            self.add(prev_rect)
+            self.add(rect)
+        self._tracked[key] = (rect, state)
+
+    def forget(self, key: str) -> None:
+        """더 이상 안 그리는 요소. 마지막 위치는 지워야 하므로 더티로 남김."""
+        prev_rect, _ = self._tracked.pop(key, (None, None))
+        self.add(prev_rect)
+
+    def present(self) -> None:
+        """모인 영역을 화면에 반영하고 목록을 비움."""
+        rects = self._rects
+        if not self._full:
+            area = sum(r.width * r.height for r in rects)
+            if area > self.screen_area * self.full_flip_ratio:
+                self._full = True
+
+        if self._full:
+            pygame.display.flip()
+            self.full_flips += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_updates += 1
+
+        self._rects = []
+        self._full = False
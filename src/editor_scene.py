@@ -1,19 +1,50 @@
 import pygame
+from config import FPS
 from map_editor import MapEditor
 
 class EditorScene:
     """Map Editor를 Scene으로 래핑하는 클래스"""
-    def __init__(self, manager):
+    fps = FPS
+
+    def __init__(self, manager, exit_to='menu'):
+        """
+        Args:
+            exit_to: ESC 로 에디터를 나갈 때 갈 씬 (None 이면 종료)
+        """
         self.manager = manager
+        self.exit_to = exit_to
         self.editor = None
-    
-    def run(self):
-        """Map Editor 실행"""
-        # MapEditor 인스턴스 생성 (이미 pygame.init()은 main.py에서 완료됨)
+
+    def enter(self):
+        # 처음 들어올 때 한 번만 MapEditor 생성 (이미 pygame.init()/set_mode는 main.py에서 완료됨)
         self.editor = MapEditor()
-        
-        # 에디터 실행 (ESC 키로 종료 가능)
-        self.editor.run()
-        
-        # 에디터가 종료되면 메뉴로 돌아감
-        return 'menu'
+
+    def resume(self):
+        # 씬 캐시에서 다시 꺼낸 경우: 편집 중이던 맵을 그대로 이어서 사용
+        self.editor.resume()
+
+    def exit(self):
+        self.editor = None
+
+    def memory_bytes(self):
+        return self.editor.memory_bytes() if self.editor is not None else 0
+
+    def idle_timeout(self):
+        return self.editor.idle_timeout()
+
+    def handle_events(self, events):
+        self.editor.handle_input(events)
+
+    def update(self, dt):
+        self.editor.update()
+        if not self.editor.running:
+            # 에디터가 종료되면 메뉴로 돌아감 (창 닫기면 프로그램 종료)
+            self.manager.change_scene(None if self.editor.quit_requested else self.exit_to)
+
+    def draw(self):
+        # 입력도 애니메이션도 없던 프레임은 건너뜀 (잠들었다가 타임아웃으로 깬 경우)
+        if not self.editor.needs_redraw:
+            return
+        self.editor.needs_redraw = False
+        self.editor.draw_ui()
+        self.editor.dirty.present()
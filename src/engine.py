@@ -0,0 +1,417 @@
+"""헤드리스 게임 엔진.
+
+game.Game 에 있던 규칙(버블 준비, 충돌/부착, 매칭 제거, 벽 하강, 클리어/게임오버 판정)을
+pygame 없이 돌릴 수 있게 분리한 것. 한 번의 step()이 게임 한 프레임(틱)에 해당함.
+
+    engine=GameEngine(seed=0)
+    while engine.running:
+        engine.step(Action(angle=75,fire=True))
+"""
+import math
+import os
+import random
+from functools import partial
+from typing import Callable,List,Optional,Set,Tuple
+
+from config import (
+    SCREEN_WIDTH,SCREEN_HEIGHT,CELL_SIZE,
+    LAUNCH_COOLDOWN,MAP_ROWS,MAP_COLS,SCALE
+)
+from constants import GameState,Itemtype
+from color_settings import COLORS
+from board import Bubble,Cannon,HexGrid,load_stage_from_csv,stage_csv_path
+from bitboard import BitboardHexGrid
+from trajectory import ShotPath,solve_shot
+
+StageMap=List[List[str]]
+
+# 아이템 기본 개수 (임시: 테스트용)
+DEFAULT_ITEM_COUNT:int=3
+
+def compute_layout()->dict:
+    """화면 크기/SCALE 기준 게임 영역, 그리드, 발사대 위치 계산.
+
+    Returns:
+        dict: grid_x_offset, grid_y_offset, game_area(x,y,w,h), cannon(x,y)
+    """
+    map_pixel_width=(MAP_COLS*CELL_SIZE)+(CELL_SIZE//2)
+    grid_x_offset=((SCREEN_WIDTH-map_pixel_width)//2)+int(25*SCALE)
+    grid_y_offset=int(30*SCALE)
+
+    padding=int(10*SCALE)
+    game_area_w=map_pixel_width+(padding*2)
+    game_area_h=int(SCREEN_HEIGHT-grid_y_offset)
+    game_area_x=(SCREEN_WIDTH-game_area_w)//2
+    game_area_y=grid_y_offset-padding
+
+    cannon_x=game_area_x+game_area_w//2
+    cannon_y=game_area_y+game_area_h-int(170*SCALE)
+    return {
+        'grid_x_offset':grid_x_offset,
+        'grid_y_offset':grid_y_offset,
+        'game_area':(game_area_x,game_area_y,game_area_w,game_area_h),
+        'cannon':(cannon_x,cannon_y),
+    }
+
+class Action:
+    """한 틱 동안의 입력.
+
+    Args:
+        angle: 지정하면 발사대 각도를 해당 값으로 맞춤 (min/max로 clamp)
+        rotate: 발사대 회전량 (도). 왼쪽 키=+angle_speed, 오른쪽 키=-angle_speed
+        fire: 현재 버블 발사
+        item: 사용할 아이템
+    """
+    def __init__(self,angle:Optional[float]=None,rotate:float=0.0,fire:bool=False,
+                 item:Itemtype=Itemtype.NONE)->None:
+        self.angle=angle
+        self.rotate=rotate
+        self.fire=fire
+        self.item=item
+
+class StepResult:
+    """step() 한 번의 결과. 사운드/연출은 호출하는 쪽에서 처리함."""
+    def __init__(self)->None:
+        self.item_used:bool=False
+        self.fired:bool=False
+        self.attached:bool=False
+        self.attached_cell:Optional[Tuple[int,int]]=None
+        self.popped:int=0
+        self.dropped:int=0
+        self.wall_dropped:bool=False
+        self.stage_cleared:bool=False
+        self.cleared_stage:int=-1
+        self.game_over:bool=False
+
+class GameEngine:
+    def __init__(self,grid:Optional[HexGrid]=None,cannon:Optional[Cannon]=None,
+                 stage_maps:Optional[List[StageMap]]=None,seed:Optional[int]=None,
+                 start_stage:int=0,game_over_line:Optional[float]=None,
+                 verbose:bool=True,grid_cls:type=BitboardHexGrid,
+                 stage_loader:Optional[Callable[[int],StageMap]]=None,
+                 defer_stage_load:bool=False)->None:
+        """
+        Args:
+            grid: 사용할 그리드. 없으면 grid_cls 로 생성
+            cannon: 사용할 발사대. 없으면 board.Cannon 생성
+            stage_maps: 메모리에 올려둔 스테이지 목록. 없으면 assets/map_data CSV 사용
+            seed: 버블 색 난수 시드 (재현용)
+            start_stage: 시작 스테이지 인덱스
+            game_over_line: 게임오버 판정 y좌표. 없으면 발사대 기준으로 계산
+            verbose: False면 진행 로그(print) 생략. 그리드 경고, 스테이지 CSV 메시지 포함. 대량 시뮬레이션용
+            grid_cls: grid 없을 때 만들 그리드 클래스 (기본: 비트보드)
+            stage_loader: stage_maps 가 없을 때 스테이지를 읽는 함수 (기본: load_stage_from_csv).
+                미리 읽어 둔 맵을 쓰고 싶을 때 교체
+            defer_stage_load: True면 스테이지를 클리어해도 다음 스테이지를 바로 올리지 않고 클리어된 판을 그대로 둠.
+                호출하는 쪽이 판을 그려 둔 뒤 load_stage(current_stage) 로 올림
+        """
+        layout=compute_layout()
+        self.grid_y_offset:int=layout['grid_y_offset']
+        if grid is None:
+            grid=grid_cls(MAP_ROWS,MAP_COLS,CELL_SIZE,0,
+                         layout['grid_x_offset'],layout['grid_y_offset'])
+        if cannon is None:
+            cannon=Cannon(*layout['cannon'])
+        self.grid:HexGrid=grid
+        self.cannon:Cannon=cannon
+        self.game_over_line:float=(game_over_line if game_over_line is not None
+                                   else self.cannon.y-CELL_SIZE*0.5)
+
+        self.stage_maps:Optional[List[StageMap]]=stage_maps
+        self.verbose:bool=verbose
+        self.grid.log=self.log
+            # 보드 경고도 verbose 를 따름
+        self.stage_loader:Callable[[int],StageMap]=stage_loader or partial(load_stage_from_csv,log=self.log)
+        self.defer_stage_load:bool=defer_stage_load
+        self.rng:random.Random=random.Random(seed)
+
+        self.state:GameState=GameState.PLAYING
+        self.current_stage:int=start_stage
+        self.current_bubble:Optional[Bubble]=None
+        self.next_bubble:Optional[Bubble]=None
+        self.fire_in_air:bool=False
+        self.shot:Optional[ShotPath]=None
+            # 날아가는 버블의 미리 계산된 경로
+        self.shot_travel:float=0.0
+            # 경로를 따라 이동한 거리
+        self.fire_count:int=0
+        self.score:int=0
+        self.running:bool=True
+        self.item_swap_count:int=DEFAULT_ITEM_COUNT
+            # 버블 스왑 아이템 개수
+        self.item_raise_count:int=DEFAULT_ITEM_COUNT
+            # 벽 한 줄 올리기 아이템 개수
+        self.item_rainbow_count:int=DEFAULT_ITEM_COUNT
+            # 무지개 버블 아이템 개수
+
+        self.load_stage(self.current_stage)
+
+    def log(self,msg:str)->None:
+        if self.verbose:
+            print(msg)
+
+    # ======== 스테이지 ========
+    def has_stage(self,stage_index:int)->bool:
+        if self.stage_maps is not None:
+            return 0<=stage_index<len(self.stage_maps)
+        return os.path.exists(stage_csv_path(stage_index))
+
+    def get_stage_map(self,stage_index:int)->StageMap:
+        if self.stage_maps is not None:
+            if not self.has_stage(stage_index):
+                return [['.' for _ in range(MAP_COLS)] for _ in range(MAP_ROWS)]
+            return self.stage_maps[stage_index]
+        return self.stage_loader(stage_index)
+
+    def load_stage(self,stage_index:int,stage_map:Optional[StageMap]=None)->None:
+        if stage_map is None:
+            stage_map=self.get_stage_map(stage_index)
+
+        if not stage_map or all(all(cell=='.' for cell in row) for row in stage_map):
+            if not self.has_stage(stage_index+1):
+                self.running=False
+                return
+
+        self.grid.wall_offset=0
+        self.grid.y_offset=self.grid_y_offset
+
+        self.grid.load_from_stage(stage_map)
+
+        self.current_bubble=None
+        self.next_bubble=None
+        self.fire_in_air=False
+        self.shot=None
+        self.fire_count=0
+
+        self.prepare_bubbles()
+
+    @property
+    def won(self)->bool:
+        """모든 스테이지를 클리어했는지 여부."""
+        return not self.has_stage(self.current_stage)
+
+    # ======== 버블 준비 ========
+    def random_color_from_map(self)->str:
+        # 시드 재현성을 위해 COLORS 순서로 뽑음
+        colors=self.grid.present_colors()
+        return self.rng.choice(colors or list(COLORS))
+
+    def create_bubble(self)->Bubble:
+        color=self.random_color_from_map()
+        b=self.grid.bubble_cls(self.cannon.x,self.cannon.y,color)
+        return b
+
+    def prepare_bubbles(self)->None:
+        if self.next_bubble is not None:
+            self.current_bubble=self.next_bubble
+        else:
+            self.current_bubble=self.create_bubble()
+        self.current_bubble.x,self.current_bubble.y=self.cannon.x,self.cannon.y
+        self.current_bubble.in_air=False
+        self.next_bubble=self.create_bubble()
+
+    # ======== 틱 진행 ========
+    def step(self,action:Optional[Action]=None,instant:bool=False)->StepResult:
+        """입력 하나를 받아 한 틱 진행함.
+
+        Args:
+            action: 이번 틱 입력. None이면 아무 입력 없음
+            instant: True면 날아가는 버블을 이번 틱에 바로 접촉 지점까지 보냄.
+                애니메이션이 필요 없는 대량 시뮬레이션용
+
+        Returns:
+            StepResult: 이번 틱에 일어난 일
+        """
+        result=StepResult()
+        if not self.running:
+            return result
+        if action is None:
+            action=Action()
+
+        if action.angle is not None:
+            self.cannon.set_angle(action.angle)
+        if action.item!=Itemtype.NONE:
+            result.item_used=self.use_item(action.item)
+        if action.fire:
+            result.fired=self.fire()
+        if action.rotate:
+            self.cannon.rotate(action.rotate)
+
+        if self.current_bubble and self.fire_in_air:
+            distance=math.inf if instant else self.current_bubble.speed
+            if self.advance_shot(distance,result):
+                self.fire_count+=1
+                if self.fire_count>=LAUNCH_COOLDOWN:
+                    self.grid.drop_wall()
+                    self.fire_count=0
+                    result.wall_dropped=True
+                self.current_bubble=None
+                self.fire_in_air=False
+                self.prepare_bubbles()
+
+        if self.grid.is_stage_cleared():
+            result.stage_cleared=True
+            result.cleared_stage=self.current_stage
+            self.current_stage+=1
+            if not self.has_stage(self.current_stage):
+                self.running=False
+                self.state=GameState.GAME_OVER
+                self.log("All stages cleared!")
+            elif not self.defer_stage_load:
+                self.load_stage(self.current_stage)
+
+        if self.running and self.grid.lowest_bubble_bottom()>self.game_over_line:
+            self.running=False
+            self.state=GameState.GAME_OVER
+            result.game_over=True
+            self.log("Game Over")
+
+        return result
+
+    def fire(self)->bool:
+        if self.current_bubble and not self.fire_in_air:
+            self.fire_in_air=True
+            self.current_bubble.in_air=True
+            self.current_bubble.set_angle(self.cannon.angle)
+            self.solve_current_shot()
+            return True
+        return False
+
+    def solve_current_shot(self)->None:
+        """현재 버블 위치/각도에서 경로를 새로 계산 (발사 시, 비행 중 벽이 움직였을 때)."""
+        bubble=self.current_bubble
+        self.shot=solve_shot(self.grid,bubble.x,bubble.y,bubble.angle_degree,bubble.radius)
+        self.shot_travel=0.0
+
+    def advance_shot(self,distance:float,result:Optional[StepResult]=None)->bool:
+        """미리 계산한 경로를 따라 distance 만큼 이동. 접촉 지점에 닿으면 붙이고 True."""
+        bubble=self.current_bubble
+        self.shot_travel=min(self.shot_travel+distance,self.shot.length)
+        bubble.x,bubble.y=self.shot.position_at(self.shot_travel)
+        bubble.set_angle(self.shot.angle_at(self.shot_travel))
+        if self.shot_travel<self.shot.length:
+            return False
+
+        r,c=self.shot.attach_cell
+        self.shot=None
+        self._attach(r,c,result)
+        return True
+
+    def _attach(self,r:int,c:int,result:Optional[StepResult])->None:
+        self.grid.place_bubble(self.current_bubble,r,c)
+        popped=self.pop_if_match(r,c,result)
+        if result is not None:
+            result.attached=True
+            result.attached_cell=(r,c)
+            result.popped=popped
+
+    def pop_if_match(self,row:int,col:int,result:Optional[StepResult]=None)->int:
+        if self.current_bubble is None:
+            return 0
+
+        if not self.grid.is_in_bounds(row,col):
+            return 0
+
+        color=self.grid.map[row][col]
+        if color not in COLORS:
+            return 0
+
+        visited:Set[Tuple[int,int]]=set()
+        self.grid.dfs_same_color(row,col,color,visited)
+
+        if len(visited)>=3:
+            self.grid.remove_cells(visited)
+            dropped=self.grid.remove_hanging()
+            self.score+=len(visited)*10
+            if result is not None:
+                result.dropped=dropped
+            return len(visited)
+        return 0
+
+    # ======== 아이템 ========
+    def use_item(self,item:Itemtype)->bool:
+        if item==Itemtype.SWAP:
+            return self.use_item_swap()
+        if item==Itemtype.RAISE:
+            return self.use_item_raise()
+        if item==Itemtype.RAINBOW:
+            return self.use_item_rainbow()
+        return False
+
+    def use_item_swap(self)->bool:
+        """현재 버블과 다음 버블 스왑함.
+        """
+        if self.item_swap_count<=0:
+            self.log("No SWAP items left.")
+            return False
+        if self.current_bubble is None or self.next_bubble is None:
+            self.log("Cannot swap: one of the bubbles is missing.")
+            return False
+
+        # 색깔만 스왑: 필요하면 나중에 속성도 같이 스왑하면 될 것 같아요.
+        self.current_bubble.color,self.next_bubble.color=self.next_bubble.color,self.current_bubble.color
+
+        self.item_swap_count-=1
+        self.log(f"SWAP used. Remaining: {self.item_swap_count}")
+        return True
+
+    def use_item_raise(self)->bool:
+        """벽을 한 줄 올림.
+        """
+        if self.item_raise_count<=0:
+            self.log("No RAISE items left.")
+            return False
+
+        # HexGrid에 위임
+        before_offset=self.grid.wall_offset
+        self.grid.raise_wall()
+
+        if self.grid.wall_offset==before_offset:
+            self.log("Cannot RAISE: wall is already at the top.")
+            return False
+
+        # 날아가는 중이면 천장/버블 위치가 바뀌었으니 남은 경로 다시 계산
+        if self.fire_in_air and self.shot is not None:
+            self.solve_current_shot()
+
+        self.item_raise_count-=1
+        self.log(f"RAISE used. Remaining: {self.item_raise_count}")
+        return True
+
+    def best_color_for_rainbow(self)->str:
+        """현재 맵에서 가장 많이 남아있는 색 선택함.
+
+        Returns:
+            str: 가장 많이 등장한 색을 반환
+        """
+        colors=self.grid.present_colors()
+
+        # 맵 거의 비어있으면 그냥 랜덤 색
+        if not colors:
+            return self.rng.choice(list(COLORS.keys()))
+        # 가장 많이 등장한 색 반환함 (동점이면 COLORS 순서로 앞쪽).
+        return max(colors,key=self.grid.color_counts.get)
+
+    def use_item_rainbow(self)->bool:
+        """현재 버블을 맵에 가장 많은 색으로 바꿈.
+        """
+        if self.item_rainbow_count<=0:
+            self.log("No RAINBOW items left.")
+            return False
+        if self.current_bubble is None:
+            self.log("Cannot use RAINBOW: current bubble is missing.")
+            return False
+
+        # 변환 전 색상 저장
+        original_color=self.current_bubble.color
+
+        # 최적 색상으로 변환
+        best_color=self.best_color_for_rainbow()
+        self.current_bubble.color=best_color
+
+        self.item_rainbow_count-=1
+
+        # 변환 전후 색상 출력
+        self.log(f"🌈 RAINBOW: {original_color} → {best_color}")
+        self.log(f"RAINBOW used. Remaining: {self.item_rainbow_count}")
+        return True
@@ -1,52 +1,89 @@
 import math
 import random
 import sys
-import csv
-import os
-from typing import List,Set,Tuple,Optional
+from typing import Tuple,Optional
 
 import pygame
 
 from config import (
-    SCREEN_WIDTH,SCREEN_HEIGHT,FPS,CELL_SIZE,BUBBLE_RADIUS,BUBBLE_SPEED,
-    LAUNCH_COOLDOWN,WALL_DROP_PIXELS,MAP_ROWS,MAP_COLS,
+    SCREEN_WIDTH,SCREEN_HEIGHT,CELL_SIZE,BUBBLE_RADIUS,MAP_ROWS,MAP_COLS,
     NEXT_BUBBLE_X,NEXT_BUBBLE_Y_OFFSET,SCALE
 )
 from game_settings import (
-    END_SCREEN_DELAY,POP_SOUND_VOLUME,TAP_SOUND_VOLUME
+    END_SCREEN_DELAY,STAGE_CLEAR_BANNER_MS,POP_SOUND_VOLUME,TAP_SOUND_VOLUME,
+    SIM_TICK_RATE,MAX_CATCH_UP_STEPS,
+    CANNON_ROTATION_STEP,CANNON_ROTATION_CACHE_MB
 )
 from asset_paths import ASSET_PATHS
-from constants import BubbleColor,GameState,Itemtype
-from color_settings import (COLORS,
-                            COLOR_MAP)
+from constants import GameState,Itemtype
+from color_settings import COLORS
 
 from obstacle import Obstacle
+import board
+from bitboard import BitboardHexGrid
+from engine import Action,GameEngine,StepResult,compute_layout
+from sprite_cache import RotationCache,surface_bytes
+from dirty_rects import DirtyRectTracker
+from asset_manager import assets
+from sprite_atlas import SpriteAtlas
+from render_queue import RenderQueue
+from prefetch import PrefetchPlan,prefetcher
+from timeline import Timeline
+from text_cache import asset_font,digit_strip,get_font,sys_font,text_cache
 
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-# ======== 버블 이미지 로드 ========
-try:
-    BUBBLE_IMAGES:dict[str,pygame.Surface]={
-        'R':pygame.image.load(ASSET_PATHS['bubble_red']),
-        'Y':pygame.image.load(ASSET_PATHS['bubble_yellow']),
-        'B':pygame.image.load(ASSET_PATHS['bubble_blue']),
-        'G':pygame.image.load(ASSET_PATHS['bubble_green']),
+# ======== 버블 이미지 ========
+BUBBLE_IMAGE_KEYS:dict[str,str]={
+    'R':'bubble_red',
+    'Y':'bubble_yellow',
+    'B':'bubble_blue',
+    'G':'bubble_green',
+}
+
+ITEM_TYPES:Tuple[str,...]=('swap','raise','rainbow')
+
+_game_atlas:Optional[SpriteAtlas]=None
+
+def game_atlas_entries()->dict:
+    size=BUBBLE_RADIUS*2
+    item_size=int(80*SCALE)
+    entries={color:(key,(size,size),True,True) for color,key in BUBBLE_IMAGE_KEYS.items()}
+    for item_type in ITEM_TYPES:
+        entries[f'item_{item_type}']=(f'item_{item_type}',(item_size,item_size),True,True)
+    entries['cannon_arrow']=('cannon_arrow',(152,317),True,True)
+    return entries
+
+def game_image_specs()->dict:
+    """아틀라스에 안 들어가는 게임 화면 이미지: 이름 -> (ASSET_PATHS 키, 크기, alpha, smooth)."""
+    return {
+        'background':('background',(SCREEN_WIDTH,SCREEN_HEIGHT),False,False),
+        # SCALE 적용하여 화면 크기에 따라 조정
+        'char_left':('char_left',(int(313*SCALE),int(546*SCALE)),True,True),
+        'char_right':('char_right',(int(308*SCALE),int(555*SCALE)),True,True),
+        'logo':('logo',(int(176*SCALE),int(176*SCALE)),True,True),
     }
-    print("버블 이미지 로드 완료.")
-except pygame.error as e:
-    print(f"이미지 로드 실패함: {e}. 기본 색상으로 대체합니다.")
-    BUBBLE_IMAGES=None
-
-# ======== 이미지 크기 조정 ========
-if BUBBLE_IMAGES:
-    target_size=BUBBLE_RADIUS*2
-    for color in BUBBLE_IMAGES:
-        BUBBLE_IMAGES[color]=pygame.transform.smoothscale(
-            BUBBLE_IMAGES[color],
-            (target_size,target_size)
-        )
-    print(f"버블 이미지 크기 조정 완료: {target_size}x{target_size}px")
+
+def game_prefetch_plan()->PrefetchPlan:
+    """메뉴에 있는 동안 미리 준비할 게임 리소스."""
+    return PrefetchPlan(
+        images=list(game_image_specs().values())+list(game_atlas_entries().values()),
+        sounds=list(ASSET_PATHS['pop_sounds'])+[ASSET_PATHS['tap_sound']],
+        streams=[ASSET_PATHS['bgm']],
+        fonts=[asset_font(50),asset_font(40*SCALE),sys_font('malgungothic',20)],
+        stages=[0],
+    )
+
+def game_atlas()->SpriteAtlas:
+    """버블, 아이템 아이콘, 발사대 화살표를 한 장에 묶은 아틀라스 (처음 요청될 때 한 번 만듦).
+
+    영역 이름은 버블 색 코드('R','Y','B','G'), 'item_swap' 등, 'cannon_arrow'.
+    """
+    global _game_atlas
+    if _game_atlas is None:
+        _game_atlas=assets.atlas('game',game_atlas_entries())
+    return _game_atlas
 
 # 안전차원에서 다시 명시
 COLORS:dict[str,Tuple[int,int,int]]={
@@ -56,412 +93,171 @@ COLORS:dict[str,Tuple[int,int,int]]={
     'G':(70,200,120),
 }
 
-# ======== 유틸리티 ========
-def clamp(v:float,lo:float,hi:float)->float:
-    return max(lo,min(hi,v))
-
-def load_stage_from_csv(stage_index:int)->List[List[str]]:
-    csv_path=f'assets/map_data/stage{stage_index+1}.csv'
-
-    if not os.path.exists(csv_path):
-        print(f"경고: {csv_path} 파일을 찾을 수 없습니다. 기본 맵을 사용합니다.")
-        return [['.' for _ in range(MAP_COLS)] for _ in range(MAP_ROWS)]
-
-    stage_map=[]
-    try:
-        with open(csv_path,'r',encoding='utf-8') as f:
-            reader=csv.reader(f)
-            for row in reader:
-                map_row=[]
-                for cell in row:
-                    cell=cell.strip()
-                    if cell=='' or cell.upper()=='X':
-                        map_row.append('.')
-                    elif cell.upper()=='N':
-                        map_row.append('N')
-                    elif cell.upper() in COLORS:
-                        map_row.append(cell.upper())
-                    else:
-                        map_row.append('.')
-                while len(map_row)<MAP_COLS:
-                    map_row.append('.')
-                map_row=map_row[:MAP_COLS]
-                stage_map.append(map_row)
-
-        while len(stage_map)<MAP_ROWS:
-            stage_map.append(['.' for _ in range(MAP_COLS)])
-        stage_map=stage_map[:MAP_ROWS]
-
-        print(f"스테이지 {stage_index+1} 맵 데이터 로드 완료: {csv_path}")
-        return stage_map
-
-    except Exception as e:
-        print(f"오류: {csv_path} 파일을 읽는 중 오류가 발생했습니다: {e}")
-        return [['.' for _ in range(MAP_COLS)] for _ in range(MAP_ROWS)]
-
 # ======== Bubble ========
-class Bubble:
-    def __init__(self,x:float,y:float,color:str,radius:int=BUBBLE_RADIUS)->None:
-        self.x:float=x
-        self.y:float=y
-        self.color:str=color
-        self.radius:int=radius
-        self.in_air:bool=False
-        self.is_attached:bool=False
-        self.angle_degree:float=90
-        self.speed:int=BUBBLE_SPEED
-        self.row_idx:int=-1
-        self.col_idx:int=-1
-
-    def draw(self,screen:pygame.Surface)->None:
-        if BUBBLE_IMAGES:
-            img=BUBBLE_IMAGES[self.color]
-            rect=img.get_rect(center=(int(self.x),int(self.y)))
-            screen.blit(img,rect)
-        else:
-            pygame.draw.circle(screen,COLORS[self.color],(int(self.x),int(self.y)),self.radius)
-            pygame.draw.circle(screen,(255,255,255),(int(self.x),int(self.y)),self.radius,2)
-
-    def set_angle(self,angle_degree:float)->None:
-        self.angle_degree=angle_degree
+class Bubble(board.Bubble):
+    def draw(self,screen:pygame.Surface,pos:Optional[Tuple[float,float]]=None)->pygame.Rect:
+        """버블 그리기. pos 를 주면 자기 좌표 대신 그 위치에 그림 (보간, NEXT 표시용).
 
-    def set_grid_index(self,r:int,c:int)->None:
-        self.row_idx=r
-        self.col_idx=c
-
-    def move(self)->None:
-        rad=math.radians(self.angle_degree)
-        dx=self.speed*math.cos(rad)
-        dy=-self.speed*math.sin(rad)
-        self.x+=dx
-        self.y+=dy
-
-        grid_x_start=(SCREEN_WIDTH-(MAP_COLS*CELL_SIZE))//2
-        grid_x_end=grid_x_start+(MAP_COLS*CELL_SIZE)
-
-        if self.x-self.radius<grid_x_start:
-            self.x=grid_x_start+self.radius
-            self.angle_degree=180-self.angle_degree
-        elif self.x+self.radius>grid_x_end:
-            self.x=grid_x_end-self.radius
-            self.angle_degree=180-self.angle_degree
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        x,y=pos if pos is not None else (self.x,self.y)
+        atlas=game_atlas()
+        if self.color in atlas:
+            return atlas.blit(screen,self.color,center=(int(x),int(y)))
+        rect=pygame.draw.circle(screen,COLORS[self.color],(int(x),int(y)),self.radius)
+        pygame.draw.circle(screen,(255,255,255),(int(x),int(y)),self.radius,2)
+        return rect
+
+    def enqueue(self,queue:RenderQueue,pos:Optional[Tuple[float,float]]=None)->Optional[pygame.Rect]:
+        """draw 대신 queue 에 blit 을 예약. 이미지가 없으면 None (draw 로 직접 그려야 함)."""
+        x,y=pos if pos is not None else (self.x,self.y)
+        atlas=game_atlas()
+        if self.color not in atlas:
+            return None
+        return queue.push_atlas(atlas,self.color,center=(int(x),int(y)))
 
 # ======== Cannon ========
-class Cannon:
+class Cannon(board.Cannon):
     def __init__(self,x:int,y:int)->None:
-        self.x:int=x
-        self.y:int=y
-        self.angle:float=90
-        self.min_angle:float=10
-        self.max_angle:float=170
-        self.angle_speed:float=4.0
+        super().__init__(x,y)
 
-        try:
-            self.arrow_image=pygame.image.load(ASSET_PATHS['cannon_arrow']).convert_alpha()
-            self.arrow_image=pygame.transform.smoothscale(self.arrow_image,(152,317))
-        except pygame.error:
+        atlas=game_atlas()
+        self.arrow_image:Optional[pygame.Surface]=None
+        if 'cannon_arrow' in atlas:
+            self.arrow_image=atlas.subsurface('cannon_arrow')
+        else:
             print("발사대 이미지 로드 실패")
-            self.arrow_image=None
 
-    def rotate(self,delta:float)->None:
-        self.angle+=delta
-        self.angle=clamp(self.angle,self.min_angle,self.max_angle)
+        # 매 프레임 rotate 하지 않도록 각도별 회전 결과 캐시
+        self.rotation_cache:Optional[RotationCache]=None
+        if self.arrow_image:
+            self.rotation_cache=RotationCache(self.arrow_image,CANNON_ROTATION_STEP,
+                                              CANNON_ROTATION_CACHE_MB*1024*1024)
 
-    def draw(self,screen:pygame.Surface)->None:
+    def draw(self,screen:pygame.Surface,angle:Optional[float]=None)->pygame.Rect:
+        if angle is None:
+            angle=self.angle
         if self.arrow_image:
-            rotated_arrow=pygame.transform.rotate(self.arrow_image,self.angle-90)
+            rotated_arrow=self.rotation_cache.get(angle-90)
             arrow_rect=rotated_arrow.get_rect(center=(self.x,self.y))
-            screen.blit(rotated_arrow,arrow_rect)
-        else:
-            length=100
-            rad=math.radians(self.angle)
-            end_x=self.x+length*math.cos(rad)
-            end_y=self.y-length*math.sin(rad)
-            pygame.draw.line(screen,(255,255,255),(self.x,self.y),(end_x,end_y),4)
-            pygame.draw.circle(screen,(255,0,0),(self.x,self.y),6)
+            return screen.blit(rotated_arrow,arrow_rect)
+        length=100
+        rad=math.radians(angle)
+        end_x=self.x+length*math.cos(rad)
+        end_y=self.y-length*math.sin(rad)
+        rect=pygame.draw.line(screen,(255,255,255),(self.x,self.y),(end_x,end_y),4)
+        return rect.union(pygame.draw.circle(screen,(255,0,0),(self.x,self.y),6))
 
 # ======== HexGrid ========
-class HexGrid:
-    def __init__(self,rows:int,cols:int,cell_size:int,wall_offset:int=0,
-                 x_offset:int=0,y_offset:int=0)->None:
-        self.rows:int=rows
-        self.cols:int=cols
-        self.cell:int=cell_size
-        self.wall_offset:int=wall_offset
-        self.x_offset:int=x_offset
-        self.y_offset:int=y_offset
-        self.map:List[List[str]]=[['.' for _ in range(cols)] for _ in range(rows)]
-        self.bubble_list:List[Bubble]=[]
-        self.obs_list:List[Obstacle]=[]
-
-    def load_from_stage(self,stage_map:List[List[str]])->None:
-        self.map=[row[:] for row in stage_map]
-        self.bubble_list=[]
-        self.obs_list=[]
-        for r in range(self.rows):
-            if r>=len(self.map):
-                break
-            for c in range(self.cols):
-                if c<len(self.map[r]):
-                    ch=self.map[r][c]
-                else:
-                    ch='.'
-
-                # 버블 파싱
-                if ch in COLORS:
-                    x,y=self.get_cell_center(r,c)
-                    b=Bubble(x,y,ch)
-                    b.is_attached=True
-                    b.set_grid_index(r,c)
-                    self.bubble_list.append(b)
-                    continue
-
-                # 장애물 파싱
-                if ch=='N':
-                    obsx,obsy=self.get_cell_center(r,c)
-                    # ob=Obstacle(obsx,obsy,BUBBLE_RADIUS)
-                    ob=Obstacle(obsx,obsy,BUBBLE_RADIUS,r,c)
-                    self.obs_list.append(ob)
-                    self.map[r][c]='N'
-                    continue
-
-    def get_cell_center(self,r:int,c:int)->Tuple[int,int]:
-        x=c*self.cell+self.cell//2+self.x_offset
-        y=r*self.cell+self.cell//2+self.wall_offset+self.y_offset
-        if r%2==1:
-            x+=self.cell//2
-        return x,y
-
-    def screen_to_grid(self,x:float,y:float)->Tuple[int,int]:
-        r=int((y-self.wall_offset-self.y_offset)//self.cell)
-        if r<0:
-            r=0
-        c_base=x-self.x_offset
-        if r%2==1:
-            c=int((c_base-self.cell//2)//self.cell)
-        else:
-            c=int(c_base//self.cell)
-        c=clamp(c,0,self.cols-1)
-        r=clamp(r,0,self.rows-1)
-        return int(r),int(c)
+class HexGrid(BitboardHexGrid):
+    bubble_cls=Bubble
+    obstacle_cls=Obstacle
+
+    def __init__(self,*args,**kwargs)->None:
+        super().__init__(*args,**kwargs)
+        self.layer:Optional[pygame.Surface]=None
+            # 붙어 있는 버블/장애물을 미리 그려 둔 레이어
+        self.layer_dirty:bool=True
+        self.layer_rect:Optional[pygame.Rect]=None
+            # 레이어에서 실제로 그려진 영역 (화면 갱신 범위)
+        self.layer_version:int=0
+        self.render_queue=RenderQueue()
+
+    def invalidate_layer(self)->None:
+        self.layer_dirty=True
+
+    # 그리드를 바꾸는 메서드에서만 레이어를 다시 그림
+    def load_from_stage(self,stage_map)->None:
+        super().load_from_stage(stage_map)
+        self.invalidate_layer()
 
     def place_bubble(self,bubble:Bubble,r:int,c:int)->None:
-        if r<0 or r>=self.rows or c<0 or c>=self.cols:
-            print(f"Error: Out of bounds placement at ({r},{c})")
-            return
+        super().place_bubble(bubble,r,c)
+        self.invalidate_layer()
 
-        if self.map[r][c]=='/':
-            c=clamp(c+1,0,self.cols-1)
-
-        if r>=len(self.map) or c>=len(self.map[r]):
-            print(f"Warning: Placing bubble at ({r},{c}) which may be out of map data bounds.")
-
-        self.map[r][c]=bubble.color
-        cx,cy=self.get_cell_center(r,c)
-        bubble.x,bubble.y=cx,cy
-        bubble.is_attached=True
-        bubble.in_air=False
-        bubble.set_grid_index(r,c)
-        self.bubble_list.append(bubble)
-
-    def nearest_grid_to_point(self,x:float,y:float)->Tuple[int,int]:
-        r,c=self.screen_to_grid(x,y)
-
-        if not self.is_in_bounds(r,c):
-            return (0,clamp(c,0,self.cols-1))
-
-        if self.map[r][c] in COLORS or self.map[r][c]=='/':
-            neighbors=self.get_neighbors(r,c)
-            best_neighbor=(r,c)
-            min_dist_sq=float('inf')
-            found_empty=False
-
-            for nr,nc in neighbors:
-                if self.is_in_bounds(nr,nc) and self.map[nr][nc]=='.':
-                    nx,ny=self.get_cell_center(nr,nc)
-                    dist_sq=(x-nx)**2+(y-ny)**2
-                    if dist_sq<min_dist_sq:
-                        min_dist_sq=dist_sq
-                        best_neighbor=(nr,nc)
-                        found_empty=True
-
-            if found_empty:
-                return best_neighbor
-
-        if self.is_in_bounds(r,c) and self.map[r][c]=='.':
-            return r,c
-
-        print(f"Warning: no empty cell found near. ({r},{c}). Forcing.")
-        return r,c
-
-    def is_in_bounds(self,r:int,c:int)->bool:
-        return 0<=r<self.rows and 0<=c<self.cols
-
-    def get_neighbors(self,r:int,c:int)->List[Tuple[int,int]]:
-        if r%2==0:
-            dr=[0,-1,-1,0,1,1]
-            dc=[-1,-1,0,1,0,-1]
-        else:
-            dr=[0,-1,-1,0,1,1]
-            dc=[-1,0,1,1,1,0]
-        return [(r+dr[i],c+dc[i]) for i in range(6)]
-
-    def dfs_same_color(self,row:int,col:int,color:str,visited:Set[Tuple[int,int]])->None:
-        stack=[(row,col)]
-        while stack:
-            r,c=stack.pop()
-            if not self.is_in_bounds(r,c) or (r,c) in visited:
-                continue
-            if r>=len(self.map) or c>=len(self.map[r]):
-                continue
-            if self.map[r][c]!=color:
-                continue
-            visited.add((r,c))
-            for nr,nc in self.get_neighbors(r,c):
-                stack.append((nr,nc))
-
-    def remove_cells(self,cells:Set[Tuple[int,int]])->None:
-        cell_set=set(cells)
-        for (r,c) in cell_set:
-            if self.is_in_bounds(r,c):
-                self.map[r][c]='.'
-        self.bubble_list=[
-            b for b in self.bubble_list
-            if (b.row_idx,b.col_idx) not in cell_set
-        ]
-
-    def flood_from_top(self)->Set[Tuple[int,int]]:
-        visited:Set[Tuple[int,int]]=set()
-        for c in range(self.cols):
-            if 0<len(self.map) and c<len(self.map[0]):
-                if self.map[0][c] in COLORS:
-                    self._dfs_reachable(0,c,visited)
-        return visited
-
-    def _dfs_reachable(self,row:int,col:int,visited:Set[Tuple[int,int]])->None:
-        if not self.is_in_bounds(row,col) or (row,col) in visited:
-            return
-        if row>=len(self.map) or col>=len(self.map[row]):
-            return
-        if self.map[row][col] not in COLORS:
-            return
-        visited.add((row,col))
-        for nr,nc in self.get_neighbors(row,col):
-            self._dfs_reachable(nr,nc,visited)
-
-    def remove_hanging(self)->None:
-        connected=self.flood_from_top()
-        not_connected:List[Tuple[int,int]]=[]
-        for r in range(self.rows):
-            if r>=len(self.map):
-                break
-            for c in range(self.cols):
-                if c>=len(self.map[r]):
-                    break
-                if self.map[r][c] in COLORS and (r,c) not in connected:
-                    not_connected.append((r,c))
-        if not_connected:
-            self.remove_cells(set(not_connected))
-
-    def draw(self,screen:pygame.Surface)->None:
-        for b in self.bubble_list:
-            b.draw(screen)
-
-        for ob in self.obs_list:
-            ob.draw(screen)
+    def remove_cells(self,cells)->None:
+        super().remove_cells(cells)
+        self.invalidate_layer()
 
     def drop_wall(self)->None:
-        self.wall_offset+=WALL_DROP_PIXELS
-        for b in self.bubble_list:
-            cx,cy=self.get_cell_center(b.row_idx,b.col_idx)
-            b.x,b.y=cx,cy
-
-        for ob in self.obs_list:
-            cx,cy=self.get_cell_center(ob.row_idx,ob.col_idx)
-            ob.x,ob.y=cx,cy
+        super().drop_wall()
+        self.invalidate_layer()
 
     def raise_wall(self)->None:
-        """벽을 한 칸 올려서(위로 이동) 여유 공간 늘림.
-        """
-        if self.wall_offset<=0:
-            # 더 이상 못 올리면
-            return
-        self.wall_offset=max(0,self.wall_offset-WALL_DROP_PIXELS)
+        super().raise_wall()
+        self.invalidate_layer()
+
+    def render_layer(self,size:Tuple[int,int])->None:
+        if self.layer is None or self.layer.get_size()!=size:
+            self.layer=pygame.Surface(size,pygame.SRCALPHA).convert_alpha()
+        self.layer.fill((0,0,0,0))
+        rects=[]
+        # 버블은 큐에 모아서 blits 한 번으로 그림
         for b in self.bubble_list:
-            cx,cy=self.get_cell_center(b.row_idx,b.col_idx)
-            b.x,b.y=cx,cy
+            rect=b.enqueue(self.render_queue)
+            rects.append(rect if rect is not None else b.draw(self.layer))
+        self.render_queue.flush(self.layer)
 
         for ob in self.obs_list:
-            cx,cy=self.get_cell_center(ob.row_idx,ob.col_idx)
-            ob.x,ob.y=cx,cy
+            rects.append(ob.draw(self.layer))
+        self.layer_rect=rects[0].unionall(rects[1:]) if rects else None
+        self.layer_dirty=False
+        self.layer_version+=1
+
+    def draw(self,screen:pygame.Surface)->None:
+        if self.layer_dirty or self.layer is None or self.layer.get_size()!=screen.get_size():
+            self.render_layer(screen.get_size())
+        # 레이어 대부분이 투명이라 버블이 있는 영역만 알파 블렌딩
+        if self.layer_rect is not None:
+            screen.blit(self.layer,self.layer_rect,self.layer_rect)
 
 # ======== ScoreDisplay ========
 class ScoreDisplay:
     def __init__(self)->None:
         self.score:int=0
-        try:
-            self.font=pygame.font.Font(ASSET_PATHS['font'],50)
-        except:
-            print("픽셀 폰트 로드 실패. 기본 폰트로 대체합니다.")
-            self.font=pygame.font.Font(None,50)
+        self.font_key=asset_font(50)
+        self.font=get_font(self.font_key)
 
     def add(self,points:int)->None:
         self.score+=points
 
-    def draw(self,screen:pygame.Surface,level:int)->None:
-        score_txt=self.font.render(f'SCORE : {self.score}',True,(0,0,0))
-        level_txt=self.font.render(f'LEVEL : {level}',True,(0,0,0))
-        screen.blit(score_txt,(30,30))
-        screen.blit(level_txt,(30,80))
+    def draw(self,screen:pygame.Surface,level:int)->pygame.Rect:
+        # 라벨은 캐시, 숫자는 글리프를 이어 붙여서 그림
+        digits=digit_strip(self.font_key,(0,0,0))
+        rect=screen.blit(text_cache.render(self.font_key,'SCORE : ',(0,0,0)),(30,30))
+        rect=rect.union(digits.blit(screen,self.score,topleft=rect.topright))
+        level_rect=screen.blit(text_cache.render(self.font_key,'LEVEL : ',(0,0,0)),(30,80))
+        level_rect=level_rect.union(digits.blit(screen,level,topleft=level_rect.topright))
+        return rect.union(level_rect)
 
 # ======== Game ========
 class Game:
+    """GameEngine 위에 입력, 사운드, 렌더링을 붙인 pygame 프론트엔드."""
     def __init__(self)->None:
-        self.screen:pygame.Surface=pygame.display.set_mode((SCREEN_WIDTH,SCREEN_HEIGHT))
+        # 씬 전환마다 창을 다시 만들지 않도록 이미 있는 화면을 그대로 사용
+        self.screen:pygame.Surface=pygame.display.get_surface() or pygame.display.set_mode((SCREEN_WIDTH,SCREEN_HEIGHT))
         pygame.display.set_caption("Bubble Pop (K-Univ. Edition)")
-        self.clock:pygame.time.Clock=pygame.time.Clock()
-
-        map_pixel_width=(MAP_COLS*CELL_SIZE)+(CELL_SIZE//2)
-        self.grid_x_offset=((SCREEN_WIDTH-map_pixel_width)//2)+int(25*SCALE)
-        self.grid_y_offset=int(30*SCALE)
 
-        padding=int(10*SCALE)
-        game_area_w=map_pixel_width+(padding*2)
-        game_area_h=SCREEN_HEIGHT-self.grid_y_offset
-        game_area_x=(SCREEN_WIDTH-game_area_w)//2
-        game_area_y=self.grid_y_offset-padding
-        self.game_rect=pygame.Rect(game_area_x,game_area_y,game_area_w,game_area_h)
+        layout=compute_layout()
+        self.grid_x_offset=layout['grid_x_offset']
+        self.grid_y_offset=layout['grid_y_offset']
+        self.game_rect=pygame.Rect(*layout['game_area'])
 
-        self.grid:HexGrid=HexGrid(MAP_ROWS,MAP_COLS,CELL_SIZE,
-                                  0,
-                                  self.grid_x_offset,self.grid_y_offset)
+        grid=HexGrid(MAP_ROWS,MAP_COLS,CELL_SIZE,
+                     0,
+                     self.grid_x_offset,self.grid_y_offset)
+        cannon=Cannon(*layout['cannon'])
 
-        cannon_x=self.game_rect.centerx
-        cannon_y=self.game_rect.bottom-int(170*SCALE)
-        self.cannon:Cannon=Cannon(cannon_x,cannon_y)
-
-        self.game_over_line=self.cannon.y-CELL_SIZE*0.5
         self.score_ui:ScoreDisplay=ScoreDisplay()
 
-        try:
-            self.background_image=pygame.image.load(ASSET_PATHS['background']).convert()
-            self.background_image=pygame.transform.scale(self.background_image,(SCREEN_WIDTH,SCREEN_HEIGHT))
-
-            self.char_left=pygame.image.load(ASSET_PATHS['char_left']).convert_alpha()
-            self.char_right=pygame.image.load(ASSET_PATHS['char_right']).convert_alpha()
-            self.logo=pygame.image.load(ASSET_PATHS['logo']).convert_alpha()
-
-            # SCALE 적용하여 화면 크기에 따라 조정
-            self.char_left=pygame.transform.smoothscale(self.char_left,(int(313*SCALE),int(546*SCALE)))
-            self.char_right=pygame.transform.smoothscale(self.char_right,(int(308*SCALE),int(555*SCALE)))
-            self.logo=pygame.transform.smoothscale(self.logo,(int(176*SCALE),int(176*SCALE)))
-
-        except pygame.error as e:
-            print(f"배경/UI 이미지 로드 실패: {e}")
-            self.background_image=None
-            self.char_left=None
-            self.char_right=None
-            self.logo=None
+        # 이미지는 AssetManager 가 씬 사이에서 공유 (처음 한 번만 디코딩/스케일).
+        # 메뉴에 있는 동안 prefetcher 가 파일 읽기/디코딩을 미리 해 둠
+        specs=game_image_specs()
+        self.background_image=assets.image(*specs['background'])
+        self.char_left=assets.image(*specs['char_left'])
+        self.char_right=assets.image(*specs['char_right'])
+        self.logo=assets.image(*specs['logo'])
 
         try:
             pygame.mixer.music.load(ASSET_PATHS['bgm'])
@@ -473,117 +269,92 @@ class Game:
 
         self.pop_sounds=[]
         for sound_path in ASSET_PATHS['pop_sounds']:
-            try:
-                sound=pygame.mixer.Sound(sound_path)
+            sound=assets.sound(sound_path)
+            if sound:
                 sound.set_volume(POP_SOUND_VOLUME)
                 self.pop_sounds.append(sound)
-            except pygame.error as e:
-                print(f"효과음 로드 실패: {sound_path} - {e}")
 
         if not self.pop_sounds:
             print("경고: 효과음 파일을 찾을 수 없습니다.")
 
-        try:
-            self.tap_sound=pygame.mixer.Sound(ASSET_PATHS['tap_sound'])
+        self.tap_sound=assets.sound(ASSET_PATHS['tap_sound'])
+        if self.tap_sound:
             self.tap_sound.set_volume(TAP_SOUND_VOLUME)
-        except pygame.error as e:
-            print(f"tap 효과음 로드 실패: {ASSET_PATHS['tap_sound']} - {e}")
-            self.tap_sound=None
-
-        self.current_stage:int=0
-        self.current_bubble:Optional[Bubble]=None
-        self.next_bubble:Optional[Bubble]=None
-        self.fire_in_air:bool=False
-        self.fire_count:int=0
-        self.running:bool=True
-        # --- 특수 아이템 개수 설정 (임시: 테스트용) ---
-        self.item_swap_count:int=3
-            # 버블 스왑 아이템 개수
-        self.item_raise_count:int=3
-            # 벽 한 줄 올리기 아이템 개수
-        self.item_rainbow_count:int=3
-            # 무지개 버블 아이템 개수
-        # ------------------------------------------
-
-        # --- 요청 플래그만 추가 (임시: 테스트용) ---
-            # 플래그 방식 안 쓸 예정.
 
         # FIXME: UI용 폰트
-        self.ui_font=pygame.font.SysFont('malgungothic',20)
+        self.ui_font_key=sys_font('malgungothic',20)
+        self.ui_font=get_font(self.ui_font_key)
 
         # 아이템 이미지 로드 (SCALE 적용)
         self.item_images = {}
         item_size = (int(80*SCALE), int(80*SCALE))  # 버튼 크기에 맞춤
-        
-        try:
-            swap_img = pygame.image.load(ASSET_PATHS['item_swap']).convert_alpha()
-            self.item_images['swap'] = pygame.transform.smoothscale(swap_img, item_size)
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"SWAP 아이템 이미지 로드 실패: {e}")
-            self.item_images['swap'] = None
-        
-        try:
-            raise_img = pygame.image.load(ASSET_PATHS['item_raise']).convert_alpha()
-            self.item_images['raise'] = pygame.transform.smoothscale(raise_img, item_size)
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"RAISE 아이템 이미지 로드 실패: {e}")
-            self.item_images['raise'] = None
-        
-        try:
-            rainbow_img = pygame.image.load(ASSET_PATHS['item_rainbow']).convert_alpha()
-            self.item_images['rainbow'] = pygame.transform.smoothscale(rainbow_img, item_size)
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"RAINBOW 아이템 이미지 로드 실패: {e}")
-            self.item_images['rainbow'] = None
+
+        # 아이콘은 game_atlas 에 묶여 있어서 여기 있는 건 아틀라스 영역(subsurface)
+        game_atlas()
+        for item_type in ITEM_TYPES:
+            self.item_images[item_type] = assets.image(f'item_{item_type}', item_size)
 
         # 아이템 버튼 초기화
         self.init_item_buttons()
 
-        self.load_stage(self.current_stage)
-
-    def load_stage(self,stage_index:int)->None:
-        stage_map=load_stage_from_csv(stage_index)
-
-        if not stage_map or all(all(cell=='.' for cell in row) for row in stage_map):
-            next_csv_path=f'assets/map_data/stage{stage_index+2}.csv'
-            if not os.path.exists(next_csv_path):
-                self.running=False
-                return
-
-        self.grid.wall_offset=0
-        self.grid.y_offset=self.grid_y_offset
-
-        self.grid.load_from_stage(stage_map)
-
-        self.current_bubble=None
-        self.next_bubble=None
-        self.fire_in_air=False
-        self.fire_count=0
-
-        self.prepare_bubbles()
-
-    def random_color_from_map(self)->str:
-        colors=set()
-        for bubble in self.grid.bubble_list:
-            if bubble.color in COLORS:
-                colors.add(bubble.color)
-        if not colors:
-            colors=set(COLORS.keys())
-        return random.choice(list(colors))
-
-    def create_bubble(self)->Bubble:
-        color=self.random_color_from_map()
-        b=Bubble(self.cannon.x,self.cannon.y,color)
-        return b
-
-    def prepare_bubbles(self)->None:
-        if self.next_bubble is not None:
-            self.current_bubble=self.next_bubble
-        else:
-            self.current_bubble=self.create_bubble()
-        self.current_bubble.x,self.current_bubble.y=self.cannon.x,self.cannon.y
-        self.current_bubble.in_air=False
-        self.next_bubble=self.create_bubble()
+        # 규칙/상태는 전부 엔진이 가짐 (그리드, 발사대는 그리기 가능한 클래스로 주입)
+        self.engine:GameEngine=GameEngine(grid=grid,cannon=cannon,stage_loader=prefetcher.stage_map,
+                                            defer_stage_load=True)
+            # 클리어 배너에 클리어된 판을 깔아야 해서 다음 스테이지는 begin_stage_clear 에서 올림
+        self.grid:HexGrid=self.engine.grid
+        self.cannon:Cannon=self.engine.cannon
+        self.game_over_line=self.engine.game_over_line
+        self.save_prev_state()
+
+        # 프레임 루프는 SceneManager 가 돌림. 여기는 틱 누산기와 다음 틱에 넘길 입력만 가짐
+        self.accumulator:float=0.0
+        self.alpha:float=0.0
+        self.pending_fire:bool=False
+        self.pending_item:Itemtype=Itemtype.NONE
+
+        # 스테이지 클리어 배너/종료 화면은 루프를 막지 않는 시간 상태로 진행
+        self.timeline:Timeline=Timeline()
+        self.banners:dict={}
+            # 타임라인 단계 이름 -> 미리 합성한 배너 화면
+        self.shown_banner:Optional[str]=None
+            # 이미 화면에 올린 배너 (같은 배너는 다시 안 올림)
+        self.ending:bool=False
+        self.finished:bool=False
+            # 종료 화면까지 끝났는지 (GameSceneWrapper 가 보고 메뉴로 돌아감)
+
+        # 정적 배경 레이어 (get_static_layer 에서 필요할 때 생성)
+        self.static_layer:Optional[pygame.Surface]=None
+        self.static_layer_key=None
+        self.board_layer:Optional[pygame.Surface]=None
+            # 정적 배경 + 붙어 있는 버블 (get_board_layer)
+        self.board_layer_key=None
+
+        # HUD 처럼 여러 개를 한 번에 그리는 것들용
+        self.render_queue=RenderQueue()
+
+        # 바뀐 영역만 화면에 올림
+        self.dirty=DirtyRectTracker(self.screen.get_size())
+
+    # ======== 엔진 상태 위임 ========
+    @property
+    def running(self)->bool:
+        return self.engine.running
+
+    @running.setter
+    def running(self,value:bool)->None:
+        self.engine.running=value
+
+    @property
+    def current_stage(self)->int:
+        return self.engine.current_stage
+
+    @property
+    def current_bubble(self)->Optional[Bubble]:
+        return self.engine.current_bubble
+
+    @property
+    def next_bubble(self)->Optional[Bubble]:
+        return self.engine.next_bubble
 
     def init_item_buttons(self)->None:
         # SCALE 적용
@@ -616,65 +387,59 @@ class Game:
                 break
 
     def handle_item_button_click(self,item_type:str)->None:
-        # 아이템 수량 0개면 그냥 무시
-        if item_type=='swap' and self.item_swap_count<=0:
-            print("No SWAP items left.")
-            return
-        if item_type=='raise' and self.item_raise_count<=0:
-            print("No RAISE items left.")
-            return
-        if item_type=='rainbow' and self.item_rainbow_count<=0:
-            print("No RAINBOW items left.")
-            return
-
         # 로직 적용 (UI 클릭하면 그 순간 바로 효과 반영함)
-        if item_type=='swap':
-            self.use_item_swap()
-        elif item_type=='raise':
-            self.use_item_raise()
-        elif item_type=='rainbow':
-            self.use_item_rainbow()
+        # 수량 0개면 엔진이 알아서 무시함
+        if not self.engine.use_item(Itemtype(item_type)):
+            return
 
         # 버튼 눌림 연출용 타이머 설정 (120ms 정도 유지)
         now=pygame.time.get_ticks()
         self.item_button_pressed_until[item_type]=now+120
 
+    def item_count(self,item_type:str)->int:
+        if item_type=='swap':
+            return self.engine.item_swap_count
+        if item_type=='raise':
+            return self.engine.item_raise_count
+        return self.engine.item_rainbow_count
+
     def draw_item_buttons(self,screen:pygame.Surface)->None:
         now=pygame.time.get_ticks()
 
+        # 아이콘은 아틀라스에서 한 번에 그리고, 테두리/개수는 그 위에 그림
+        atlas=game_atlas()
+        for btn in self.item_buttons:
+            if self.item_images.get(btn['type']):
+                self.render_queue.push_atlas(atlas,f"item_{btn['type']}",topleft=btn['rect'].topleft)
+        self.render_queue.flush(screen)
+
         for btn in self.item_buttons:
             rect=btn['rect']
             item_type=btn['type']
             pressed=now<self.item_button_pressed_until[item_type]
+            self.dirty.track(item_type,rect,(pressed,self.item_count(item_type)))
 
             # 아이템 이미지가 있으면 이미지 사용, 없으면 기존 방식
             item_img = self.item_images.get(item_type)
-            
+
             if item_img:
-                # 이미지 표시
-                screen.blit(item_img, rect)
-                
                 # 눌림 효과: 테두리 강조
                 border_color = (255, 255, 100) if pressed else (220, 220, 220)
                 border_w = 4 if pressed else 2
                 pygame.draw.rect(screen, border_color, rect, border_w)
-                
+
                 # 남은 개수 표시 (이미지 위에)
-                if item_type=='swap':
-                    cnt=self.item_swap_count
-                elif item_type=='raise':
-                    cnt=self.item_raise_count
-                else: # rainbow
-                    cnt=self.item_rainbow_count
-                
+                cnt=self.item_count(item_type)
+
                 # 개수를 오른쪽 하단에 표시
-                cnt_surf=self.ui_font.render(str(cnt),True,(255,255,0))
-                cnt_rect=cnt_surf.get_rect(bottomright=(rect.right-5, rect.bottom-5))
-                
+                digits=digit_strip(self.ui_font_key,(255,255,0))
+                cnt_rect=pygame.Rect((0,0),digits.size(cnt))
+                cnt_rect.bottomright=(rect.right-5, rect.bottom-5)
+
                 # 개수 배경 (가독성 향상)
                 bg_rect = cnt_rect.inflate(4, 4)
                 pygame.draw.rect(screen, (0, 0, 0), bg_rect)
-                screen.blit(cnt_surf, cnt_rect)
+                digits.blit(screen, cnt, topleft=cnt_rect.topleft)
             else:
                 # 이미지 없을 때 기존 방식 (텍스트)
                 pygame.draw.rect(screen,(30,30,30),rect)
@@ -684,294 +449,191 @@ class Game:
                 # 라벨 + 남은 개수
                 if item_type=='swap':
                     label='SWAP'
-                    cnt=self.item_swap_count
                 elif item_type=='raise':
                     label='RAISE'
-                    cnt=self.item_raise_count
                 else: # rainbow
                     label='RAIN'
-                    cnt=self.item_rainbow_count
+                cnt=self.item_count(item_type)
 
-                text_surf=self.ui_font.render(label,True,(255,255,255))
+                text_surf=text_cache.render(self.ui_font_key,label,(255,255,255))
                 text_rect=text_surf.get_rect(center=(rect.centerx,rect.centery-14))
                 screen.blit(text_surf,text_rect)
 
-                cnt_surf=self.ui_font.render(str(cnt),True,(255,255,0))
-                cnt_rect=cnt_surf.get_rect(center=(rect.centerx,rect.centery+18))
-                screen.blit(cnt_surf,cnt_rect)
-
-    def process_collision_and_attach(self)->bool:
-        if self.current_bubble is None:
-            return False
-
-        if self.current_bubble.y-self.current_bubble.radius<=(
-            self.grid.y_offset+self.grid.wall_offset
-        ):
-            r,c=self.grid.nearest_grid_to_point(self.current_bubble.x,self.current_bubble.y)
-            r=0
-            self.grid.place_bubble(self.current_bubble,r,c)
-
-            popped_count=self.pop_if_match(r,c)
-            if popped_count==0:
-                if hasattr(self,'tap_sound') and self.tap_sound:
-                    try:
-                        self.tap_sound.play()
-                    except:
-                        pass
-            return True
-
-        for b in self.grid.bubble_list:
-            dist=math.hypot(self.current_bubble.x-b.x,self.current_bubble.y-b.y)
-            if dist<=self.current_bubble.radius+b.radius-2:
-                r,c=self.grid.nearest_grid_to_point(self.current_bubble.x,self.current_bubble.y)
-                self.grid.place_bubble(self.current_bubble,r,c)
-
-                popped_count=self.pop_if_match(r,c)
-                if popped_count==0:
-                    if hasattr(self,'tap_sound') and self.tap_sound:
-                        try:
-                            self.tap_sound.play()
-                        except:
-                            pass
-                return True
-
-        # 장애물 충돌 검사
-        for ob in self.grid.obs_list:
-            dist=math.hypot(self.current_bubble.x-ob.x,self.current_bubble.y-ob.y)
-            if dist<=self.current_bubble.radius+ob.radius-2:
-                r,c=self.grid.nearest_grid_to_point(self.current_bubble.x,self.current_bubble.y)
-                self.grid.place_bubble(self.current_bubble,r,c)
-
-                # 장애물 근처에 붙어도 매칭 체크는 해야 함
-                popped_count=self.pop_if_match(r,c)
-                if popped_count==0:
-                    if hasattr(self,'tap_sound') and self.tap_sound:
-                        try:
-                            self.tap_sound.play()
-                        except:
-                            pass
-
-                return True
-
-        return False
-
-    def pop_if_match(self,row:int,col:int)->int:
-        if self.current_bubble is None:
-            return 0
-
-        if not self.grid.is_in_bounds(row,col):
-            return 0
-
-        color=self.grid.map[row][col]
-        if color not in COLORS:
-            return 0
-
-        visited=set()
-        self.grid.dfs_same_color(row,col,color,visited)
-
-        if len(visited)>=3:
-            self.grid.remove_cells(visited)
-            self.grid.remove_hanging()
-            self.score_ui.add(len(visited)*10)
-
-            if hasattr(self,'pop_sounds') and self.pop_sounds:
+                digit_strip(self.ui_font_key,(255,255,0)).blit(
+                    screen,cnt,center=(rect.centerx,rect.centery+18))
+
+    def play_step_sounds(self,result:StepResult)->None:
+        if result.popped>0:
+            if self.pop_sounds:
                 random_sound=random.choice(self.pop_sounds)
                 try:
                     random_sound.play()
                 except:
                     pass
+        elif result.attached:
+            if self.tap_sound:
+                try:
+                    self.tap_sound.play()
+                except:
+                    pass
 
-            return len(visited)
-        return 0
-
-    def update(self)->None:
-        for event in pygame.event.get():
+    def handle_events(self,events)->None:
+        """이번 프레임 pygame 이벤트 처리. 발사/아이템은 다음 틱의 입력으로 모아 둠."""
+        for event in events:
             if event.type==pygame.QUIT:
                 self.running=False
             elif event.type==pygame.KEYDOWN:
                 if event.key==pygame.K_SPACE:
-                    if self.current_bubble and not self.fire_in_air:
-                        self.fire_in_air=True
-                        self.current_bubble.in_air=True
-                        self.current_bubble.set_angle(self.cannon.angle)
+                    self.pending_fire=True
                 # --- 특수 아이템 테스트용 단축키 ---
                 # FIXME: 키보드 1/2/3 --> 바로 아이템 사용
                 # FIXME: 마우스 왼쪽 버튼 클릭 --> handle_mouse_click() 호출
                     # --> 버튼 클릭하면 아이템 사용
                 elif event.key==pygame.K_1:
-                    self.use_item_swap()
+                    self.pending_item=Itemtype.SWAP
                 elif event.key==pygame.K_2:
-                    self.use_item_raise()
+                    self.pending_item=Itemtype.RAISE
                 elif event.key==pygame.K_3:
-                    self.use_item_rainbow()
+                    self.pending_item=Itemtype.RAINBOW
 
             elif event.type==pygame.MOUSEBUTTONDOWN and event.button==1:
                 self.handle_mouse_click(event.pos)
 
+    def read_action(self)->Action:
+        """모아 둔 이벤트 입력 + 키 상태를 엔진 입력으로 변환."""
+        action=Action()
+        action.fire=self.pending_fire
+        action.item=self.pending_item
+        self.pending_fire=False
+        self.pending_item=Itemtype.NONE
 
         keys=pygame.key.get_pressed()
         if keys[pygame.K_LEFT]:
-            self.cannon.rotate(+self.cannon.angle_speed)
+            action.rotate+=self.cannon.angle_speed
         if keys[pygame.K_RIGHT]:
-            self.cannon.rotate(-self.cannon.angle_speed)
-
-        if self.current_bubble and self.fire_in_air:
-            self.current_bubble.move()
-
-            if self.current_bubble.y<-BUBBLE_RADIUS:
-                self.fire_in_air=False
-                self.prepare_bubbles()
-                return
-            # --- 특수 아이템 플래그 처리(임시) ---
-            # 플래그 방식 안 쓸 예정이라 지움.
-            # AttributeError 터질 것 같음.
-            # --------------------------
-            if self.process_collision_and_attach():
-                self.fire_count+=1
-                if self.fire_count>=LAUNCH_COOLDOWN:
-                    self.grid.drop_wall()
-                    self.fire_count=0
-                self.current_bubble=None
-                self.fire_in_air=False
-                self.prepare_bubbles()
-
-        if self.is_stage_cleared():
-            self.show_stage_clear()
-            self.current_stage+=1
-            next_csv_path=f'assets/map_data/stage{self.current_stage+1}.csv'
-            if not os.path.exists(next_csv_path):
-                self.running=False
-                print("All stages cleared!")
-            else:
-                self.load_stage(self.current_stage)
-
-        if self.lowest_bubble_bottom()>self.game_over_line:
-            self.running=False
-            print("Game Over")
-
-    def is_stage_cleared(self)->bool:
-        for r in range(self.grid.rows):
-            if r>=len(self.grid.map):
-                continue
-            for c in range(self.grid.cols):
-                if c>=len(self.grid.map[r]):
-                    continue
-                if self.grid.map[r][c] in COLORS:
-                    return False
-        return True
-
-    def lowest_bubble_bottom(self)->int:
-        if not self.grid.bubble_list:
-            return 0
-        bottoms=[b.y+b.radius for b in self.grid.bubble_list]
-        return int(max(bottoms))
+            action.rotate-=self.cannon.angle_speed
+        return action
 
-    def use_item_swap(self)->None:
-        """현재 버블과 다음 버블 스왑함.
-        """
-        if self.item_swap_count<=0:
-            print("No SWAP items left.")
-            return
-        if self.current_bubble is None or self.next_bubble is None:
-            print("Cannot swap: one of the bubbles is missing.")
+    def update(self)->None:
+        """고정 틱 한 번 진행."""
+        action=self.read_action()
+        if not self.running:
             return
 
-        # 색깔만 스왑: 필요하면 나중에 속성도 같이 스왑하면 될 것 같아요.
-        self.current_bubble.color,self.next_bubble.color=self.next_bubble.color,self.current_bubble.color
-
-        self.item_swap_count-=1
-        print(f"SWAP used. Remaining: {self.item_swap_count}")
+        self.save_prev_state()
+        result=self.engine.step(action)
+        self.play_step_sounds(result)
 
-    def use_item_raise(self)->None:
-        """벽을 한 줄 올림.
-        """
-        if self.item_raise_count<=0:
-            print("No RAISE items left.")
-            return
+        if result.stage_cleared:
+            self.begin_stage_clear(result.cleared_stage)
 
-        # HexGrid에 위임
-        before_offset=self.grid.wall_offset
-        self.grid.raise_wall()
-
-        if self.grid.wall_offset==before_offset:
-            print("Cannot RAISE: wall is already at the top.")
-            return
+    def save_prev_state(self)->None:
+        """렌더 보간용으로 틱 진행 전 상태 저장."""
+        self.prev_cannon_angle=self.cannon.angle
+        self.prev_shot=self.engine.shot
+        self.prev_shot_travel=self.engine.shot_travel
 
-        self.item_raise_count-=1
-        print(f"RAISE used. Remaining: {self.item_raise_count}")
+    def interpolated_bubble_pos(self,alpha:float)->Optional[Tuple[float,float]]:
+        """이전 틱과 현재 틱 사이(alpha) 의 날아가는 버블 위치. 경로를 따라 보간해서 반사 지점도 안 깎임."""
+        shot=self.engine.shot
+        if shot is None or not self.engine.fire_in_air:
+            return None
+        prev_travel=self.prev_shot_travel if self.prev_shot is shot else 0.0
+        travel=prev_travel+(self.engine.shot_travel-prev_travel)*alpha
+        return shot.position_at(travel)
 
-    def best_color_for_rainbow(self)->str:
-        """현재 맵에서 가장 많이 남아있는 색 선택함.
-
-        Returns:
-            str: 가장 많이 등장한 색을 반환
-        """
-        color_count:dict[str,int]={}
-
-        for b in self.grid.bubble_list:
-            if b.color in COLORS:
-                color_count[b.color]=color_count.get(b.color,0)+1
-
-        # 맵 거의 비어있으면 그냥 랜덤 색
-        if not color_count:
-            return random.choice(list(COLORS.keys()))
-        # 가장 많이 등장한 색 반환함.
-        best=max(color_count,key=color_count.get)
-        return best
-
-    def use_item_rainbow(self)->None:
-        # FIXME: 일단 현재 버블을 상황에 맞는 색으로 바꾸게끔 구현 (B안 적용)
-        """현재 버블
-        """
-        if self.item_rainbow_count<=0:
-            print("No RAINBOW items left.")
-            return
-        if self.current_bubble is None:
-            print("Cannot use RAINBOW: current bubble is missing.")
-            return
+    def is_stage_cleared(self)->bool:
+        return self.grid.is_stage_cleared()
 
-        # 변환 전 색상 저장
-        original_color = self.current_bubble.color
-        
-        # 최적 색상으로 변환
-        best_color = self.best_color_for_rainbow()
-        self.current_bubble.color = best_color
+    def lowest_bubble_bottom(self)->int:
+        return self.grid.lowest_bubble_bottom()
+
+    def memory_bytes(self)->int:
+        """이 판이 따로 들고 있는 Surface 크기 (화면 크기 레이어, 배너, 발사대 회전 캐시). 공유 에셋은 제외."""
+        surfaces=[self.static_layer,self.board_layer,self.grid.layer,*self.banners.values()]
+        total=sum(surface_bytes(s) for s in surfaces if s is not None)
+        if self.cannon.rotation_cache is not None:
+            total+=self.cannon.rotation_cache.used_bytes
+        return total
+
+    def get_static_layer(self)->pygame.Surface:
+        """스테이지 중에 안 바뀌는 배경 요소를 합성한 레이어. 해상도/스테이지가 바뀔 때만 다시 만듦."""
+        key=(self.screen.get_size(),self.current_stage)
+        if self.static_layer is None or self.static_layer_key!=key:
+            self.static_layer=self.build_static_layer()
+            self.static_layer_key=key
+            self.dirty.mark_full()
+        return self.static_layer
+
+    def get_board_layer(self)->pygame.Surface:
+        """정적 레이어에 붙어 있는 버블/장애물까지 구운 불투명 레이어. 보드가 바뀔 때만 다시 합성해서
+        평소 프레임은 불투명 blit 한 번으로 배경과 보드를 같이 그림."""
+        static=self.get_static_layer()
+        grid=self.grid
+        if grid.layer_dirty or grid.layer is None or grid.layer.get_size()!=static.get_size():
+            grid.render_layer(static.get_size())
+        key=(self.static_layer_key,grid.layer_version)
+        if self.board_layer is None or self.board_layer_key!=key:
+            if self.board_layer is None or self.board_layer.get_size()!=static.get_size():
+                self.board_layer=static.copy()
+            else:
+                self.board_layer.blit(static,(0,0))
+            grid.draw(self.board_layer)
+            self.board_layer_key=key
+        return self.board_layer
 
-        self.item_rainbow_count -= 1
-        
-        # 변환 전후 색상 출력
-        print(f"🌈 RAINBOW: {original_color} → {best_color}")
-        print(f"RAINBOW used. Remaining: {self.item_rainbow_count}")
+    def build_static_layer(self)->pygame.Surface:
+        layer=pygame.Surface(self.screen.get_size()).convert()
 
-    def draw(self)->None:
         if self.background_image:
-            self.screen.blit(self.background_image,(0,0))
+            layer.blit(self.background_image,(0,0))
         else:
-            self.screen.fill((10,20,30))
+            layer.fill((10,20,30))
 
-        pygame.draw.rect(self.screen,(0,100,200),self.game_rect)
+        pygame.draw.rect(layer,(0,100,200),self.game_rect)
 
-        pygame.draw.line(self.screen,(0,255,3),
+        pygame.draw.line(layer,(0,255,3),
                          (self.game_rect.left,self.game_over_line),
                          (self.game_rect.right,self.game_over_line),10)
 
-        self.grid.draw(self.screen)
-        self.cannon.draw(self.screen)
-        if self.current_bubble:
-            self.current_bubble.draw(self.screen)
-
+        # 캐릭터/로고는 게임 영역 밖이라 버블보다 먼저 그려도 겹치지 않음
         if self.char_left:
             char_left_x = self.game_rect.left - int(419*SCALE)
             char_left_y = SCREEN_HEIGHT - int(617*SCALE)
-            self.screen.blit(self.char_left,(char_left_x, char_left_y))
+            layer.blit(self.char_left,(char_left_x, char_left_y))
         if self.char_right:
             char_right_x = self.game_rect.right + int(80*SCALE)
             char_right_y = SCREEN_HEIGHT - int(617*SCALE)
-            self.screen.blit(self.char_right,(char_right_x, char_right_y))
+            layer.blit(self.char_right,(char_right_x, char_right_y))
         if self.logo:
             logo_x = SCREEN_WIDTH - int(198*SCALE)
             logo_y = int(18*SCALE)
-            self.screen.blit(self.logo,(logo_x, logo_y))
+            layer.blit(self.logo,(logo_x, logo_y))
+
+        return layer
+
+    def draw(self,alpha:float=1.0)->None:
+        """화면 그리기.
+
+        Args:
+            alpha: 이전 틱 → 현재 틱 사이 보간 비율 (0.0~1.0)
+        """
+        if self.timeline:
+            self.draw_banner(self.timeline.current)
+            return
+
+        # 배경, 게임 영역, 게임오버 라인, 캐릭터, 로고, 붙어 있는 버블은 미리 합성한 레이어 한 장으로 그림
+        self.screen.blit(self.get_board_layer(),(0,0))
+
+        dirty=self.dirty
+        dirty.track('grid',self.grid.layer_rect,self.grid.layer_version)
+        angle=self.prev_cannon_angle+(self.cannon.angle-self.prev_cannon_angle)*alpha
+        dirty.track('cannon',self.cannon.draw(self.screen,angle),angle)
+        if self.current_bubble:
+            rect=self.current_bubble.draw(self.screen,self.interpolated_bubble_pos(alpha))
+            dirty.track('bubble',rect,self.current_bubble.color)
+        else:
+            dirty.forget('bubble')
 
         if self.next_bubble:
             # NEXT 버블 위치를 config.py 설정값 사용 (스케일 적용)
@@ -979,71 +641,145 @@ class Game:
             next_y_offset = int(NEXT_BUBBLE_Y_OFFSET * SCALE) if NEXT_BUBBLE_Y_OFFSET < 0 else int(NEXT_BUBBLE_Y_OFFSET * SCALE)
             next_y = SCREEN_HEIGHT + next_y_offset if NEXT_BUBBLE_Y_OFFSET < 0 else next_y_offset
 
-            try:
-                font_size = int(40 * SCALE)
-                font = pygame.font.Font(ASSET_PATHS['font'], font_size) if ASSET_PATHS['font'] else pygame.font.Font(None, font_size)
-            except:
-                font = pygame.font.Font(None, int(40 * SCALE))
-            next_txt = font.render("NEXT", True, (0,0,0))
+            next_txt = text_cache.render(asset_font(40 * SCALE), "NEXT", (0,0,0))
             next_txt_offset_y = int(70 * SCALE)
             next_txt_rect = next_txt.get_rect(center=(next_x, next_y - next_txt_offset_y))
-            self.screen.blit(next_txt, next_txt_rect)
+            rect=self.screen.blit(next_txt, next_txt_rect)
 
-            original_x, original_y = self.next_bubble.x, self.next_bubble.y
-            self.next_bubble.x, self.next_bubble.y = next_x, next_y
-            self.next_bubble.draw(self.screen)
-            self.next_bubble.x, self.next_bubble.y = original_x, original_y
+            rect=rect.union(self.next_bubble.draw(self.screen,(next_x, next_y)))
+            dirty.track('next',rect,self.next_bubble.color)
+        else:
+            dirty.forget('next')
 
-        self.score_ui.draw(self.screen,self.current_stage+1)
+        self.score_ui.score=self.engine.score
+        rect=self.score_ui.draw(self.screen,self.current_stage+1)
+        dirty.track('score',rect,(self.score_ui.score,self.current_stage))
 
         self.draw_item_buttons(self.screen)
             # 아이템 버튼 그리기.
 
-        pygame.display.flip()
+        dirty.present()
 
-    def show_stage_clear(self)->None:
+    def begin_stage_clear(self,stage_index:int)->None:
+        """클리어 배너 시작. 배너가 떠 있는 동안 시뮬레이션은 멈추고 루프/이벤트는 계속 돎."""
+        # 엔진은 아직 클리어된 판을 들고 있음. 마지막 팝/낙하까지 반영된 보드 레이어 위에 배너를 한 번만 합성해 둠
+        banner=self.get_board_layer().copy()
         overlay=pygame.Surface((SCREEN_WIDTH,SCREEN_HEIGHT))
         overlay.set_alpha(200)
         overlay.fill((0,0,0))
-        self.screen.blit(overlay,(0,0))
+        banner.blit(overlay,(0,0))
 
-        font=pygame.font.Font(ASSET_PATHS['font'],120)
-        text=font.render('CLEAR!',True,(100,255,100))
+        text=text_cache.render(asset_font(120),'CLEAR!',(100,255,100))
         rect=text.get_rect(center=(SCREEN_WIDTH//2,SCREEN_HEIGHT//2))
-        self.screen.blit(text,rect)
+        banner.blit(text,rect)
 
-        small_font=pygame.font.Font(ASSET_PATHS['font'],50)
-        info=small_font.render(
-            f'Stage {self.current_stage+1} Complete.',
-            True,
+        info=text_cache.render(
+            asset_font(50),
+            f'Stage {stage_index+1} Complete.',
             (200,200,200)
         )
         info_rect=info.get_rect(center=(SCREEN_WIDTH//2,SCREEN_HEIGHT//2+80))
-        self.screen.blit(info,info_rect)
+        banner.blit(info,info_rect)
 
-        pygame.display.flip()
-        pygame.time.delay(1000)
+        self.banners['stage_clear']=banner
+        self.timeline.add('stage_clear',STAGE_CLEAR_BANNER_MS,on_end=self.end_stage_clear)
 
-    def run(self)->None:
-        while self.running:
-            self.clock.tick(FPS)
-            self.update()
-            self.draw()
+        # 배너를 만든 뒤에 다음 스테이지를 올림. 그 다음 스테이지 CSV 는 배너 동안 워커가 파싱
+        if self.engine.running and self.engine.has_stage(self.current_stage):
+            self.engine.load_stage(self.current_stage)
+        if self.engine.has_stage(self.current_stage+1):
+            prefetcher.start(PrefetchPlan(stages=[self.current_stage+1]))
 
-        pygame.mixer.music.stop()
+    def end_stage_clear(self)->None:
+        self.banners.pop('stage_clear',None)
+        self.shown_banner=None
+        # 배너 동안 흐른 시간만큼 틱을 따라잡지 않게
+        self.accumulator=0.0
+        self.dirty.mark_full()
+
+    def begin_end_screen(self)->None:
+        """종료 화면 시작. 앞에 배너가 있으면 그게 끝난 뒤에 보임."""
+        self.ending=True
 
-        self.screen.fill((0,0,0))
-        font=pygame.font.Font(ASSET_PATHS['font'],100)
+        screen=pygame.Surface(self.screen.get_size()).convert()
+        screen.fill((0,0,0))
 
-        next_csv_path=f'assets/map_data/stage{self.current_stage+1}.csv'
-        if not os.path.exists(next_csv_path):
+        if self.engine.won:
             msg="you win."
         else:
             msg="game over."
 
-        txt=font.render(msg,True,(255,255,255))
+        txt=text_cache.render(asset_font(100),msg,(255,255,255))
         rect=txt.get_rect(center=(SCREEN_WIDTH//2,SCREEN_HEIGHT//2))
-        self.screen.blit(txt,rect)
+        screen.blit(txt,rect)
+
+        self.banners['end']=screen
+        # BGM 은 종료 화면이 실제로 뜰 때 끔 (앞의 클리어 배너 동안은 계속 나옴)
+        self.timeline.add('end',END_SCREEN_DELAY,on_end=self.finish,on_start=self.stop_music)
+
+    def stop_music(self)->None:
+        pygame.mixer.music.stop()
+
+    def finish(self)->None:
+        self.finished=True
+
+    def draw_banner(self,name:str)->None:
+        """타임라인 단계 배너. 처음 한 프레임만 화면에 올리고 나머지 프레임은 다음 스테이지 준비."""
+        if self.shown_banner!=name:
+            self.screen.blit(self.banners[name],(0,0))
+            self.shown_banner=name
+            self.dirty.mark_full()
+            self.dirty.present()
+        elif name=='stage_clear':
+            # 배너 뒤에서 다음 스테이지 배경/버블 레이어를 미리 만들어 둠 (화면에는 안 올림)
+            self.get_board_layer()
+
+    def pause(self)->None:
+        """오버레이가 올라오거나 창이 뒤로 갔을 때: 시뮬레이션/BGM/효과음 정지. 보드와 에셋은 그대로 둠."""
+        if self.engine.state==GameState.PLAYING:
+            self.engine.state=GameState.PAUSED
+        pygame.mixer.music.pause()
+        pygame.mixer.pause()
+
+    def unpause(self)->None:
+        """오버레이가 걷히거나 창이 돌아왔을 때: 멈춘 시점부터 바로 이어서 진행."""
+        if self.engine.state==GameState.PAUSED:
+            self.engine.state=GameState.PLAYING
+        pygame.mixer.music.unpause()
+        pygame.mixer.unpause()
+        # 멈춰 있던 시간만큼 틱을 따라잡지 않게. 멈추기 직전에 모아 둔 발사/아이템 입력은 그대로 이어서 처리
+        self.accumulator=0.0
+        # 오버레이가 배너도 덮었으므로 다시 올리게 함
+        self.shown_banner=None
+        # 오버레이가 화면 전체를 덮었으므로 다음 프레임은 전체 갱신
+        self.dirty.mark_full()
+
+    def advance(self,dt_ms:float)->None:
+        """지난 프레임 이후 흐른 시간만큼 고정 틱 진행.
+
+        고정 틱 누산기: 로직은 항상 SIM_TICK_RATE 로 돌리고, 그리기는 모니터 속도대로.
+        느린 기기에서는 한 프레임에 여러 틱을 돌리되 MAX_CATCH_UP_STEPS 를 넘으면 버림.
+        다음 draw 에 넘길 보간 비율은 self.alpha 에 남김.
+        게임이 끝나면 종료 화면을 타임라인에 올리고, 다 보여 주면 self.finished 가 True.
+        """
+        if self.timeline:
+            # 배너/종료 화면 동안은 시뮬레이션 정지
+            self.timeline.update(dt_ms)
+            return
+
+        tick_ms=1000.0/SIM_TICK_RATE
+        self.accumulator+=dt_ms
+
+        steps=0
+        while (self.accumulator>=tick_ms and steps<MAX_CATCH_UP_STEPS
+               and self.running and not self.timeline):
+            self.update()
+            self.accumulator-=tick_ms
+            steps+=1
+        if steps>=MAX_CATCH_UP_STEPS:
+            self.accumulator=min(self.accumulator,tick_ms)
+
+        self.alpha=min(1.0,self.accumulator/tick_ms)
 
-        pygame.display.flip()
-        pygame.time.delay(END_SCREEN_DELAY)
+        if not self.running and not self.ending:
+            self.begin_end_screen()
@@ -1,13 +1,114 @@
+import pygame
 from game import Game
+from game_settings import BACKGROUND_WAIT_MS,POWER_SAVE_ON_FOCUS_LOSS,RENDER_FPS_LIMIT
+
+# 창이 뒤로 가거나 다시 앞으로 올 때 오는 이벤트
+BACKGROUND_EVENTS=(pygame.WINDOWFOCUSLOST,pygame.WINDOWMINIMIZED,pygame.WINDOWHIDDEN)
+FOREGROUND_EVENTS=(pygame.WINDOWFOCUSGAINED,pygame.WINDOWRESTORED,pygame.WINDOWSHOWN)
 
 class GameSceneWrapper:
+    """Game 을 SceneManager 루프에 붙이는 씬. 들어올 때마다 새 판으로 시작."""
+    fps=RENDER_FPS_LIMIT
+
     def __init__(self,manager):
         self.manager=manager
+        self.game=None
+        self.background=False
+            # 창이 포커스를 잃었거나 최소화돼서 절전 중인지
+        self.woke=False
+            # 방금 절전에서 깨어난 프레임인지 (그 프레임 dt 에는 잠든 시간이 들어 있음)
+
+    def enter(self):
+        self.game=Game()
+        self.background=False
+
+    def resume(self):
+        # 게임은 끝나고 나서야 나가므로 다시 들어오면 새로 시작
+        self.game=Game()
+        self.background=False
+
+    @staticmethod
+    def stop_audio():
+        # 일시정지 중에 나가면 효과음 채널도 멈춘 채로 남아서 다음 판 unpause 때 다시 울림
+        pygame.mixer.music.stop()
+        pygame.mixer.stop()
+
+    def suspend(self):
+        # 일시정지 메뉴에서 메뉴로 나간 경우에도 BGM/효과음이 남지 않게
+        self.stop_audio()
+        self.game=None
+
+    def exit(self):
+        self.stop_audio()
+        self.game=None
+
+    def memory_bytes(self):
+        return self.game.memory_bytes() if self.game is not None else 0
+
+    def cover(self):
+        # 일시정지 같은 오버레이가 위에 올라옴: Game 은 그대로 두고 멈추기만 함
+        self.game.pause()
+
+    def uncover(self):
+        # 오버레이를 키 입력으로 닫았으니 창은 앞에 있음
+        self.background=False
+        self.game.unpause()
+
+    # ======== 절전 ========
+    def idle_timeout(self):
+        # 절전 중에는 고정 FPS 로 돌지 않고 포커스가 돌아오는 이벤트를 기다리며 잠듦
+        return BACKGROUND_WAIT_MS if self.background else None
+
+    def enter_background(self):
+        if self.background:
+            return
+        self.background=True
+        self.game.pause()
+
+    def leave_background(self):
+        if not self.background:
+            return
+        self.background=False
+        self.woke=True
+        self.game.unpause()
+
+    def handle_events(self,events):
+        pause=False
+        forward=[]
+        for event in events:
+            if POWER_SAVE_ON_FOCUS_LOSS:
+                if event.type in BACKGROUND_EVENTS:
+                    self.enter_background()
+                elif event.type in FOREGROUND_EVENTS:
+                    self.leave_background()
+            if event.type==pygame.QUIT:
+                # 뒤로 간 창을 닫아도 절전을 풀어야 update 가 돌아서 종료 화면으로 넘어감
+                self.leave_background()
+            if event.type==pygame.KEYDOWN and event.key in (pygame.K_ESCAPE,pygame.K_p):
+                # 클리어 배너/종료 화면 중에는 일시정지할 게 없음
+                if not self.game.timeline:
+                    pause=True
+                continue
+            forward.append(event)
+        # 같은 프레임에 들어온 나머지 입력(발사, 아이템, 창 닫기)은 오버레이를 올리기 전에 넘김
+        self.game.handle_events(forward)
+        if pause and self.game.running:
+            self.manager.push_scene('pause')
 
-    def run(self):
-        # Game 내부에서 자체 루프 돌고 끝나면 run() 리턴됨
-        g=Game()
-        g.run()
+    def update(self,dt):
+        if self.background:
+            return
+        if self.woke:
+            # 잠들어 있던 시간은 따라잡지 않음 (날아가던 버블이 한 번에 튀지 않게)
+            self.woke=False
+            dt=0
+        self.game.advance(dt)
+        if self.game.finished:
+            # 종료 화면까지 보여 주고 나면 다시 메뉴로 돌아감
+            self.manager.change_scene('menu')
 
-        # 게임 끝나고 나면 다시 메뉴로 돌아감
-        return 'menu'
+    def draw(self):
+        # 안 보이는 창에는 그리지 않음
+        if self.background:
+            return
+        self.game.draw(self.game.alpha)
@@ -1,9 +1,51 @@
 # UI, 게임 세부 설정
 UI_ALPHA = 180
 END_SCREEN_DELAY = 300
+STAGE_CLEAR_BANNER_MS = 1000
+    # 스테이지 클리어 배너 표시 시간 (ms). 이 동안 다음 스테이지 레이어를 미리 만들어 둠
 
 # 사운드 볼륨 설정 (0.0-1.0)
 POP_SOUND_VOLUME = 0.3
     # 터트릴 때 효과음
 TAP_SOUND_VOLUME = 0.4
     # 달라붙을 때 효과음
+
+# 고정 시뮬레이션 틱 설정
+SIM_TICK_RATE = 60
+    # 초당 게임 로직 틱 수 (버블 속도, 발사대 회전 속도는 이 틱 기준, 기존 FPS=60 으로 튜닝됨)
+MAX_CATCH_UP_STEPS = 5
+    # 프레임이 밀렸을 때 한 프레임에서 따라잡는 최대 틱 수 (넘치는 시간은 버림)
+RENDER_FPS_LIMIT = 144
+    # 화면 그리기 최대 FPS (0이면 제한 없음)
+
+# 발사대 회전 이미지 캐시
+CANNON_ROTATION_STEP = 1.0
+    # 회전 각도 양자화 단위 (도). 발사대는 4도씩 움직이므로 1도면 원본과 동일
+CANNON_ROTATION_CACHE_MB = 16
+    # 회전된 발사대 이미지를 들고 있을 최대 메모리 (MB)
+
+# 화면 갱신
+DIRTY_RECT_FULL_FLIP_RATIO = 0.5
+    # 바뀐 영역 넓이가 화면의 이 비율을 넘으면 부분 갱신 대신 전체 flip
+TEXT_CACHE_MAX_ENTRIES = 256
+    # 렌더링한 텍스트 Surface 를 들고 있을 최대 개수 (오래 안 쓴 것부터 버림)
+
+# 스케일된 이미지 디스크 캐시
+ASSET_DISK_CACHE_ENABLED = True
+    # 한 번 스케일한 이미지 픽셀을 저장해 두고 다음 실행부터 PNG 디코딩/스케일 생략
+ASSET_DISK_CACHE_DIR = '.cache/scaled_assets'
+    # 캐시 폴더 (프로젝트 루트 기준, 해상도별 하위 폴더 생성)
+
+# 씬 캐시
+SCENE_CACHE_SIZE = 3
+    # SceneManager 가 들고 있을 씬 최대 개수 (메뉴/게임/에디터면 3이면 전부 재사용)
+SCENE_CACHE_MAX_MB = 64
+    # 씬들이 알려 준 메모리 합이 이걸 넘으면 오래 안 쓴 씬부터 버림
+IDLE_WAIT_MS = 1000
+    # 메뉴/에디터가 할 일 없을 때 입력을 기다리며 잠드는 최대 시간 (ms)
+POWER_SAVE_ON_FOCUS_LOSS = True
+    # 게임 중 창이 포커스를 잃거나 최소화되면 자동 일시정지 + 그리기/BGM 중지
+BACKGROUND_WAIT_MS = 500
+    # 절전 상태에서 게임 씬이 깨어나는 간격 (ms). 포커스가 돌아오는 이벤트가 오면 바로 깸
+FRAME_STATS_LOG_SECONDS = 0
+    # SceneManager 가 프레임 단계별 시간 (events/update/draw) 을 콘솔에 찍는 간격 (초, 0 이면 안 찍음)
@@ -0,0 +1,221 @@
+"""육각 그리드 좌표계. 게임 HexGrid, 에디터 EditorGrid, legacy 코드가 전부 여기를 씀.
+
+맵/CSV/그리드는 지금처럼 "홀수 행이 반 칸 오른쪽" 인 오프셋 좌표 (r,c) 를 그대로 쓰고,
+거리/링 계산은 axial (q,r) / cube (q,r,s) 좌표로 바꿔서 함. 이웃/링 오프셋은 행 홀짝별로
+미리 계산한 표를 씀 (홀짝만 같으면 (dr,dc) 가 같음).
+
+픽셀 -> 셀은 미리 계산한 보로노이 픽 표로 정확하게 찾음. 행 간격이 cell 이라서 어떤 점에서
+가장 가까운 셀 중심이 기준 셀에서 몇 행/몇 열 떨어져 있는지는 가로 cell, 세로 2*cell 주기로
+똑같이 반복됨. 그래서 한 주기 타일(cell x 2cell 픽셀)만 계산해 두면 나머지 연산과 표 조회 한 번이면 됨.
+wall_offset/화면 오프셋은 평행 이동이라 같은 표를 그대로 씀. 표는 픽셀 행 단위로 처음 필요할 때 만들고,
+픽셀마다 "가장 가까운 셀 + 그 6방향 이웃" 을 가까운 순서로 넣어 두므로 스냅 지점에서 가장 가까운
+빈 셀도 거리 계산 없이 앞에서부터 빈 칸을 찾기만 하면 됨 (최대 7칸).
+
+여러 점을 한 번에 바꾸는 cells_to_pixels/pixels_to_cells 는 같은 표를 써서 리스트로 돌려줌 (히트맵/통계 스크립트용).
+
+    picker=hex_picker(CELL_SIZE)
+    r,c=picker.pick(x-x_offset,y-y_offset)
+    rows,cols=pixels_to_cells(CELL_SIZE,xs,ys,x_offset,y_offset)
+"""
+import math
+from typing import Callable,Dict,List,Optional,Sequence,Tuple
+
+Cell=Tuple[int,int]
+Axial=Tuple[int,int]
+Cube=Tuple[int,int,int]
+
+# ======== 방향/이웃 표 ========
+NEIGHBOR_OFFSETS:Tuple[Tuple[Cell,...],Tuple[Cell,...]]=(
+    ((0,-1),(-1,-1),(-1,0),(0,1),(1,0),(1,-1)),
+        # 짝수 행: 좌, 좌상, 우상, 우, 우하, 좌하
+    ((0,-1),(-1,0),(-1,1),(0,1),(1,1),(1,0)),
+        # 홀수 행 (반 칸 오른쪽)
+)
+AXIAL_DIRECTIONS:Tuple[Axial,...]=((-1,0),(0,-1),(1,-1),(1,0),(0,1),(-1,1))
+    # NEIGHBOR_OFFSETS 와 같은 순서의 axial (dq,dr)
+
+def neighbor_offsets(r:int)->Tuple[Cell,...]:
+    """r 행 셀의 6방향 이웃 (dr,dc). 짝수/홀수 행마다 열 보정이 다름."""
+    return NEIGHBOR_OFFSETS[r&1]
+
+def neighbors(r:int,c:int)->List[Cell]:
+    """6방향 이웃 셀 (범위 검사 안 함)."""
+    return [(r+dr,c+dc) for dr,dc in NEIGHBOR_OFFSETS[r&1]]
+
+# ======== 오프셋 <-> axial/cube ========
+def offset_to_axial(r:int,c:int)->Axial:
+    return c-(r-(r&1))//2,r
+
+def axial_to_offset(q:int,r:int)->Cell:
+    return r,q+(r-(r&1))//2
+
+def offset_to_cube(r:int,c:int)->Cube:
+    q,r=offset_to_axial(r,c)
+    return q,r,-q-r
+
+def cube_to_offset(q:int,r:int,s:int)->Cell:
+    return axial_to_offset(q,r)
+
+def hex_distance(a:Cell,b:Cell)->int:
+    """오프셋 좌표 두 셀 사이 칸 수."""
+    aq,ar,as_=offset_to_cube(*a)
+    bq,br,bs=offset_to_cube(*b)
+    return max(abs(aq-bq),abs(ar-br),abs(as_-bs))
+
+# ======== 링 표 ========
+_ring_offsets:Dict[Tuple[int,int],Tuple[Cell,...]]={}
+    # (행 홀짝, 반지름) -> 그 거리에 있는 셀들의 (dr,dc)
+
+def ring_offsets(parity:int,radius:int)->Tuple[Cell,...]:
+    """홀짝이 parity 인 행의 셀에서 정확히 radius 칸 떨어진 셀들의 (dr,dc). 처음 한 번만 계산."""
+    key=(parity&1,radius)
+    offsets=_ring_offsets.get(key)
+    if offsets is None:
+        if radius==0:
+            offsets=((0,0),)
+        else:
+            r0=parity&1
+            q0,_=offset_to_axial(r0,0)
+            # axial 로 우하 방향 모서리까지 radius 칸 간 뒤 좌 -> 좌상 -> ... 순서로 radius 칸씩 돌기
+            q,r=q0+AXIAL_DIRECTIONS[4][0]*radius,r0+AXIAL_DIRECTIONS[4][1]*radius
+            cells=[]
+            for dq,dr in AXIAL_DIRECTIONS:
+                for _ in range(radius):
+                    rr,cc=axial_to_offset(q,r)
+                    cells.append((rr-r0,cc))
+                    q,r=q+dq,r+dr
+            offsets=tuple(cells)
+        _ring_offsets[key]=offsets
+    return offsets
+
+def ring(r:int,c:int,radius:int)->List[Cell]:
+    """(r,c) 에서 정확히 radius 칸 떨어진 셀들 (범위 검사 안 함)."""
+    return [(r+dr,c+dc) for dr,dc in ring_offsets(r,radius)]
+
+def spiral(r:int,c:int,radius:int)->List[Cell]:
+    """(r,c) 부터 radius 칸 안쪽 셀 전부, 가까운 링부터."""
+    out=[]
+    for k in range(radius+1):
+        out.extend(ring(r,c,k))
+    return out
+
+# 자주 쓰는 작은 링은 import 할 때 미리
+for _parity in (0,1):
+    for _radius in range(4):
+        ring_offsets(_parity,_radius)
+
+# ======== 셀 <-> 픽셀 ========
+def cell_center(cell:int,r:int,c:int)->Tuple[int,int]:
+    """오프셋 없는 셀 중심 (그리드는 여기에 x_offset, y_offset+wall_offset 을 더함)."""
+    x=c*cell+cell//2
+    y=r*cell+cell//2
+    if r&1:
+        x+=cell//2
+    return x,y
+
+# ======== 픽 표 ========
+PICK_NEARBY:List[Cell]=[(r,c) for r in range(-1,3) for c in range(-1,2)]
+    # 타일 안 점에서 가장 가까운 중심이 될 수 있는 셀 (기준 셀 (0,0) 기준)
+
+class HexPicker:
+    def __init__(self,cell:int)->None:
+        self.cell:int=cell
+        self.period_y:int=cell*2
+        self.rows:List[Optional[List[Tuple[Cell,...]]]]=[None]*self.period_y
+            # 타일 픽셀 행 ty -> tx 별 기준 셀(짝수 행) 기준 (dr,dc) 후보, 가까운 순.
+            # 처음 그 행이 필요할 때 만듦 (행 하나는 수십 번 계산이면 끝남)
+
+        # 기준 셀 (0,0) 주변 중심 좌표 (타일 밖 반 칸 + 그 이웃까지 넉넉히)
+        self._centers={(r,c):cell_center(cell,r,c) for r in range(-2,4) for c in range(-2,3)}
+        self._nearby=PICK_NEARBY
+        self._rings={rc:[rc]+neighbors(*rc) for rc in self._nearby}
+        self._used=sorted({rc for ring in self._rings.values() for rc in ring})
+        self._orders:Dict[Tuple[Cell,...],Tuple[Cell,...]]={}
+            # 같은 순서를 쓰는 픽셀끼리 튜플 하나를 공유
+
+    def _order_at(self,tx:int,row_centers)->Tuple[Cell,...]:
+        dist={rc:(tx-cx)**2+dy2 for rc,cx,dy2 in row_centers}
+        # 동점이면 원래 이웃 순서 유지 (min/sorted 는 앞쪽을 고름)
+        best=min(self._nearby,key=dist.__getitem__)
+        order=tuple(sorted(self._rings[best],key=dist.__getitem__))
+        return self._orders.setdefault(order,order)
+
+    def _build_row(self,ty:int)->List[Tuple[Cell,...]]:
+        cell=self.cell
+        row_centers=[(rc,self._centers[rc][0],(ty-self._centers[rc][1])**2) for rc in self._used]
+        row:List[Tuple[Cell,...]]=[()]*cell
+        # 한 행 안에서 두 중심까지 거리 차이는 x 에 대한 일차식이라 두 셀 순서는 한 번만 뒤집힘.
+        # 그래서 구간 양 끝 순서가 같으면 가운데도 전부 같음 -> 이분해서 바뀌는 곳만 계산
+        spans=[(0,cell-1,self._order_at(0,row_centers),self._order_at(cell-1,row_centers))]
+        while spans:
+            lo,hi,lo_order,hi_order=spans.pop()
+            if lo_order is hi_order:
+                row[lo:hi+1]=[lo_order]*(hi-lo+1)
+                continue
+            row[lo]=lo_order
+            row[hi]=hi_order
+            if hi-lo<=1:
+                continue
+            mid=(lo+hi)//2
+            mid_order=self._order_at(mid,row_centers)
+            spans.append((lo,mid,lo_order,mid_order))
+            spans.append((mid,hi,mid_order,hi_order))
+        self.rows[ty]=row
+        return row
+
+    def _lookup(self,x:float,y:float)->Tuple[int,int,Tuple[Cell,...]]:
+        c0,tx=divmod(math.floor(x),self.cell)
+        r2,ty=divmod(math.floor(y),self.period_y)
+        row=self.rows[ty]
+        if row is None:
+            row=self._build_row(ty)
+        return r2*2,c0,row[tx]
+
+    def candidates(self,x:float,y:float)->Tuple[Cell,...]:
+        """오프셋을 뺀 좌표 (x,y) 의 가장 가까운 셀과 그 이웃들 (절대 행/열, 가까운 순). 범위 검사 안 함."""
+        r0,c0,order=self._lookup(x,y)
+        return tuple((r0+dr,c0+dc) for dr,dc in order)
+
+    def pick(self,x:float,y:float)->Cell:
+        """오프셋을 뺀 좌표 (x,y) 에서 중심이 가장 가까운 셀. 범위 검사 안 함."""
+        r0,c0,order=self._lookup(x,y)
+        dr,dc=order[0]
+        return r0+dr,c0+dc
+
+    def nearest_matching(self,x:float,y:float,accept:Callable[[int,int],bool])->Optional[Cell]:
+        """가장 가까운 셀과 그 이웃 중 accept(r,c) 를 만족하는 가장 가까운 셀 (없으면 None)."""
+        r0,c0,order=self._lookup(x,y)
+        for dr,dc in order:
+            if accept(r0+dr,c0+dc):
+                return r0+dr,c0+dc
+        return None
+
+    def build_all(self)->None:
+        """모든 행을 미리 만듦 (시뮬레이션처럼 첫 조회 지연도 피하고 싶을 때)."""
+        for ty in range(self.period_y):
+            if self.rows[ty] is None:
+                self._build_row(ty)
+
+_pickers:Dict[int,HexPicker]={}
+
+def hex_picker(cell:int)->HexPicker:
+    """셀 크기별로 한 번만 만드는 공유 픽 테이블 (게임/에디터가 같이 씀)."""
+    picker=_pickers.get(cell)
+    if picker is None:
+        picker=HexPicker(cell)
+        _pickers[cell]=picker
+    return picker
+
+# ======== 배치 변환 ========
+def cells_to_pixels(cell:int,rows:Sequence[int],cols:Sequence[int],
+                    x_offset:float=0,y_offset:float=0)->Tuple[List[float],List[float]]:
+    """셀 여러 개의 중심 좌표 (xs, ys)."""
+    centers=[cell_center(cell,r,c) for r,c in zip(rows,cols)]
+    return [x+x_offset for x,_ in centers],[y+y_offset for _,y in centers]
+
+def pixels_to_cells(cell:int,xs:Sequence[float],ys:Sequence[float],
+                    x_offset:float=0,y_offset:float=0)->Tuple[List[int],List[int]]:
+    """점 여러 개에서 중심이 가장 가까운 셀 (rows, cols). HexPicker.pick 과 결과가 같음."""
+    picker=hex_picker(cell)
+    cells=[picker.pick(x-x_offset,y-y_offset) for x,y in zip(xs,ys)]
+    return [r for r,_ in cells],[c for _,c in cells]
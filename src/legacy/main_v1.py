@@ -9,6 +9,10 @@ from typing import List,Set,Tuple,Optional
     # 타입 힌트용 임포트
 import pygame
     # 게임 엔진
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+    # 육각 좌표 계산은 src/ 의 게임과 같은 모듈을 씀
+from hex_geometry import cell_center,hex_picker,neighbors
 
 # 게임 초기화함.
 pygame.init()
@@ -279,6 +283,8 @@ class HexGrid:
             # 셀 크기
         self.wall_offset:int=wall_offset
             # 벽 하강 오프셋
+        self.picker=hex_picker(cell_size)
+            # 픽셀 -> 셀 표 (게임 HexGrid 와 공유)
         self.map:List[List[str]]=[['.' for _ in range(cols)] for _ in range(rows)]
             # '.'으로 채워진 2차원 배열 생성
         self.bubble_list:List[Bubble]=[]
@@ -322,30 +328,15 @@ class HexGrid:
         Returns:
             Tuple[int,int]: (x,y) 중심 좌표
         """
-        # PARAMETERS: *r: row, *c: column
-        # TODO: 짝수, 홀수 행에 따라서 다른 오프셋을 적용하기.
-        # TODO: x, y 좌표 반환하기.
-
-        x=c*self.cell+self.cell//2
-        y=r*self.cell+self.cell//2+self.wall_offset
-        # 홀수 행은 오른쪽으로 반 칸 이동.
-        if r%2==1:
-            x+=self.cell//2
-        return x,y
+        # 홀수 행은 오른쪽으로 반 칸 이동 (hex_geometry.cell_center).
+        x,y=cell_center(self.cell,r,c)
+        return x,y+self.wall_offset
 
 
     # 화면 좌표를 격자 인덱스로 바꿈.
     def screen_to_grid(self,x:float,y:float)->Tuple[int,int]:
-        # TODO: 픽셀 좌표를 행, 열 인덱스로 변환하기.
-        r=int((y-self.wall_offset)//self.cell)
-        # r값이 음수 안되게 전처리
-        if r<0:
-            r=0
-        c=int(x//self.cell)
-
-        # 홀수 행은 육각형 배열이라 오른쪽으로 반칸 이동해있기 때문에 오프셋 보정하는 로직임.
-        if r%2==1:
-            c=int((x-self.cell//2)//self.cell)
+        # 중심이 가장 가까운 셀을 찾고 그리드 밖이면 가장자리로 clamp.
+        r,c=self.picker.pick(x,y-self.wall_offset)
         c=clamp(c,0,self.cols-1)
         r=clamp(r,0,self.rows-1)
         return r,c
@@ -402,18 +393,8 @@ class HexGrid:
             List[Tuple[int, int]]: 인접한 6개 셀의 (행, 열) 좌표 리스트.
                                     좌, 좌상, 우상, 우, 우하, 좌하 순서로 반환됨.
         """
-        # TODO: 짝수, 홀수 행에 따라서 다른 이웃 배열 반환하기.
-        # 짝수 행이면
-        if r%2==0:
-            dr=[0,-1,-1,0,1,1]
-                # 델타 row
-            dc=[-1,-1,0,1,0,-1]
-                # 델타 column
-        # 홀수 행이면
-        else:
-            dr=[0,-1,-1,0,1,1]
-            dc=[-1,0,1,1,1,0]
-        return [(r+dr[i],c+dc[i]) for i in range(6)]
+        # 짝수/홀수 행별 이웃 표는 hex_geometry 에 있음.
+        return neighbors(r,c)
 
 
     # 같은 색깔 버블을 DFS 탐색함.
@@ -9,6 +9,7 @@ import pygame
 
 # 메뉴 UI
 from scene_manager import SceneManager
+from hex_geometry import cell_center, hex_picker, neighbors
 from menu_scene import MenuScene
 
 # 설정 파일, 모듈들
@@ -316,6 +317,7 @@ class HexGrid:
         self.wall_offset: int = wall_offset
         self.x_offset: int = x_offset # (<-- 추가됨)
         self.y_offset: int = y_offset # (<-- 추가됨)
+        self.picker = hex_picker(cell_size)  # 게임 HexGrid 와 같은 픽셀 -> 셀 표
         self.map: List[List[str]] = [['.' for _ in range(cols)] for _ in range(rows)]
         self.bubble_list: List[Bubble] = []
 
@@ -342,25 +344,12 @@ class HexGrid:
 
     def get_cell_center(self, r: int, c: int) -> Tuple[int, int]:
         # --- 오프셋 적용 --- (<-- 수정됨)
-        x = c * self.cell + self.cell // 2 + self.x_offset
-        y = r * self.cell + self.cell // 2 + self.wall_offset + self.y_offset
-
-        if r % 2 == 1:
-            x += self.cell // 2
-        return x, y
+        x, y = cell_center(self.cell, r, c)
+        return x + self.x_offset, y + self.wall_offset + self.y_offset
 
     def screen_to_grid(self, x: float, y: float) -> Tuple[int, int]:
-        # --- 오프셋 적용 --- (<-- 수정됨)
-        r = int((y - self.wall_offset - self.y_offset) // self.cell)
-        if r < 0:
-            r = 0
-
-        c_base = x - self.x_offset
-        if r % 2 == 1:
-            c = int((c_base - self.cell // 2) // self.cell)
-        else:
-            c = int(c_base // self.cell)
-
+        # 중심이 가장 가까운 셀 (그리드 밖이면 가장자리로 clamp)
+        r, c = self.picker.pick(x - self.x_offset, y - self.wall_offset - self.y_offset)
         c = clamp(c, 0, self.cols - 1)
         r = clamp(r, 0, self.rows - 1)
         return r, c
@@ -426,13 +415,7 @@ class HexGrid:
         return 0 <= r < self.rows and 0 <= c < self.cols
 
     def get_neighbors(self, r: int, c: int) -> List[Tuple[int, int]]:
-        if r % 2 == 0:
-            dr = [0, -1, -1, 0, 1, 1]
-            dc = [-1, -1, 0, 1, 0, -1]
-        else:
-            dr = [0, -1, -1, 0, 1, 1]
-            dc = [-1, 0, 1, 1, 1, 0]
-        return [(r + dr[i], c + dc[i]) for i in range(6)]
+        return neighbors(r, c)
 
     def dfs_same_color(self, row: int, col: int, color: str, visited: Set[Tuple[int, int]]) -> None:
         stack = [(row, col)]
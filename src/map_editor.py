@@ -5,6 +5,13 @@ import os
 import math
 from typing import List, Tuple, Optional
 
+from asset_manager import assets
+from prefetch import PrefetchPlan
+from render_queue import RenderQueue
+from sprite_cache import RotationCache, surface_bytes
+from dirty_rects import DirtyRectTracker
+from hex_geometry import cell_center, hex_picker
+
 # ==========================================
 # 설정 및 상수 (config.py, asset_paths.py 연동)
 # ==========================================
@@ -15,6 +22,7 @@ try:
     )
     from asset_paths import ASSET_PATHS
     from color_settings import COLORS
+    from game_settings import IDLE_WAIT_MS
 except ImportError:
     print("설정 파일을 찾을 수 없습니다. config.py 등이 같은 폴더에 있는지 확인해주세요.")
     sys.exit()
@@ -29,6 +37,29 @@ TEXT_COLOR = (255, 255, 255) # 텍스트는 흰색이 가독성이 좋아 수정
 BTN_HOVER = (50, 100, 150)
 BTN_IDLE = (168, 212, 246)
 
+# 에디터 팔레트 코드 -> ASSET_PATHS 키
+BUBBLE_ASSET_KEYS = {
+    'R': 'bubble_red',
+    'Y': 'bubble_yellow',
+    'B': 'bubble_blue',
+    'G': 'bubble_green',
+    'N': 'bubble_obstacle'  # 장애물 버블 추가
+}
+
+def editor_image_specs():
+    """에디터 이미지: 이름 -> (ASSET_PATHS 키, 크기, alpha, smooth)."""
+    # BUBBLE_RADIUS는 config에서 이미 스케일링 되어있으므로 그대로 사용
+    target_size = BUBBLE_RADIUS * 2
+    specs = {code: (key, (target_size, target_size), True, True) for code, key in BUBBLE_ASSET_KEYS.items()}
+    specs['map_editor_logo'] = ('map_editor_logo', (int(250 * SCALE), int(142 * SCALE)), True, True)
+    specs['editor_bg'] = ('editor_bg', (SCREEN_WIDTH, SCREEN_HEIGHT), False, True)
+    specs['cannon_arrow'] = ('cannon_arrow', (int(152 * SCALE), int(317 * SCALE)), True, True)
+    return specs
+
+def editor_prefetch_plan():
+    """메뉴에 있는 동안 미리 준비할 에디터 리소스."""
+    return PrefetchPlan(images=list(editor_image_specs().values()))
+
 # ==========================================
 # 유틸리티 & UI 클래스
 # ==========================================
@@ -78,18 +109,13 @@ class DecorCannon:
         self.x = x
         self.y = y
         self.angle = 90
-        try:
-            self.arrow_image = pygame.image.load(ASSET_PATHS['cannon_arrow']).convert_alpha()
-            # 이미지 크기도 스케일에 맞춰 조정
-            w = int(152 * SCALE)
-            h = int(317 * SCALE)
-            self.arrow_image = pygame.transform.smoothscale(self.arrow_image, (w, h))
-        except:
-            self.arrow_image = None
+        # 이미지 크기도 스케일에 맞춰 조정
+        self.arrow_image = assets.image(*editor_image_specs()['cannon_arrow'])
+        self.rotation_cache = RotationCache(self.arrow_image) if self.arrow_image else None
 
     def draw(self, screen):
         if self.arrow_image:
-            rotated = pygame.transform.rotate(self.arrow_image, self.angle - 90)
+            rotated = self.rotation_cache.get(self.angle - 90)
             rect = rotated.get_rect(center=(self.x, self.y))
             screen.blit(rotated, rect)
         else:
@@ -109,22 +135,16 @@ class EditorGrid:
         self.y_offset = y_offset
         self.bubble_images = bubble_images
         self.map = [['.' for _ in range(self.cols)] for _ in range(self.rows)]
+        self.render_queue = RenderQueue()
+        self.picker = hex_picker(self.cell)  # 게임 HexGrid 와 같은 픽셀 -> 셀 표
 
     def get_cell_center(self, r, c):
-        x = c * self.cell + self.cell // 2 + self.x_offset
-        y = r * self.cell + self.cell // 2 + self.y_offset
-        if r % 2 == 1:
-            x += self.cell // 2
-        return x, y
+        x, y = cell_center(self.cell, r, c)
+        return x + self.x_offset, y + self.y_offset
 
     def screen_to_grid(self, x, y):
-        r = int((y - self.y_offset) // self.cell)
-        c_base = x - self.x_offset
-        if r % 2 == 1:
-            c = int((c_base - self.cell // 2) // self.cell)
-        else:
-            c = int(c_base // self.cell)
-        return r, c
+        """마우스 위치에서 중심이 가장 가까운 셀 (범위 검사는 호출하는 쪽에서)."""
+        return self.picker.pick(x - self.x_offset, y - self.y_offset)
 
     def is_in_bounds(self, r, c):
         return 0 <= r < self.rows and 0 <= c < self.cols
@@ -144,21 +164,23 @@ class EditorGrid:
 
                 if color_code in self.bubble_images:
                     img = self.bubble_images[color_code]
-                    rect = img.get_rect(center=(cx, cy))
-                    screen.blit(img, rect)
+                    self.render_queue.push(img, img.get_rect(center=(cx, cy)))
                 elif color_code == '.' or color_code == 'X':
                     # BUBBLE_RADIUS는 config에서 이미 스케일링 됨
                     pygame.draw.circle(screen, (30, 50, 80), (cx, cy), BUBBLE_RADIUS, 1)
 
+        # 버블 이미지는 모아서 blits 한 번으로 그림
+        self.render_queue.flush(screen)
+
 # ==========================================
 # 메인 에디터 클래스
 # ==========================================
 class MapEditor:
     def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # pygame.init()/set_mode 는 main.py 에서 한 번만 함. 씬 전환마다 창을 다시 만들지 않도록 기존 화면 사용
+        self.screen = pygame.display.get_surface() or pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Bubble Pop - Map Editor")
-        self.clock = pygame.time.Clock()
+        self.dirty = DirtyRectTracker(self.screen.get_size())
         
         # --- 폰트 (크기 스케일링 적용) ---
         self.font_path = ASSET_PATHS.get('font')
@@ -173,21 +195,13 @@ class MapEditor:
 
         # --- 이미지 에셋 로드 ---
         self.bubble_images = {}
-        # BUBBLE_RADIUS는 config에서 이미 스케일링 되어있으므로 그대로 사용
+        self.fallback_images = []  # 이미지가 없어서 직접 그린 것 (memory_bytes 용)
+        specs = editor_image_specs()
         target_size = BUBBLE_RADIUS * 2
-        color_key_map = {
-            'R': 'bubble_red', 
-            'Y': 'bubble_yellow', 
-            'B': 'bubble_blue', 
-            'G': 'bubble_green',
-            'N': 'bubble_obstacle'  # 장애물 버블 추가
-        }
-        
-        for code, asset_key in color_key_map.items():
-            path = ASSET_PATHS.get(asset_key)
-            if path and os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.smoothscale(img, (target_size, target_size))
+
+        for code in BUBBLE_ASSET_KEYS:
+            img = assets.image(*specs[code])
+            if img:
                 self.bubble_images[code] = img
             else:
                 # 장애물은 회색 원으로 표시
@@ -197,26 +211,13 @@ class MapEditor:
                 else:
                     pygame.draw.circle(surf, COLORS[code], (target_size//2, target_size//2), BUBBLE_RADIUS)
                 self.bubble_images[code] = surf
+                self.fallback_images.append(surf)
 
         # --- 로고 이미지 로드 (크기 스케일링) ---
-        self.map_editor_logo = None
-        if ASSET_PATHS.get('map_editor_logo') and os.path.exists(ASSET_PATHS['map_editor_logo']):
-            try:
-                self.map_editor_logo = pygame.image.load(ASSET_PATHS['map_editor_logo']).convert_alpha()
-                w = int(250 * SCALE)
-                h = int(142 * SCALE)
-                self.map_editor_logo = pygame.transform.smoothscale(self.map_editor_logo, (w, h))
-            except:
-                pass
+        self.map_editor_logo = assets.image(*specs['map_editor_logo'])
 
         # --- 배경 이미지 로드 (화면 크기에 맞춰 스케일링) ---
-        self.editor_bg = None
-        if ASSET_PATHS.get('editor_bg') and os.path.exists(ASSET_PATHS['editor_bg']):
-            try:
-                self.editor_bg = pygame.image.load(ASSET_PATHS['editor_bg']).convert()
-                self.editor_bg = pygame.transform.smoothscale(self.editor_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            except:
-                pass
+        self.editor_bg = assets.image(*specs['editor_bg'])
 
         # --- 게임 영역 (bg_box) 계산 ---
         # CELL_SIZE는 이미 스케일링 된 값임
@@ -255,6 +256,8 @@ class MapEditor:
 
         self.save_msg_alpha = 0
         self.running = True  # 에디터 실행 상태
+        self.quit_requested = False  # 창 닫기로 끝났는지 (ESC 면 메뉴로 돌아감)
+        self.needs_redraw = True  # 입력/애니메이션이 없으면 다시 그리지 않음
 
         self.refresh_file_list()
         self.create_ui_elements()
@@ -377,6 +380,24 @@ class MapEditor:
     def set_brush(self, color_code):
         self.selected_brush = color_code
     
+    def memory_bytes(self):
+        """에디터가 따로 만든 Surface 크기 (대체 버블 이미지, 발사대 회전 캐시). 공유 에셋은 제외."""
+        total = sum(surface_bytes(s) for s in self.fallback_images)
+        if self.cannon.rotation_cache is not None:
+            total += self.cannon.rotation_cache.used_bytes
+        return total
+
+    def resume(self):
+        """캐시된 에디터로 다시 들어올 때: 화면/입력 상태만 초기화하고 맵은 그대로 둠."""
+        pygame.display.set_caption("Bubble Pop - Map Editor")
+        self.running = True
+        self.quit_requested = False
+        self.scrollbar_dragging = False
+        self.save_msg_alpha = 0
+        self.refresh_file_list()
+        self.dirty.mark_full()
+        self.needs_redraw = True
+
     def exit_editor(self):
         """에디터 종료 (ESC 키와 동일한 효과)"""
         self.running = False
@@ -474,16 +495,32 @@ class MapEditor:
         except Exception as e:
             print(f"Delete failed: {e}")
 
+    def idle_timeout(self):
+        """입력 없이 잠들어도 되는 최대 시간 (ms). None 이면 매 프레임 돌아야 함."""
+        if self.needs_redraw:
+            # 아직 못 그린 변경 (처음 들어왔거나 resume 직후)
+            return None
+        if any(pygame.mouse.get_pressed()):
+            # 누른 채로 칠하거나 스크롤바를 끄는 중
+            return None
+        if self.save_msg_alpha > 0:
+            # "SAVED!" 페이드는 한 프레임 간격으로만 깨어남
+            return 1000 // FPS
+        return IDLE_WAIT_MS
+
     def update(self):
         if self.save_msg_alpha > 0:
+            self.needs_redraw = True
             self.save_msg_alpha -= 4
             if self.save_msg_alpha < 0:
                 self.save_msg_alpha = 0
 
-    def handle_input(self):
-        events = pygame.event.get()
+    def handle_input(self, events):
+        """SceneManager 가 넘겨 준 이번 프레임 이벤트 + 마우스 상태 처리."""
         mouse_pos = pygame.mouse.get_pos()
         mouse_pressed = pygame.mouse.get_pressed()
+        if events or any(mouse_pressed):
+            self.needs_redraw = True
 
         # 스크롤바 위치 상수도 스케일링 필요
         right_panel_margin = int(479 * SCALE)
@@ -512,8 +549,13 @@ class MapEditor:
 
         for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                # 창 닫기: 메뉴로 가지 않고 프로그램 종료
+                self.quit_requested = True
+                self.running = False
+
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 가려졌던 창이 다시 보이면 전체를 다시 올림
+                self.dirty.mark_full()
             
             # ESC 키로 에디터 종료 (메뉴로 돌아가기)
             if event.type == pygame.KEYDOWN:
@@ -574,6 +616,8 @@ class MapEditor:
         # 3. 캐논 & 그리드
         self.cannon.draw(self.screen)
         self.grid.draw(self.screen)
+        dirty = self.dirty
+        dirty.track('grid', self.game_rect, tuple(tuple(row) for row in self.grid.map))
 
         # 4. 좌측 팔레트 패널
         border_radius = int(15 * SCALE)
@@ -613,7 +657,11 @@ class MapEditor:
             e_rect_offset_y = int(80 * SCALE)
             self.screen.blit(e_txt, (self.left_panel_rect.x + e_rect_offset_x, self.left_panel_rect.y + e_rect_offset_y))
 
-        for btn in self.palette_buttons: btn.draw(self.screen, self.font_ui)
+        dirty.track('brush', self.left_panel_rect, self.selected_brush)
+
+        for i, btn in enumerate(self.palette_buttons):
+            btn.draw(self.screen, self.font_ui)
+            dirty.track(f'palette{i}', btn.rect, btn.is_hovered)
 
         # 5. 우측 패널 (SCALE 적용)
         right_panel_margin = int(479 * SCALE)
@@ -632,6 +680,9 @@ class MapEditor:
                         (right_x, right_panel_y, right_panel_width, panel_height),
                         max(1, int(15 * SCALE)), border_radius=border_radius)
 
+        dirty.track('files', (right_x, right_panel_y, right_panel_width, panel_height),
+                    (tuple(self.file_list), self.scroll_y, self.current_filename))
+
         st_title_offset_x = int(140 * SCALE)
         st_title_offset_y = int(350 * SCALE)
         st_title = self.font_title.render("STAGES", True, THEME_BORDER)
@@ -689,12 +740,15 @@ class MapEditor:
             self.scrollbar_rect = None
 
         # 6. 하단 버튼
-        for btn in self.action_buttons: btn.draw(self.screen, self.font_ui)
+        for i, btn in enumerate(self.action_buttons):
+            btn.draw(self.screen, self.font_ui)
+            dirty.track(f'action{i}', btn.rect, btn.is_hovered)
 
         # 7. 정보 텍스트
         bottom_offset = int(30 * SCALE)
         file_info = self.font_ui.render(f"EDITING: {self.current_filename}", True, (150, 150, 150))
-        self.screen.blit(file_info, file_info.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - bottom_offset)))
+        rect = self.screen.blit(file_info, file_info.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - bottom_offset)))
+        dirty.track('info', rect, self.current_filename)
 
         # 8. Saved 메시지
         if self.save_msg_alpha > 0:
@@ -710,15 +764,15 @@ class MapEditor:
 
             self.screen.blit(bg_surf, bg_rect)
             self.screen.blit(msg_surf, rect)
-
-    def run(self):
-        while self.running:
-            self.update()
-            self.handle_input()
-            self.draw_ui()
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            dirty.track('saved', bg_rect, self.save_msg_alpha)
+        else:
+            dirty.forget('saved')
 
 if __name__ == "__main__":
-    editor = MapEditor()
-    editor.run()
\ No newline at end of file
+    from editor_scene import EditorScene
+    from scene_manager import SceneManager
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # 에디터만 단독 실행: ESC 로 나가면 메뉴 대신 종료
+    SceneManager(lambda name, manager: EditorScene(manager, exit_to=None)).run('editor')
@@ -1,27 +1,31 @@
 import pygame
-import os
+from asset_manager import assets
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, SCALE
+from game_settings import IDLE_WAIT_MS
+from dirty_rects import DirtyRectTracker
+from render_queue import RenderQueue
+from prefetch import prefetcher
+from game import game_prefetch_plan
+from map_editor import editor_prefetch_plan
 
 class MenuScene:
     def __init__(self, manager):
         self.manager = manager
         self.idx = 0
         
-        # 이미지 경로 설정
-        base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images')
-        
-        # 배경 이미지 로드 및 스케일 조정
-        background_img = pygame.image.load(os.path.join(base_path, 'menu_background.png'))
-        self.background = pygame.transform.scale(background_img, (int(SCREEN_WIDTH), int(SCREEN_HEIGHT)))
+        # 배경 이미지 (AssetManager 가 캐시하므로 메뉴로 돌아올 때 다시 디코딩하지 않음)
+        self.background = assets.image('menu_background', (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False, smooth=False)
         
         # 버튼 이미지 로드 및 스케일 조정
-        button_files = ['menu_start.png', 'menu_map_editor.png', 'menu_exit.png']
-        self.button_images = []
-        for btn_file in button_files:
-            img = pygame.image.load(os.path.join(base_path, btn_file))
+        self.button_keys = ['menu_start', 'menu_map_editor', 'menu_exit']
+        entries = {}
+        for btn_key in self.button_keys:
+            w, h = assets.source_size(btn_key)
             # 버튼 이미지를 SCALE에 맞게 조정
-            scaled_img = pygame.transform.scale(img, (int(img.get_width() * SCALE), int(img.get_height() * SCALE)))
-            self.button_images.append(scaled_img)
+            entries[btn_key] = (btn_key, (w * SCALE, h * SCALE), True, False)
+        # 버튼은 한 장의 아틀라스에 묶어서 blits 한 번으로 그림
+        self.atlas = assets.atlas('menu', entries)
+        self.button_images = [self.atlas.subsurface(btn_key) for btn_key in self.button_keys]
         
         # 버튼 위치 설정 (스케일 기반)
         base_button_start_y = 600  # 기본 해상도 기준 버튼 시작 Y 위치
@@ -37,44 +41,71 @@ class MenuScene:
         # 테두리 두께도 스케일 기반으로 설정
         self.border_thickness = max(2, int(3 * SCALE))
 
-    def run(self):
-        screen = pygame.display.get_surface()
-        clock = pygame.time.Clock()
-        running = True
+    def enter(self):
+        self.screen = pygame.display.get_surface()
+        self.dirty = DirtyRectTracker(self.screen.get_size())
+        self.queue = RenderQueue()
+        self.needs_redraw = True
+
+        # 고르는 동안 게임/에디터 리소스를 워커 스레드에서 미리 읽어 둠
+        prefetcher.start(game_prefetch_plan() + editor_prefetch_plan())
+
+    def resume(self):
+        # 다른 씬이 화면 전체를 덮었으므로 첫 프레임은 전체 갱신
+        self.dirty.mark_full()
+        self.needs_redraw = True
+        prefetcher.start(game_prefetch_plan() + editor_prefetch_plan())
+
+    def idle_timeout(self):
+        # 애니메이션이 없어서 키 입력이 올 때까지 잠들어도 됨 (키오스크 대기 화면)
+        return None if self.needs_redraw else IDLE_WAIT_MS
 
-        while running:
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    return None
-                if e.type == pygame.KEYDOWN:
-                    if e.key in (pygame.K_UP, pygame.K_w):
-                        self.idx = (self.idx - 1) % len(self.button_images)
-                    elif e.key in (pygame.K_DOWN, pygame.K_s):
-                        self.idx = (self.idx + 1) % len(self.button_images)
-                    elif e.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        if self.idx == 0:
-                            return 'game'
-                        elif self.idx == 1:
-                            return 'editor'
-                        else:
-                            return None
+    def handle_events(self, events):
+        for e in events:
+            if e.type == pygame.QUIT:
+                self.manager.change_scene(None)
+                return
+            if e.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # 가려졌던 창이 다시 보이면 잠들어 있었어도 전체를 다시 올림
+                self.dirty.mark_full()
+                self.needs_redraw = True
+            if e.type == pygame.KEYDOWN:
+                self.needs_redraw = True
+                if e.key in (pygame.K_UP, pygame.K_w):
+                    self.idx = (self.idx - 1) % len(self.button_images)
+                elif e.key in (pygame.K_DOWN, pygame.K_s):
+                    self.idx = (self.idx + 1) % len(self.button_images)
+                elif e.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    if self.idx == 0:
+                        self.manager.change_scene('game')
+                    elif self.idx == 1:
+                        self.manager.change_scene('editor')
+                    else:
+                        self.manager.change_scene(None)
+                    return
 
-            # 배경 이미지 그리기
-            screen.blit(self.background, (0, 0))
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        if not self.needs_redraw:
+            return
+        self.needs_redraw = False
+        screen = self.screen
+        # 배경(레이어 0) 위에 버튼(레이어 1)을 blits 한 번으로 그리기
+        self.queue.push(self.background, (0, 0))
+        for key, rect in zip(self.button_keys, self.button_rects):
+            self.queue.push_atlas(self.atlas, key, layer=1, topleft=rect.topleft)
+        self.queue.flush(screen)
+
+        for i in range(len(self.button_images)):
+            rect = self.button_rects[i]
 
-            # 버튼 이미지 그리기
-            for i in range(len(self.button_images)):
-                img = self.button_images[i]
-                rect = self.button_rects[i]
-                
-                # 버튼 이미지 그리기
-                screen.blit(img, rect)
-                
-                # 선택된 버튼에 테두리 그리기 (스케일 기반 두께)
-                if i == self.idx:
-                    pygame.draw.rect(screen, (255, 255, 255), rect, self.border_thickness)
+            # 선택된 버튼에 테두리 그리기 (스케일 기반 두께)
+            if i == self.idx:
+                pygame.draw.rect(screen, (255, 255, 255), rect, self.border_thickness)
 
-            pygame.display.flip()
-            clock.tick(60)
+            # 선택이 바뀐 버튼만 화면에 다시 올림
+            self.dirty.track(f'button{i}', rect, i == self.idx)
 
-        return None
+        self.dirty.present()
@@ -0,0 +1,92 @@
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SCALE
+from game_settings import IDLE_WAIT_MS
+from dirty_rects import DirtyRectTracker
+from text_cache import asset_font, text_cache
+
+
+class PauseScene:
+    """게임 위에 push 되는 일시정지 오버레이.
+
+    보드는 다시 그리지 않고 push 직전 화면(manager.snapshot)을 어둡게 만들어 한 번만 깔고,
+    이후에는 선택이 바뀐 메뉴 글자 영역만 다시 그림. RESUME 은 pop 이라 게임이 그대로 이어짐.
+    """
+    OPTIONS = ('RESUME', 'MENU')
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.idx = 0
+
+    def enter(self):
+        self.screen = pygame.display.get_surface()
+        self.dirty = DirtyRectTracker(self.screen.get_size())
+
+        # 마지막 프레임 + 반투명 검정을 미리 합쳐 둠 (매 프레임 알파 블렌딩 안 하도록)
+        snapshot = self.manager.snapshot
+        if snapshot is not None:
+            self.background = snapshot.copy()
+        else:
+            self.background = pygame.Surface(self.screen.get_size())
+            self.background.fill((0, 0, 0))
+        shade = pygame.Surface(self.background.get_size())
+        shade.set_alpha(160)
+        shade.fill((0, 0, 0))
+        self.background.blit(shade, (0, 0))
+
+        title = text_cache.render(asset_font(120 * SCALE), 'PAUSED', (255, 255, 255))
+        self.background.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, int(SCREEN_HEIGHT * 0.35))))
+
+        self.font_key = asset_font(60 * SCALE)
+        self.option_rects = []
+        for i, label in enumerate(self.OPTIONS):
+            text = text_cache.render(self.font_key, label, (255, 255, 255))
+            center = (SCREEN_WIDTH // 2, int(SCREEN_HEIGHT * 0.55 + i * 90 * SCALE))
+            self.option_rects.append(text.get_rect(center=center).inflate(int(40 * SCALE), int(10 * SCALE)))
+
+        self.screen.blit(self.background, (0, 0))
+        self.dirty.mark_full()
+        self.drawn = False
+
+    def exit(self):
+        self.background = None
+
+    def idle_timeout(self):
+        # 첫 프레임을 그린 뒤로는 키 입력 말고 바뀌는 게 없어서 (창이 뒤로 가 있어도) 입력을 기다리며 잠듦
+        return IDLE_WAIT_MS if self.drawn else None
+
+    def handle_events(self, events):
+        for e in events:
+            if e.type == pygame.QUIT:
+                self.manager.change_scene(None)
+                return
+            if e.type == pygame.KEYDOWN:
+                if e.key in (pygame.K_ESCAPE, pygame.K_p):
+                    self.manager.pop_scene()
+                    return
+                if e.key in (pygame.K_UP, pygame.K_w):
+                    self.idx = (self.idx - 1) % len(self.OPTIONS)
+                elif e.key in (pygame.K_DOWN, pygame.K_s):
+                    self.idx = (self.idx + 1) % len(self.OPTIONS)
+                elif e.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    if self.OPTIONS[self.idx] == 'RESUME':
+                        self.manager.pop_scene()
+                    else:
+                        self.manager.change_scene('menu')
+                    return
+
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        for i, (label, rect) in enumerate(zip(self.OPTIONS, self.option_rects)):
+            selected = i == self.idx
+            # 글자 뒤는 미리 합쳐 둔 배경으로 복원
+            self.screen.blit(self.background, rect, rect)
+            color = (255, 255, 100) if selected else (200, 200, 200)
+            text = text_cache.render(self.font_key, label, color)
+            self.screen.blit(text, text.get_rect(center=rect.center))
+            if selected:
+                pygame.draw.rect(self.screen, color, rect, max(2, int(3 * SCALE)))
+            self.dirty.track(f'option{i}', rect, selected)
+        self.dirty.present()
+        self.drawn = True
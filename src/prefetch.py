@@ -0,0 +1,140 @@
+"""메뉴가 떠 있는 동안 게임/에디터 리소스를 미리 준비하는 워커 스레드.
+
+메뉴에서 사용자가 고르는 동안 워커가 이미지 파일 읽기/디코딩(또는 디스크 캐시 읽기),
+효과음/폰트/BGM 파일 읽기, 스테이지 CSV 파싱을 해 둠.
+display 가 필요한 convert/스케일과 폰트/효과음 객체 생성은 메인 스레드에서 처음 쓸 때 함.
+
+    prefetcher.start(game_prefetch_plan())     # MenuScene 진입 시
+    engine = GameEngine(..., stage_loader=prefetcher.stage_map)
+"""
+import copy
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from asset_manager import AssetManager, assets
+from board import load_stage_from_csv, stage_csv_path
+from text_cache import font_files
+
+StageMap = List[List[str]]
+
+
+class PrefetchPlan:
+    def __init__(self, images=(), sounds=(), streams=(), fonts=(), stages=()) -> None:
+        """
+        Args:
+            images: AssetManager.image() 인자 튜플 (키, 크기, alpha, smooth) 목록
+            sounds: 효과음 파일 경로 목록
+            streams: 미리 읽어서 OS 파일 캐시에 올려 둘 파일 (BGM 처럼 스트리밍하는 것)
+            fonts: text_cache 폰트 키 목록
+            stages: 미리 파싱할 스테이지 인덱스 목록
+        """
+        self.images = list(images)
+        self.sounds = list(sounds)
+        self.streams = list(streams)
+        self.fonts = list(fonts)
+        self.stages = list(stages)
+
+    def __add__(self, other: 'PrefetchPlan') -> 'PrefetchPlan':
+        return PrefetchPlan(self.images + other.images, self.sounds + other.sounds,
+                            self.streams + other.streams, self.fonts + other.fonts,
+                            self.stages + other.stages)
+
+
+class Prefetcher:
+    def __init__(self, manager: AssetManager = assets) -> None:
+        self.manager = manager
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stages: Dict[int, Tuple[float, StageMap, List[str]]] = {}
+            # 스테이지 인덱스 -> (CSV 수정 시각, 파싱 결과, 파싱 중 나온 메시지)
+
+    # ======== 워커 ========
+    def start(self, plan: PrefetchPlan) -> None:
+        """plan 을 워커 스레드에서 처리 시작. 이미 돌고 있으면 무시."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(plan,),
+                                        name='asset-prefetch', daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """워커가 끝날 때까지 대기. 끝났으면 True."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def stop(self) -> None:
+        """남은 작업을 건너뛰게 함 (진행 중인 파일 하나는 끝까지 읽음)."""
+        self._stop.set()
+
+    def _run(self, plan: PrefetchPlan) -> None:
+        # 스테이지와 폰트는 작고 게임 시작에 바로 필요하므로 먼저
+        for stage_index in plan.stages:
+            if self._stop.is_set():
+                return
+            self.prefetch_stage(stage_index)
+        # 폰트 객체(SDL_ttf/FreeType face) 생성은 스레드 안전하지 않아서 파일만 읽어 두고
+        # Font 는 메인 스레드의 get_font() 가 만듦
+        for path in font_files(plan.fonts):
+            if self._stop.is_set():
+                return
+            self._warm_file(path)
+        for key, size, alpha, smooth in plan.images:
+            if self._stop.is_set():
+                return
+            self.manager.prefetch(key, size, alpha, smooth)
+        # Sound 객체 생성(SDL_mixer)도 메인 스레드에서: 여기서는 파일만 읽어 둠
+        for path in plan.sounds:
+            if self._stop.is_set():
+                return
+            self.manager.prefetch_sound(path)
+        for path in plan.streams:
+            if self._stop.is_set():
+                return
+            self._warm_file(path)
+
+    @staticmethod
+    def _warm_file(path: str) -> None:
+        try:
+            with open(path, 'rb') as f:
+                while f.read(1 << 20):
+                    pass
+        except OSError:
+            pass
+
+    # ======== 스테이지 ========
+    def prefetch_stage(self, stage_index: int) -> None:
+        path = stage_csv_path(stage_index)
+        if not os.path.exists(path):
+            return
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            cached = self._stages.get(stage_index)
+        if cached is not None and cached[0] == mtime:
+            return
+        # 워커에서 바로 print 하면 메인 스레드 출력과 섞이므로 모아 뒀다가 stage_map() 에서 출력
+        messages: List[str] = []
+        stage_map = load_stage_from_csv(stage_index, log=messages.append)
+        with self._lock:
+            self._stages[stage_index] = (mtime, stage_map, messages)
+
+    def stage_map(self, stage_index: int) -> StageMap:
+        """미리 파싱해 둔 스테이지 (CSV 가 그 뒤로 바뀌었으면 다시 읽음). GameEngine stage_loader 용."""
+        path = stage_csv_path(stage_index)
+        with self._lock:
+            cached = self._stages.get(stage_index)
+        if cached is not None and os.path.exists(path) and os.path.getmtime(path) == cached[0]:
+            for message in cached[2]:
+                print(message)
+            return copy.deepcopy(cached[1])
+        return load_stage_from_csv(stage_index)
+
+
+# 메뉴/게임이 같이 쓰는 인스턴스
+prefetcher = Prefetcher()
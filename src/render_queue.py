@@ -0,0 +1,56 @@
+"""프레임 동안 blit 을 모았다가 Surface.blits 한 번으로 그리는 렌더 큐.
+
+버블 수백 개를 screen.blit 으로 하나씩 그리면 파이썬 호출 비용이 대부분이라,
+그리는 쪽은 (surface, dest, area) 만 push 하고 flush() 에서 레이어 -> 텍스처 순으로
+정렬해 한 번에 넘김. 같은 레이어 안에서는 순서가 텍스처별로 바뀔 수 있으므로
+서로 겹쳐서 순서가 중요한 것들은 레이어를 나눠서 넣어야 함.
+
+    queue = RenderQueue()
+    for b in bubbles:
+        queue.push_atlas(atlas, b.color, center=(b.x, b.y))
+    queue.flush(screen)
+"""
+from typing import List, Optional, Tuple
+
+import pygame
+
+from sprite_atlas import SpriteAtlas
+
+
+class RenderQueue:
+    def __init__(self) -> None:
+        self._items: List[Tuple[int, int, int, tuple]] = []
+            # (레이어, 텍스처 id, 넣은 순서, blits 항목)
+        self.flushed_blits = 0
+
+    def push(self, surface: pygame.Surface, dest, area: Optional[pygame.Rect] = None,
+             layer: int = 0) -> pygame.Rect:
+        """blit 하나 예약. 그려질 영역을 반환 (dest 가 좌표면 surface/area 크기 기준)."""
+        if isinstance(dest, pygame.Rect):
+            rect = pygame.Rect(dest.topleft, area.size if area is not None else surface.get_size())
+        else:
+            rect = pygame.Rect(dest, area.size if area is not None else surface.get_size())
+        self._items.append((layer, id(surface), len(self._items), (surface, rect.topleft, area)))
+        return rect
+
+    def push_atlas(self, atlas: SpriteAtlas, name: str, layer: int = 0,
+                   **position) -> pygame.Rect:
+        """아틀라스 영역 하나 예약. position 은 pygame.Rect 속성 (topleft=, center= ...)."""
+        surface, dest, area = atlas.blit_args(name, **position)
+        self._items.append((layer, id(surface), len(self._items), (surface, dest.topleft, area)))
+        return dest
+
+    def flush(self, target: pygame.Surface) -> None:
+        """모은 blit 을 레이어/텍스처 순으로 정렬해서 target 에 한 번에 그리고 비움."""
+        if not self._items:
+            return
+        self._items.sort(key=lambda item: item[:3])
+        target.blits([item[3] for item in self._items], doreturn=False)
+        self.flushed_blits += len(self._items)
+        self._items.clear()
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
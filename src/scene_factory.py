@@ -1,6 +1,7 @@
 from menu_scene import MenuScene
 from game_scene_wrapper import GameSceneWrapper
 from editor_scene import EditorScene
+from pause_scene import PauseScene
 
 def scene_factory(name,manager):
     if name=='menu':
@@ -9,4 +10,6 @@ def scene_factory(name,manager):
         return GameSceneWrapper(manager)
     if name=='editor':
         return EditorScene(manager)
+    if name=='pause':
+        return PauseScene(manager)
     raise ValueError(f'unknown scene: {name}')
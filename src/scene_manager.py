@@ -1,13 +1,239 @@
+import time
+from collections import OrderedDict
+from typing import Dict,List,Optional,Tuple
+
+import pygame
+
+from asset_manager import assets
+from config import FPS
+from game_settings import FRAME_STATS_LOG_SECONDS,IDLE_WAIT_MS,SCENE_CACHE_MAX_MB,SCENE_CACHE_SIZE
+
+class FrameStats:
+    """프레임 단계별 시간 (ms, 지수이동평균)."""
+    def __init__(self,smoothing:float=0.1)->None:
+        self.smoothing=smoothing
+        self.frames:int=0
+        self.idle_waits:int=0
+            # 이벤트 대기로 잠든 프레임 수
+        self.avg:Dict[str,float]={}
+
+    def record(self,phase:str,ms:float)->None:
+        prev=self.avg.get(phase)
+        self.avg[phase]=ms if prev is None else prev+(ms-prev)*self.smoothing
+
+    def summary(self)->str:
+        return ' '.join(f'{k}={v:.2f}ms' for k,v in self.avg.items())
+
 class SceneManager:
-    def __init__(self,scene_factory):
+    """씬 전환 관리 + 모든 씬이 같이 쓰는 메인 루프.
+
+    루프는 SceneManager 하나만 돌고, 활성 씬의 메서드를 매 프레임 호출함:
+        handle_events(events)  이번 프레임의 pygame 이벤트 목록
+        update(dt_ms)          지난 프레임 이후 흐른 시간 (ms)
+        draw()                 그리기 + 화면 반영
+    씬의 fps 속성이 있으면 그 값으로 프레임을 제한 (없으면 config.FPS).
+    씬이 idle_timeout() 을 주고 그게 ms 를 돌려주면 (할 일 없는 메뉴/에디터) 고정 FPS 로 돌지 않고
+    pygame.event.wait 로 입력이 오거나 그 시간이 지날 때까지 잠듦. None 이면 평소처럼 FPS 로 돎.
+    씬 전환은 씬 안에서 manager.change_scene(이름) 으로 요청하고, 이름이 None 이면 종료.
+
+    일시정지/배너 같은 오버레이는 push_scene(이름) 으로 현재 씬 위에 쌓고 pop_scene() 으로 걷어냄.
+    아래 씬은 그대로 살아 있고 (에셋/스테이지 다시 안 읽음) 업데이트/그리기만 멈춤.
+    push 직전 화면(마지막 프레임)을 manager.snapshot 에 복사해 두므로 오버레이는 보드를
+    다시 그리지 않고 이걸 배경으로 씀. 오버레이는 캐시하지 않고 pop 되면 exit() 으로 버림.
+        cover()   위에 오버레이가 올라와서 멈출 때
+        uncover() 오버레이가 전부 걷혀서 다시 맨 위가 됐을 때
+
+    만든 씬은 캐시해 두고 다시 돌아올 때 재사용함. 씬 생명주기 훅 (전부 선택, 없으면 건너뜀):
+        enter()   처음 만들어져서 활성화될 때 한 번
+        suspend() 다른 씬으로 넘어가면서 캐시에 남을 때
+        resume()  캐시에 있던 씬으로 다시 돌아왔을 때
+        exit()    캐시에서 빠지거나 프로그램이 끝나서 버려질 때
+    씬이 memory_bytes() 를 주면 SCENE_CACHE_MAX_MB 를 넘을 때 오래 안 쓴 씬부터 버림.
+    OS 가 메모리 부족을 알리면(APP_LOWMEMORY) 현재 씬 말고 전부 버림 (handle_memory_pressure).
+    """
+    _NO_CHANGE=object()
+
+    def __init__(self,scene_factory,max_scenes:int=SCENE_CACHE_SIZE,
+                 max_bytes:int=SCENE_CACHE_MAX_MB*1024*1024):
         self.scene_factory=scene_factory
         self.current_scene=None
+        self.current_name=None
+        self.max_scenes=max_scenes
+        self.max_bytes=max_bytes
+        self.scenes:"OrderedDict[str,object]"=OrderedDict()
+            # 이름 -> 씬 (뒤쪽이 최근에 쓴 것)
+        self.overlays:List[object]=[]
+            # current_scene 위에 쌓인 오버레이 씬 (뒤쪽이 맨 위)
+        self.snapshot:Optional[pygame.Surface]=None
+            # 마지막 push 직전 화면
+        self.clock=pygame.time.Clock()
+        self.stats=FrameStats()
+        self._pending=self._NO_CHANGE
+
+    @staticmethod
+    def _call(scene,hook:str)->None:
+        fn=getattr(scene,hook,None)
+        if fn is not None:
+            fn()
+
+    # ======== 전환 ========
+    def change_scene(self,name:Optional[str])->None:
+        """현재 프레임이 끝나면 name 씬으로 전환 (None 이면 종료). 쌓인 오버레이는 전부 걷어냄."""
+        self._pending=('change',name)
+
+    def push_scene(self,name:str)->None:
+        """현재 프레임이 끝나면 name 씬을 맨 위에 오버레이로 올림."""
+        self._pending=('push',name)
+
+    def pop_scene(self)->None:
+        """현재 프레임이 끝나면 맨 위 오버레이를 걷어내고 아래 씬을 이어서 돌림."""
+        self._pending=('pop',None)
+
+    def top_scene(self):
+        """이벤트/업데이트/그리기를 받는 맨 위 씬."""
+        return self.overlays[-1] if self.overlays else self.current_scene
+
+    def _create(self,name:str):
+        scene=self.scene_factory(name,self)
+        for method in ('handle_events','update','draw'):
+            if not hasattr(scene,method):
+                raise AttributeError(f'scene {name} has no {method}()')
+        return scene
+
+    def _push(self,name:str)->None:
+        screen=pygame.display.get_surface()
+        self.snapshot=screen.copy() if screen is not None else None
+        if not self.overlays:
+            self._call(self.current_scene,'cover')
+        scene=self._create(name)
+        self.overlays.append(scene)
+        self._call(scene,'enter')
+
+    def _pop(self)->None:
+        if not self.overlays:
+            return
+        self._call(self.overlays.pop(),'exit')
+        if not self.overlays:
+            self.snapshot=None
+            self._call(self.current_scene,'uncover')
+
+    def _clear_overlays(self)->None:
+        while self.overlays:
+            self._call(self.overlays.pop(),'exit')
+        self.snapshot=None
+
+    def activate(self,name:str):
+        """name 씬을 현재 씬으로. 캐시에 있으면 resume, 없으면 만들어서 enter."""
+        if self.current_scene is not None and self.current_name!=name:
+            self._call(self.current_scene,'suspend')
+
+        scene=self.scenes.get(name)
+        if scene is None:
+            scene=self._create(name)
+            self.scenes[name]=scene
+            self._call(scene,'enter')
+        elif name!=self.current_name:
+            self._call(scene,'resume')
+        self.scenes.move_to_end(name)
+
+        self.current_scene=scene
+        self.current_name=name
+        self.trim()
+        return scene
+
+    def scene_bytes(self)->int:
+        total=0
+        for scene in self.scenes.values():
+            fn=getattr(scene,'memory_bytes',None)
+            if fn is not None:
+                total+=fn()
+        return total
+
+    def evict(self,name:str)->None:
+        scene=self.scenes.pop(name,None)
+        if scene is not None:
+            self._call(scene,'exit')
+
+    def trim(self)->None:
+        """개수/메모리 상한을 넘으면 현재 씬을 뺀 가장 오래된 씬부터 버림."""
+        while len(self.scenes)>1 and (len(self.scenes)>self.max_scenes
+                                      or self.scene_bytes()>self.max_bytes):
+            oldest=next(iter(self.scenes))
+            if oldest==self.current_name:
+                break
+            self.evict(oldest)
+
+    def handle_memory_pressure(self)->None:
+        """메모리가 부족할 때: 현재 씬 말고 전부 버리고 에셋 원본도 놓아 줌."""
+        for name in [n for n in self.scenes if n!=self.current_name]:
+            self.evict(name)
+        assets.release_sources()
+
+    # ======== 메인 루프 ========
+    def wait_frame(self,scene)->Tuple[float,list]:
+        """다음 프레임까지 대기. (지난 프레임 이후 ms, 이벤트 목록)."""
+        fps=getattr(scene,'fps',FPS)
+        idle_timeout=getattr(scene,'idle_timeout',None)
+        timeout=idle_timeout() if idle_timeout is not None else None
+        if timeout is None:
+            return self.clock.tick(fps),pygame.event.get()
+
+        # 입력이 올 때까지 CPU 를 놓고 잠듦. 입력이 몰려도 fps 보다 자주 그리지는 않음
+        first=pygame.event.wait(max(1,min(int(timeout),IDLE_WAIT_MS)))
+        dt=self.clock.tick(fps)
+        events=pygame.event.get()
+        if first.type!=pygame.NOEVENT:
+            events.insert(0,first)
+        self.stats.idle_waits+=1
+        return dt,events
+
+    def run_frame(self,dt:float,events:Optional[list]=None)->None:
+        """맨 위 씬 한 프레임: 이벤트 -> 업데이트 -> 그리기. 전환 요청이 들어오면 그리기 생략."""
+        scene=self.top_scene()
+        stats=self.stats
+        t0=time.perf_counter()
+        scene.handle_events(pygame.event.get() if events is None else events)
+        t1=time.perf_counter()
+        if self._pending is self._NO_CHANGE:
+            scene.update(dt)
+        t2=time.perf_counter()
+        if self._pending is self._NO_CHANGE:
+            scene.draw()
+        t3=time.perf_counter()
+        stats.frames+=1
+        stats.record('events',(t1-t0)*1000)
+        stats.record('update',(t2-t1)*1000)
+        stats.record('draw',(t3-t2)*1000)
 
     def run(self,initial_scene_name):
-        scene_name=initial_scene_name
-        while scene_name is not None:
-            self.current_scene=self.scene_factory(scene_name,self)
-            if not hasattr(self.current_scene,'run'):
-                raise AttributeError(f'scene {scene_name} has no run()')
-            scene_name=self.current_scene.run()
-        # None 리턴되면 전체 게임 종료
+        self.activate(initial_scene_name)
+        last_log=time.perf_counter()
+        while self.current_scene is not None:
+            dt,events=self.wait_frame(self.top_scene())
+            if any(e.type==pygame.APP_LOWMEMORY for e in events):
+                self.handle_memory_pressure()
+            self.run_frame(dt,events)
+
+            if FRAME_STATS_LOG_SECONDS and time.perf_counter()-last_log>=FRAME_STATS_LOG_SECONDS:
+                last_log=time.perf_counter()
+                print(f'[{self.current_name}] fps={self.clock.get_fps():.1f} idle={self.stats.idle_waits} {self.stats.summary()}')
+
+            if self._pending is not self._NO_CHANGE:
+                (op,name),self._pending=self._pending,self._NO_CHANGE
+                if op=='push':
+                    self._push(name)
+                elif op=='pop':
+                    self._pop()
+                else:
+                    self._clear_overlays()
+                    if name is None:
+                        break
+                    self.activate(name)
+                # 전환에 걸린 시간이 다음 프레임 dt 로 몰리지 않게
+                self.clock.tick()
+
+        # None 으로 전환되면 전체 게임 종료
+        for name in list(self.scenes):
+            self.evict(name)
+        self.current_scene=None
+        self.current_name=None
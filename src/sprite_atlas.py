@@ -0,0 +1,94 @@
+"""작은 스프라이트 여러 장을 한 장의 Surface 로 묶는 아틀라스.
+
+버블, 아이템 아이콘, 메뉴 버튼처럼 작은 이미지를 각각 Surface 로 들고 있지 않고
+선반(shelf) 방식으로 한 장에 채워 넣은 뒤 이름 -> 영역(Rect) 인덱스로 찾아 그림.
+같은 아틀라스에서 잘라 그리는 것들은 Surface.blits 로 한 번에 넘길 수 있음.
+
+    atlas = SpriteAtlas()
+    atlas.add('R', red_bubble)
+    atlas.build()
+    atlas.blit(screen, 'R', center=(x, y))
+"""
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+
+class SpriteAtlas:
+    def __init__(self, max_width: int = 1024, padding: int = 1) -> None:
+        """
+        Args:
+            max_width: 아틀라스 최대 가로 크기 (넘으면 다음 줄로)
+            padding: 영역 사이 여백 (스케일/필터링 시 옆 스프라이트가 번지지 않게)
+        """
+        self.max_width = max_width
+        self.padding = padding
+        self._pending: Dict[str, pygame.Surface] = {}
+        self.regions: Dict[str, pygame.Rect] = {}
+        self.surface: Optional[pygame.Surface] = None
+
+    def add(self, name: str, image: pygame.Surface) -> None:
+        """build() 전에 넣을 이미지 등록."""
+        self._pending[name] = image
+
+    def build(self) -> None:
+        """등록된 이미지를 높이 순으로 선반에 채워서 한 장으로 합침."""
+        pad = self.padding
+        width = max([self.max_width] + [img.get_width() + pad * 2 for img in self._pending.values()])
+        order = sorted(self._pending, key=lambda n: self._pending[n].get_height(), reverse=True)
+
+        x = y = pad
+        shelf_h = 0
+        regions: Dict[str, pygame.Rect] = {}
+        for name in order:
+            w, h = self._pending[name].get_size()
+            if x + w + pad > width:
+                x = pad
+                y += shelf_h + pad
+                shelf_h = 0
+            regions[name] = pygame.Rect(x, y, w, h)
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+        used_w = max([r.right + pad for r in regions.values()] + [1])
+        used_h = max([r.bottom + pad for r in regions.values()] + [1])
+
+        surface = pygame.Surface((used_w, used_h), pygame.SRCALPHA)
+        for name, rect in regions.items():
+            # 빈(투명) 자리에 더하기로 넣어야 반투명 가장자리가 알파 블렌딩으로 어두워지지 않음
+            surface.blit(self._pending[name], rect, special_flags=pygame.BLEND_RGBA_ADD)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self.surface = surface
+        self.regions = regions
+        self._pending.clear()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def region(self, name: str) -> pygame.Rect:
+        return self.regions[name]
+
+    def subsurface(self, name: str) -> pygame.Surface:
+        """영역을 가리키는 subsurface (픽셀은 아틀라스와 공유)."""
+        return self.surface.subsurface(self.regions[name])
+
+    def place(self, name: str, **position) -> pygame.Rect:
+        """영역 크기의 Rect 를 position (topleft=, center= ...) 에 맞춰 반환."""
+        rect = self.regions[name].copy()
+        for attr, pos in position.items():
+            setattr(rect, attr, pos)
+        return rect
+
+    def blit_args(self, name: str, **position) -> Tuple[pygame.Surface, pygame.Rect, pygame.Rect]:
+        """Surface.blits 에 그대로 넘길 수 있는 (source, dest, area)."""
+        return self.surface, self.place(name, **position), self.regions[name]
+
+    def blit(self, screen: pygame.Surface, name: str, **position) -> pygame.Rect:
+        source, dest, area = self.blit_args(name, **position)
+        return screen.blit(source, dest, area)
+
+    def blit_many(self, screen: pygame.Surface,
+                  items: List[Tuple[str, dict]]) -> List[pygame.Rect]:
+        """[(이름, {'center': (x, y)}), ...] 를 Surface.blits 한 번으로 그림."""
+        return screen.blits([self.blit_args(name, **pos) for name, pos in items])
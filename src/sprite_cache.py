@@ -0,0 +1,73 @@
+"""회전된 스프라이트 캐시.
+
+pygame.transform.rotate 는 매 프레임 새 Surface 를 만들기 때문에, 각도를 step 단위로
+양자화해서 회전 결과를 LRU 로 재사용함. 메모리 상한(max_bytes)을 넘으면
+가장 오래 안 쓴 각도부터 버림.
+"""
+from collections import OrderedDict
+from typing import Optional
+
+import pygame
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Surface 픽셀 데이터 크기 (바이트)."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class RotationCache:
+    def __init__(self, image: pygame.Surface, step: float = 1.0,
+                 max_bytes: int = 16 * 1024 * 1024) -> None:
+        """
+        Args:
+            image: 회전할 원본 이미지 (0도 기준)
+            step: 각도 양자화 단위 (도). 작을수록 부드럽고 메모리를 더 씀
+            max_bytes: 캐시에 들고 있을 회전 결과의 최대 크기
+        """
+        self.image = image
+        self.step = step
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._cache: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, angle: float) -> int:
+        return int(round(angle / self.step))
+
+    def get(self, angle: float) -> pygame.Surface:
+        """angle(도) 에 가장 가까운 양자화 각도로 회전된 이미지."""
+        key = self._key(angle)
+        rotated: Optional[pygame.Surface] = self._cache.get(key)
+        if rotated is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return rotated
+
+        self.misses += 1
+        if key == 0:
+            rotated = self.image
+        else:
+            rotated = pygame.transform.rotate(self.image, key * self.step)
+        self._cache[key] = rotated
+        self.used_bytes += surface_bytes(rotated)
+        self._evict()
+        return rotated
+
+    def prerender(self, min_angle: float, max_angle: float) -> None:
+        """min_angle~max_angle 범위를 미리 회전해 둠 (메모리 상한 안에서)."""
+        for key in range(self._key(min_angle), self._key(max_angle) + 1):
+            self.get(key * self.step)
+
+    def _evict(self) -> None:
+        # 방금 넣은 하나는 항상 남김
+        while self.used_bytes > self.max_bytes and len(self._cache) > 1:
+            _, old = self._cache.popitem(last=False)
+            self.used_bytes -= surface_bytes(old)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,130 @@
+"""폰트 레지스트리 + 텍스트 Surface 캐시.
+
+같은 크기의 폰트를 매 프레임 새로 만들거나, 안 바뀐 글자를 매 프레임 다시 렌더링하지 않도록
+폰트는 (종류, 이름/경로, 크기) 로 한 번만 만들고 렌더링 결과는 (폰트, 문자열, 색) 기준 LRU 로 재사용함.
+점수/개수처럼 자주 바뀌는 숫자는 캐시를 채우지 않게 DigitStrip 의 숫자 글리프를 이어 붙여 그림.
+
+    key = asset_font(40)
+    screen.blit(text_cache.render(key, 'NEXT', (0, 0, 0)), pos)
+    digit_strip(key, (0, 0, 0)).blit(screen, score, topleft=pos)
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from asset_paths import ASSET_PATHS
+from game_settings import TEXT_CACHE_MAX_ENTRIES
+
+# ('file', 경로, 크기) 또는 ('sys', 시스템 폰트 이름, 크기)
+FontKey = Tuple[str, Optional[str], int]
+Color = Tuple[int, ...]
+
+_fonts: Dict[FontKey, pygame.font.Font] = {}
+
+
+def asset_font(size: float, path: Optional[str] = None) -> FontKey:
+    """폰트 파일 키. path 를 안 주면 ASSET_PATHS['font'] (None 이면 pygame 기본 폰트)."""
+    return ('file', path if path is not None else ASSET_PATHS.get('font'), int(size))
+
+
+def sys_font(name: str, size: float) -> FontKey:
+    return ('sys', name, int(size))
+
+
+def get_font(key: FontKey) -> pygame.font.Font:
+    """키에 해당하는 폰트. 처음 요청될 때 한 번만 로드하고, 실패하면 기본 폰트로 대체."""
+    font = _fonts.get(key)
+    if font is None:
+        kind, name, size = key
+        try:
+            if kind == 'sys':
+                font = pygame.font.SysFont(name, size)
+            else:
+                font = pygame.font.Font(name, size)
+        except (pygame.error, OSError) as e:
+            print(f"폰트 로드 실패: {name} - {e}. 기본 폰트로 대체합니다.")
+            font = pygame.font.Font(None, size)
+        _fonts[key] = font
+    return font
+
+
+def font_files(keys) -> List[str]:
+    """폰트 키들이 읽는 폰트 파일 경로 (중복/기본 폰트/시스템 폰트 제외)."""
+    paths = []
+    for kind, name, _ in keys:
+        if kind == 'file' and name is not None and name not in paths:
+            paths.append(name)
+    return paths
+
+
+class TextCache:
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, key: FontKey, text: str, color: Color,
+               antialias: bool = True) -> pygame.Surface:
+        cache_key = (key, text, tuple(color), antialias)
+        surf = self._cache.get(cache_key)
+        if surf is not None:
+            self._cache.move_to_end(cache_key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = get_font(key).render(text, antialias, color)
+        self._cache[cache_key] = surf
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class DigitStrip:
+    """0~9 글리프를 미리 렌더링해 두고 숫자를 이어 붙여 그림."""
+    def __init__(self, key: FontKey, color: Color, chars: str = '0123456789-') -> None:
+        font = get_font(key)
+        self.glyphs: Dict[str, pygame.Surface] = {ch: font.render(ch, True, color) for ch in chars}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def size(self, value) -> Tuple[int, int]:
+        return sum(self.glyphs[ch].get_width() for ch in str(value)), self.height
+
+    def blit(self, screen: pygame.Surface, value, **position) -> pygame.Rect:
+        """value 를 그림. position 은 pygame.Rect 속성 (topleft=, center=, bottomright= ...).
+
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        text = str(value)
+        rect = pygame.Rect((0, 0), self.size(text))
+        for attr, pos in position.items():
+            setattr(rect, attr, pos)
+        x = rect.x
+        for ch in text:
+            glyph = self.glyphs[ch]
+            screen.blit(glyph, (x, rect.y))
+            x += glyph.get_width()
+        return rect
+
+
+_strips: Dict[Tuple[FontKey, Color], DigitStrip] = {}
+
+
+def digit_strip(key: FontKey, color: Color) -> DigitStrip:
+    strip = _strips.get((key, tuple(color)))
+    if strip is None:
+        strip = _strips[(key, tuple(color))] = DigitStrip(key, color)
+    return strip
+
+
+# 게임 전체에서 같이 쓰는 캐시
+text_cache = TextCache()
@@ -0,0 +1,69 @@
+"""이름 붙은 시간 상태(배너, 전환 연출)를 메인 루프 안에서 차례로 진행하는 타임라인.
+
+pygame.time.delay 로 프로세스를 멈추는 대신 단계마다 길이(ms)를 정해 두고
+매 프레임 update(dt) 로 시간을 흘려보냄. 단계가 시작될 때 on_start, 끝나면 on_end 콜백을 부르고 다음 단계로 넘어감.
+그동안에도 SceneManager 루프가 계속 돌아서 이벤트가 처리되고 창이 멈춘 것으로 보이지 않음.
+
+    timeline = Timeline()
+    timeline.add('stage_clear', 1000, on_end=resume_play)
+    timeline.add('end', 300, on_start=stop_music, on_end=finish)
+    ...
+    timeline.update(dt)        # 매 프레임
+    if timeline.current == 'stage_clear': ...
+"""
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+class Timeline:
+    def __init__(self) -> None:
+        self._steps: Deque[Tuple[str, float, Optional[Callable[[], None]],
+                                 Optional[Callable[[], None]]]] = deque()
+            # (이름, 길이 ms, 시작할 때 콜백, 끝날 때 콜백)
+        self.elapsed = 0.0
+            # 현재 단계에서 흐른 시간 (ms)
+
+    def add(self, name: str, duration_ms: float,
+            on_end: Optional[Callable[[], None]] = None,
+            on_start: Optional[Callable[[], None]] = None) -> None:
+        """단계 하나를 맨 뒤에 추가. 앞 단계가 없으면 바로 시작됨 (on_start 도 바로 불림)."""
+        self._steps.append((name, float(duration_ms), on_start, on_end))
+        if len(self._steps) == 1 and on_start is not None:
+            on_start()
+
+    @property
+    def current(self) -> Optional[str]:
+        """진행 중인 단계 이름 (없으면 None)."""
+        return self._steps[0][0] if self._steps else None
+
+    def progress(self) -> float:
+        """현재 단계 진행 비율 (0.0~1.0)."""
+        if not self._steps:
+            return 1.0
+        duration = self._steps[0][1]
+        return min(1.0, self.elapsed / duration) if duration > 0 else 1.0
+
+    def update(self, dt_ms: float) -> None:
+        """dt_ms 만큼 진행. 한 프레임이 길어서 여러 단계가 끝나면 콜백도 순서대로 다 부름."""
+        if not self._steps:
+            return
+        self.elapsed += dt_ms
+        while self._steps and self.elapsed >= self._steps[0][1]:
+            name, duration, _, on_end = self._steps.popleft()
+            self.elapsed -= duration
+            if on_end is not None:
+                on_end()
+            if self._steps and self._steps[0][2] is not None:
+                self._steps[0][2]()
+        if not self._steps:
+            self.elapsed = 0.0
+
+    def clear(self) -> None:
+        self._steps.clear()
+        self.elapsed = 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self._steps)
+
+    def __len__(self) -> int:
+        return len(self._steps)
@@ -0,0 +1,178 @@
+"""발사된 버블의 전체 경로를 한 번에 계산하는 레이캐스트 솔버.
+
+프레임마다 BUBBLE_SPEED 만큼 움직이면서 충돌을 검사하는 대신, 발사 순간에
+좌우 벽 반사를 포함한 경로와 첫 접촉 지점, 붙을 셀을 해석적으로 구함.
+이후 프레임은 ShotPath.position_at() 으로 경로를 따라 그리기만 하면 되므로
+속도/프레임레이트와 상관없이 같은 결과가 나오고 빠른 속도에서도 뚫고 지나가지 않음.
+"""
+import math
+from typing import List,Optional,Tuple
+
+from config import BUBBLE_RADIUS
+from color_settings import COLORS
+from board import HexGrid,wall_bounds
+
+# 반사 횟수 상한 (거의 수평으로 쏴도 무한 루프 방지)
+MAX_BOUNCES:int=256
+
+class ShotSegment:
+    def __init__(self,x:float,y:float,dx:float,dy:float,length:float)->None:
+        self.x=x
+        self.y=y
+        self.dx=dx
+        self.dy=dy
+        self.length=length
+
+    def point_at(self,t:float)->Tuple[float,float]:
+        return self.x+self.dx*t,self.y+self.dy*t
+
+class ShotPath:
+    """반사 지점으로 나눈 직선 구간 목록 + 접촉 결과."""
+    def __init__(self,segments:List[ShotSegment],hit_ceiling:bool,
+                 attach_cell:Tuple[int,int])->None:
+        self.segments=segments
+        self.hit_ceiling=hit_ceiling
+        self.attach_cell=attach_cell
+        self.length=sum(seg.length for seg in segments)
+
+    @property
+    def contact(self)->Tuple[float,float]:
+        last=self.segments[-1]
+        return last.point_at(last.length)
+
+    def _locate(self,distance:float)->Tuple[ShotSegment,float]:
+        distance=max(0.0,min(distance,self.length))
+        for seg in self.segments:
+            if distance<=seg.length:
+                return seg,distance
+            distance-=seg.length
+        last=self.segments[-1]
+        return last,last.length
+
+    def position_at(self,distance:float)->Tuple[float,float]:
+        seg,t=self._locate(distance)
+        return seg.point_at(t)
+
+    def angle_at(self,distance:float)->float:
+        seg,_=self._locate(distance)
+        return math.degrees(math.atan2(-seg.dy,seg.dx))
+
+def _first_contact(x:float,y:float,dx:float,dy:float,max_t:float,
+                   centers:List[Tuple[int,int]],reach:float)->Optional[float]:
+    """(x,y)+t*(dx,dy) 가 centers 중 하나와 reach 거리 안에 처음 들어오는 t."""
+    best=None
+    reach_sq=reach*reach
+    for cx,cy in centers:
+        ox=x-cx
+        oy=y-cy
+        c=ox*ox+oy*oy-reach_sq
+        if c<=0:
+            # 출발점부터 이미 닿아 있음
+            return 0.0
+        b=ox*dx+oy*dy
+        if b>=0:
+            # 멀어지는 방향
+            continue
+        disc=b*b-c
+        if disc<0:
+            continue
+        t=-b-math.sqrt(disc)
+        if t<=max_t and (best is None or t<best):
+            best=t
+    return best
+
+def _first_contact_rows(x:float,y:float,dx:float,dy:float,max_t:float,
+                        row_centers:List[List[Tuple[int,int]]],row0_y:float,
+                        cell:int,reach:float)->Optional[float]:
+    """_first_contact 를 구간이 지나는 행에만 적용. 진행 방향 순서로 행을 보다가
+    더 먼 행에서는 이미 찾은 접촉보다 일찍 닿을 수 없으면 멈춤."""
+    rows=len(row_centers)
+    if math.isinf(max_t) or dy==0:
+        r_lo,r_hi=0,rows-1
+    else:
+        y_end=y+dy*max_t
+        r_lo=max(0,math.ceil((min(y,y_end)-reach-row0_y)/cell))
+        r_hi=min(rows-1,math.floor((max(y,y_end)+reach-row0_y)/cell))
+    order=range(r_hi,r_lo-1,-1) if dy<0 else range(r_lo,r_hi+1)
+    best=None
+    for r in order:
+        centers=row_centers[r]
+        if not centers:
+            continue
+        if best is not None and dy!=0:
+            # 이 행 중심에서 reach 안쪽 y 에 처음 들어오는 t
+            edge=row0_y+r*cell+(reach if dy<0 else -reach)
+            if (edge-y)/dy>best:
+                break
+        t=_first_contact(x,y,dx,dy,max_t,centers,reach)
+        if t is not None and (best is None or t<best):
+            best=t
+            if best==0.0:
+                break
+    return best
+
+def solve_shot(grid:HexGrid,x:float,y:float,angle_degree:float,
+               radius:int=BUBBLE_RADIUS)->ShotPath:
+    """발사 위치/각도와 현재 그리드로 경로, 첫 접촉 지점, 붙을 셀을 계산.
+
+    Args:
+        grid: 현재 그리드 (버블/장애물 배치, wall_offset 반영)
+        x, y: 발사 시작 좌표
+        angle_degree: 발사 각도 (도, 90=위쪽)
+        radius: 발사하는 버블 반지름
+
+    Returns:
+        ShotPath: 경로와 접촉 결과
+    """
+    x_start,x_end=wall_bounds()
+    x_min=x_start+radius
+    x_max=x_end-radius
+    ceiling=grid.y_offset+grid.wall_offset+radius
+    reach=radius+BUBBLE_RADIUS-2
+
+    # 행별로 점유 셀 중심을 모아 두고, 구간마다 y 범위(+reach)에 걸치는 행만 검사
+    row_centers:List[List[Tuple[int,int]]]=[
+        [grid.get_cell_center(r,c) for c in range(grid.cols)
+         if grid.map[r][c] in COLORS or grid.map[r][c]=='N']
+        for r in range(grid.rows)
+    ]
+    row0_y=grid.get_cell_center(0,0)[1]
+
+    rad=math.radians(angle_degree)
+    dx=math.cos(rad)
+    dy=-math.sin(rad)
+    x=min(max(x,x_min),x_max)
+
+    segments:List[ShotSegment]=[]
+    hit_ceiling=False
+    for _ in range(MAX_BOUNCES):
+        # 천장/벽까지 남은 거리
+        t_ceiling=(ceiling-y)/dy if dy<0 else math.inf
+        if dx>1e-12:
+            t_wall=(x_max-x)/dx
+        elif dx<-1e-12:
+            t_wall=(x_min-x)/dx
+        else:
+            t_wall=math.inf
+        t_end=max(0.0,min(t_ceiling,t_wall))
+
+        t_hit=_first_contact_rows(x,y,dx,dy,t_end,row_centers,row0_y,grid.cell,reach)
+        if t_hit is not None:
+            segments.append(ShotSegment(x,y,dx,dy,t_hit))
+            break
+        segments.append(ShotSegment(x,y,dx,dy,t_end))
+        if t_ceiling<=t_wall or t_end==math.inf:
+            hit_ceiling=True
+            break
+        # 벽 반사
+        x,y=x+dx*t_end,y+dy*t_end
+        dx=-dx
+    else:
+        hit_ceiling=True
+
+    last=segments[-1]
+    cx,cy=last.point_at(last.length)
+    r,c=grid.nearest_grid_to_point(cx,cy)
+    if hit_ceiling:
+        r=0
+    return ShotPath(segments,hit_ceiling,(r,c))